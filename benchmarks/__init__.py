@@ -0,0 +1 @@
+# SPDX-License-Identifier: MPL-2.0
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+Child process for :mod:`benchmarks.startup`.
+
+Runs :func:`netimate.composition.composition_root` with a stage callback and
+prints the wall time of each stage (in milliseconds) as a single JSON line on
+stdout, so the benchmark always times the real wiring.  Kept free of heavy
+imports so that, when run under ``python -X importtime``, the import profile
+reflects netimate itself.
+"""
+
+import json
+import time
+from typing import Dict
+
+_stages: Dict[str, float] = {}
+_start = time.perf_counter()
+_last = _start
+
+
+def _stage(name):
+    global _last
+    now = time.perf_counter()
+    _stages[name] = (now - _last) * 1000
+    _last = now
+
+
+def main():
+    from netimate.composition import composition_root
+
+    _stage("import")
+    app = composition_root(on_stage=_stage)
+
+    # What a one-shot CLI call does next: resolve one command and one protocol.
+    registry = app._registry  # pylint: disable=protected-access
+    registry.get_device_command("echo-test")
+    registry.get_protocol("fake-async")
+    _stage("first_lookup")
+
+    _stages["total"] = (time.perf_counter() - _start) * 1000
+    print(json.dumps(_stages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+benchmarks.diff
+---------------
+Snapshot diff benchmark: :mod:`difflib` against netimate's diff engine
+(:mod:`netimate.infrastructure.snapshot_store.diff`) on large configs.
+
+By default it generates IOS‑style configs of the requested sizes, made up of
+interfaces, a BGP section, a large extended ACL and a prefix‑list.  Each one
+is then edited in one of these ways:
+
+* ``scattered`` – 1 % of the lines changed at random positions;
+* ``acl-block`` – a block of 500 ACL entries replaced and 200 inserted;
+* ``repeated`` – 5 % more ``shutdown`` / ``!`` lines, the repeated lines
+  that defeat difflib's longest‑match search;
+* ``rewrite`` – the ACL fully rewritten (nothing in common).
+
+Pass ``--files OLD NEW`` to time two real saved configs instead.  Reported
+per case: median wall time over ``--runs`` for ``difflib.unified_diff``,
+netimate's ``unified_diff`` and ``hierarchical_diff``, the speed‑up, and
+the number of diff lines each produced.  ``--difflib-timeout`` skips further
+difflib runs of a case once one run exceeds it::
+
+    python -m benchmarks.diff --lines 5000 20000 50000 --runs 3 --output diff.json
+    python -m benchmarks.diff --files old.cfg new.cfg
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import platform
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from netimate.infrastructure.snapshot_store.diff import hierarchical_diff, unified_diff
+
+CASES = ["scattered", "acl-block", "repeated", "rewrite"]
+
+
+def _acl(rng: random.Random, count: int) -> List[str]:
+    return [
+        f" {10 * (i + 1)} permit tcp 10.{rng.randrange(256)}.{rng.randrange(256)}.0 0.0.0.255"
+        f" host 192.0.2.{rng.randrange(1, 255)} eq {rng.randrange(1, 65536)}"
+        for i in range(count)
+    ]
+
+
+def _config(rng: random.Random, lines: int) -> Tuple[List[str], int, int]:
+    """Return ``(config, acl start, acl end)`` with roughly *lines* lines."""
+    out = ["version 17.9", "hostname bench-r1", "!"]
+    for i in range(lines // 20):
+        out += [
+            f"interface GigabitEthernet1/0/{i}",
+            f" description access port {i}",
+            " switchport mode access",
+            f" switchport access vlan {10 + i % 50}",
+            " shutdown" if i % 7 == 0 else " no shutdown",
+            "!",
+        ]
+    out += ["router bgp 65000", " bgp log-neighbor-changes", " address-family ipv4"]
+    out += [f"  network 10.{i // 256}.{i % 256}.0 mask 255.255.255.0" for i in range(lines // 20)]
+    out += [" exit-address-family", "!", "ip access-list extended EDGE-IN"]
+    acl_start = len(out)
+    remaining = max(0, lines - len(out) - 2)
+    out += _acl(rng, remaining * 3 // 4)
+    acl_end = len(out)
+    out += ["!"]
+    out += [
+        f"ip prefix-list CUSTOMERS seq {5 * (i + 1)} permit 172.{16 + i % 16}.{i % 256}.0/24"
+        for i in range(lines - len(out) - 1)
+    ]
+    out += ["end"]
+    return out, acl_start, acl_end
+
+
+def _edit(
+    rng: random.Random, case: str, config: List[str], acl_start: int, acl_end: int
+) -> List[str]:
+    new = list(config)
+    if case == "scattered":
+        for pos in rng.sample(range(len(new)), len(new) // 100):
+            new[pos] = new[pos] + " "
+    elif case == "acl-block":
+        mid = (acl_start + acl_end) // 2
+        new[mid : mid + 500] = _acl(rng, 500)
+        new[acl_start + 10 : acl_start + 10] = _acl(rng, 200)
+    elif case == "repeated":
+        for _ in range(len(new) // 20):
+            new.insert(rng.randrange(len(new)), rng.choice([" shutdown", "!"]))
+    elif case == "rewrite":
+        new[acl_start:acl_end] = _acl(rng, acl_end - acl_start)
+    return new
+
+
+def _time(fn: Callable[[], List[str]], runs: int, timeout: Optional[float]) -> Dict[str, Any]:
+    samples: List[float] = []
+    lines = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        lines = len(fn())
+        samples.append(time.perf_counter() - started)
+        if timeout is not None and samples[-1] > timeout:
+            break
+    return {"median_s": round(statistics.median(samples), 4), "runs": len(samples), "lines": lines}
+
+
+def _bench(
+    name: str, old: Sequence[str], new: Sequence[str], runs: int, timeout: Optional[float]
+) -> Dict[str, Any]:
+    timings = {
+        "difflib": _time(
+            lambda: list(difflib.unified_diff(old, new, "old", "new", lineterm="")), runs, timeout
+        ),
+        "netimate": _time(lambda: unified_diff(old, new, "old", "new"), runs, None),
+        "hierarchical": _time(lambda: hierarchical_diff(old, new, "old", "new"), runs, None),
+    }
+    speedup = timings["difflib"]["median_s"] / max(timings["netimate"]["median_s"], 1e-9)
+    return {"case": name, "lines": len(old), **timings, "speedup": round(speedup, 1)}
+
+
+def _print_row(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['case']:<14}{result['lines']:>8}"
+        f"{result['difflib']['median_s']:>11.3f}s{result['netimate']['median_s']:>11.3f}s"
+        f"{result['hierarchical']['median_s']:>11.3f}s{result['speedup']:>9.1f}x"
+        f"{result['difflib']['lines']:>9}{result['netimate']['lines']:>9}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="netimate snapshot diff benchmark")
+    parser.add_argument("--lines", type=int, nargs="+", default=[5000, 20000, 50000])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--files", type=Path, nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--difflib-timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'case':<14}{'lines':>8}{'difflib':>12}{'netimate':>12}{'hierarch.':>12}"
+        f"{'speedup':>10}{'diff ln':>9}{'ours ln':>9}"
+    )
+    results = []
+    if args.files:
+        old_path, new_path = args.files
+        old = old_path.read_text().splitlines()
+        new = new_path.read_text().splitlines()
+        results.append(_bench(new_path.name, old, new, args.runs, args.difflib_timeout))
+        _print_row(results[-1])
+    else:
+        for lines in args.lines:
+            for case in args.cases:
+                rng = random.Random(args.seed)
+                old, acl_start, acl_end = _config(rng, lines)
+                new = _edit(rng, case, old, acl_start, acl_end)
+                results.append(_bench(case, old, new, args.runs, args.difflib_timeout))
+                _print_row(results[-1])
+
+    if args.output:
+        report = {
+            "benchmark": "diff",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "results": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+benchmarks.fleet
+----------------
+Fleet‑scale benchmark for ``Runner`` / ``CommandExecutorService`` and the
+template provider, driven by the simulated devices in
+:mod:`benchmarks.simulated`.
+
+Each fleet size runs in its own interpreter (so peak RSS is per scenario)
+through the real stack: plugin registry, scheduler, connection pool, parse
+executor and TextFSM templates.  Reported per scenario:
+
+* throughput (devices per second) and wall time
+* p50 / p99 / max per‑device latency – from the device's first connect to its
+  result reaching the caller (``command`` mode) or to its last command
+  returning (``diagnostic`` mode)
+* event‑loop lag – how late a 10 ms ticker wakes up while the fan‑out runs
+* peak RSS and the number of injected failures
+
+Example::
+
+    python -m benchmarks.fleet --devices 1000 10000 50000 --concurrency 200 \\
+        --connect-latency lognormal:median=0.2,sigma=0.6 \\
+        --command-latency uniform:low=0.05,high=0.4 \\
+        --failure-rate 0.01 --output-scale 20 --output fleet.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LAG_INTERVAL = 0.01
+DIAGNOSTIC_COMMANDS = [
+    "show-version",
+    "show-environment",
+    "show-ip-interface-brief",
+    "show-processes-cpu",
+    "show-memory-stats",
+]
+
+
+def _latency_spec(text: str) -> Dict[str, Any]:
+    """Parse ``"lognormal:median=0.2,sigma=0.5"`` (or a bare number) into a spec."""
+    try:
+        return {"distribution": "fixed", "value": float(text)}
+    except ValueError:
+        pass
+    distribution, _, params = text.partition(":")
+    spec: Dict[str, Any] = {"distribution": distribution}
+    for pair in filter(None, params.split(",")):
+        key, _, value = pair.partition("=")
+        spec[key.strip()] = float(value)
+    return spec
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _lag_monitor(samples: List[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def _run_scenario(config: Dict[str, Any]) -> Dict[str, Any]:
+    from benchmarks.simulated import SimulatedProtocol, SimulatedRepository
+    from netimate.application.command_executor_service import CommandExecutorService
+    from netimate.core.plugin_engine.plugin_registry import PluginKind, PluginRegistry
+    from netimate.core.plugin_engine.registrar import PluginRegistrar
+    from netimate.core.runner import Runner
+    from netimate.infrastructure.settings import SettingsImpl
+    from netimate.infrastructure.template_provider.filesystem import FileSystemTemplateProvider
+    from netimate.infrastructure.template_provider.parse_executor import ParseExecutor
+    from netimate.interfaces.plugin.device_command import DeviceCommand
+
+    SimulatedProtocol.reset(config["seed"])
+    registry = PluginRegistry()
+    PluginRegistrar(registry).register_plugins(
+        PluginKind.DEVICE_COMMAND, "netimate.plugins.device_commands", DeviceCommand
+    )
+    registry.register_protocol("simulated", SimulatedProtocol)
+    registry.register_device_repository("simulated-inventory", SimulatedRepository)
+
+    inventory = {"devices": config["devices"], "sites": config["sites"]}
+    settings = SettingsImpl(
+        device_repo="simulated-inventory",
+        log_level="off",
+        template_paths=[],
+        plugin_configs={"simulated": config["protocol"], "simulated-inventory": inventory},
+        runner_config={"max_concurrency": config["concurrency"]},
+        parsing_config=config["parsing"],
+    )
+    provider = FileSystemTemplateProvider(
+        settings.template_paths, ParseExecutor.from_config(settings.parsing_config)
+    )
+    runner = Runner(settings.plugin_configs, settings.runner_config)
+    service = CommandExecutorService(registry, settings, provider, runner)
+    names = [device.name for device in SimulatedRepository(inventory).list_devices()]
+
+    lag: List[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(_lag_monitor(lag, stop))
+    latencies: List[float] = []
+    started = time.perf_counter()
+    try:
+        if config["mode"] == "diagnostic":
+            await service.run_many(names, DIAGNOSTIC_COMMANDS)
+            finished = SimulatedProtocol.session_finished
+            latencies = [
+                finished[name] - begin
+                for name, begin in SimulatedProtocol.session_started.items()
+                if name in finished
+            ]
+        else:
+            async for name, _ in service.stream(names, config["command"]):
+                begin = SimulatedProtocol.session_started.get(name)
+                if begin is not None:
+                    latencies.append(time.perf_counter() - begin)
+        elapsed = time.perf_counter() - started
+    finally:
+        stop.set()
+        await monitor
+        await runner.close()
+        provider.close()
+
+    return {
+        "devices": config["devices"],
+        "mode": config["mode"],
+        "concurrency": config["concurrency"],
+        "elapsed_s": round(elapsed, 3),
+        "throughput_dps": round(config["devices"] / elapsed, 1),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 1),
+            "p99": round(_percentile(latencies, 99) * 1000, 1),
+            "max": round(max(latencies, default=0.0) * 1000, 1),
+        },
+        "loop_lag_ms": {
+            "p50": round(_percentile(lag, 50) * 1000, 2),
+            "p99": round(_percentile(lag, 99) * 1000, 2),
+            "max": round(max(lag, default=0.0) * 1000, 2),
+        },
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "injected_failures": SimulatedProtocol.injected_failures,
+    }
+
+
+def _run_child(config: Dict[str, Any]) -> Dict[str, Any]:
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.getenv("PYTHONPATH")])),
+    )
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.fleet", "--child", json.dumps(config)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"fleet scenario failed:\n{proc.stderr[-4000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _print_row(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['devices']:>8} {result['mode']:<11}{result['elapsed_s']:>9.2f}s"
+        f"{result['throughput_dps']:>10.0f}/s"
+        f"{result['latency_ms']['p50']:>10.0f}{result['latency_ms']['p99']:>10.0f}"
+        f"{result['loop_lag_ms']['p99']:>10.1f}{result['peak_rss_mb']:>10.0f}"
+        f"{result['injected_failures']:>8}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="netimate fleet-scale runner benchmark")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--devices", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--mode", choices=["command", "diagnostic"], default="command")
+    parser.add_argument("--command", default="show-logging", help="command for 'command' mode")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--sites", type=int, default=10)
+    parser.add_argument("--connect-latency", default="lognormal:median=0.05,sigma=0.5")
+    parser.add_argument("--command-latency", default="uniform:low=0.01,high=0.05")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="connect failure rate")
+    parser.add_argument("--command-failure-rate", type=float, default=0.0)
+    parser.add_argument("--output-scale", type=int, default=1, help="repeat recorded outputs")
+    parser.add_argument("--parse-executor", default="process", help="process | thread | inline")
+    parser.add_argument("--parse-workers", type=int)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(asyncio.run(_run_scenario(json.loads(args.child)))))
+        return
+
+    base = {
+        "mode": args.mode,
+        "command": args.command,
+        "concurrency": args.concurrency,
+        "sites": args.sites,
+        "seed": args.seed,
+        "protocol": {
+            "connect_latency": _latency_spec(args.connect_latency),
+            "command_latency": _latency_spec(args.command_latency),
+            "connect_failure_rate": args.failure_rate,
+            "command_failure_rate": args.command_failure_rate,
+            "output_scale": args.output_scale,
+        },
+        "parsing": {"executor": args.parse_executor, "workers": args.parse_workers},
+    }
+    if args.parse_workers is None:
+        del base["parsing"]["workers"]
+
+    print(
+        f"{'devices':>8} {'mode':<11}{'wall':>10}{'throughput':>12}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'lag p99':>10}{'RSS MB':>10}{'failed':>8}"
+    )
+    results = []
+    for devices in args.devices:
+        result = _run_child({**base, "devices": devices})
+        _print_row(result)
+        results.append(result)
+
+    if args.output:
+        report = {
+            "benchmark": "fleet",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "config": base,
+            "results": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+benchmarks.simulated
+--------------------
+Simulated devices for the fleet benchmark.
+
+:class:`SimulatedProtocol` is a :class:`ConnectionProtocol` that never opens a
+socket: it sleeps for a latency drawn from a configurable distribution, fails
+at a configurable rate and answers ``show`` commands with recorded outputs
+(from ``tests/outputs.py``), optionally repeated to scale the output size.
+:class:`SimulatedRepository` serves an in‑memory inventory of N devices.
+
+Both read their behaviour from ``plugin_configs`` like real plugins, e.g.::
+
+    plugin_configs:
+      simulated:
+        connect_latency: {distribution: lognormal, median: 0.2, sigma: 0.5}
+        command_latency: {distribution: uniform, low: 0.05, high: 0.3}
+        connect_failure_rate: 0.01
+        command_failure_rate: 0.001
+        output_scale: 10
+        seed: 7
+      simulated-inventory:
+        devices: 10000
+        sites: 50
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+from netimate.errors import ConnectionProtocolError
+from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
+from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.models.device import Device
+from tests import outputs
+
+RECORDED_OUTPUTS: Dict[str, str] = {
+    "show version": outputs.SHOW_VERSION_RAW,
+    "show environment": outputs.SHOW_ENVIRONMENT_RAW,
+    "show ip interface brief": outputs.SHOW_IP_INTERFACE_BRIEF_RAW,
+    "show logging": outputs.SHOW_LOGGING_RAW,
+    "show memory statistics": outputs.SHOW_MEMORY_STATS_RAW,
+    "show processes cpu sorted | exclude 0.00%": outputs.SHOW_PROCESS_CPU_RAW,
+}
+
+
+class Latency:
+    """Latency distribution in seconds: fixed, uniform, exponential or lognormal."""
+
+    def __init__(self, spec: Optional[Dict] = None, rng: Optional[random.Random] = None):
+        spec = dict(spec or {"distribution": "fixed", "value": 0.0})
+        self.distribution = spec.pop("distribution", "fixed")
+        self.params = spec
+        self.rng = rng or random.Random()
+        if self.distribution not in ("fixed", "uniform", "exponential", "lognormal"):
+            raise ValueError(f"Unknown latency distribution {self.distribution!r}")
+
+    def sample(self) -> float:
+        p, rng = self.params, self.rng
+        if self.distribution == "uniform":
+            return rng.uniform(p.get("low", 0.0), p.get("high", 0.0))
+        if self.distribution == "exponential":
+            mean = p.get("mean", 0.0)
+            return rng.expovariate(1 / mean) if mean > 0 else 0.0
+        if self.distribution == "lognormal":
+            return rng.lognormvariate(math.log(max(p.get("median", 0.0), 1e-9)), p.get("sigma", 0))
+        return float(p.get("value", 0.0))
+
+
+class SimulatedProtocol(ConnectionProtocol):
+    """Socket‑free protocol with injected latency, failures and recorded outputs."""
+
+    # Shared across instances of one benchmark run.
+    session_started: Dict[str, float] = {}
+    session_finished: Dict[str, float] = {}
+    injected_failures = 0
+    _rng = random.Random()
+
+    def __init__(self, device: Device, plugin_settings: Dict | None = None):
+        super().__init__(device, plugin_settings)
+        settings = plugin_settings or {}
+        self.connect_latency = Latency(settings.get("connect_latency"), self._rng)
+        self.command_latency = Latency(settings.get("command_latency"), self._rng)
+        self.connect_failure_rate = settings.get("connect_failure_rate", 0.0)
+        self.command_failure_rate = settings.get("command_failure_rate", 0.0)
+        self.output_scale = max(1, int(settings.get("output_scale", 1)))
+
+    @classmethod
+    def reset(cls, seed: Optional[int] = None) -> None:
+        cls.session_started = {}
+        cls.session_finished = {}
+        cls.injected_failures = 0
+        cls._rng = random.Random(seed)
+
+    @staticmethod
+    def plugin_name() -> str:
+        return "simulated"
+
+    def _maybe_fail(self, rate: float, what: str) -> None:
+        if rate and self._rng.random() < rate:
+            type(self).injected_failures += 1
+            raise ConnectionProtocolError(f"simulated {what} failure on {self.device.name}")
+
+    async def connect(self):
+        type(self).session_started.setdefault(self.device.name, time.perf_counter())
+        await asyncio.sleep(self.connect_latency.sample())
+        self._maybe_fail(self.connect_failure_rate, "connect")
+
+    async def send_command(self, command: str) -> str:
+        await asyncio.sleep(self.command_latency.sample())
+        self._maybe_fail(self.command_failure_rate, "command")
+        type(self).session_finished[self.device.name] = time.perf_counter()
+        return RECORDED_OUTPUTS.get(command, command) * self.output_scale
+
+    async def disconnect(self):
+        pass
+
+
+class SimulatedRepository(DeviceRepository):
+    """In‑memory inventory of ``devices`` simulated devices spread over ``sites``."""
+
+    def __init__(self, plugin_settings: Dict | None = None):
+        super().__init__(plugin_settings)
+        settings = plugin_settings or {}
+        self.count = int(settings.get("devices", 1000))
+        self.sites = max(1, int(settings.get("sites", 10)))
+
+    @staticmethod
+    def plugin_name() -> str:
+        return "simulated-inventory"
+
+    def list_devices(self) -> List[Device]:
+        return [
+            Device(
+                name=f"sim{i}",
+                host=f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                username="u",
+                password="p",
+                protocol="simulated",
+                platform="ios",
+                site=f"site{i % self.sites}",
+            )
+            for i in range(self.count)
+        ]
@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+benchmarks.startup
+------------------
+Cold/warm startup benchmark for ``composition_root``.
+
+Each sample runs :mod:`benchmarks._startup_child` in a fresh interpreter under
+``python -X importtime`` inside a throw‑away workspace (settings, a YAML
+inventory of ``fake-async`` devices from ``tests/fakes`` and an empty cache
+directory), so it needs no network and no real devices.
+
+* **cold** – netimate's on‑disk caches (plugin manifest, template index) are
+  empty, as on the first run after an install or upgrade.
+* **warm** – the caches written by the cold run are reused, as for every
+  cron/CI invocation after the first.
+
+For each mode the report holds the median wall time of every
+``composition_root`` stage and the most expensive imports (self and
+cumulative microseconds, median across samples).  Results are written as JSON
+so two versions can be compared::
+
+    python -m benchmarks.startup --runs 7 --output startup-new.json
+    python -m benchmarks.startup --compare startup-old.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+SETTINGS = """\
+device_repo: yaml
+log_level: "off"
+template_paths: []
+plugin_configs:
+  yaml:
+    device_file: {devices}
+"""
+
+
+def _write_workspace(root: Path, devices: int) -> Path:
+    lines = ["devices:"]
+    for i in range(devices):
+        lines += [
+            f"  - name: r{i}",
+            f"    host: 10.0.{i // 250}.{i % 250 + 1}",
+            "    username: u",
+            "    password: p",
+            "    protocol: fake-async",
+            "    platform: ios",
+            f"    site: site{i % 10}",
+        ]
+    (root / "devices.yaml").write_text("\n".join(lines) + "\n")
+    settings = root / "settings.yaml"
+    settings.write_text(SETTINGS.format(devices=root / "devices.yaml"))
+    return settings
+
+
+def _parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    imports: Dict[str, Dict[str, int]] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            imports[module] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us)}
+    return imports
+
+
+def _sample(workspace: Path, cache_dir: Path) -> Dict[str, Any]:
+    env = dict(
+        os.environ,
+        NETIMATE_CONFIG_PATH=str(workspace / "settings.yaml"),
+        NETIMATE_CACHE_DIR=str(cache_dir),
+        NETIMATE_EXTRA_PLUGIN_PACKAGES="tests.fakes",
+        PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.getenv("PYTHONPATH")])),
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "benchmarks._startup_child"],
+        cwd=workspace,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"startup child failed:\n{proc.stderr[-4000:]}")
+    stages = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {"stages": stages, "imports": _parse_importtime(proc.stderr)}
+
+
+def _summarise(samples: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    stages = {
+        name: round(statistics.median(s["stages"][name] for s in samples), 2)
+        for name in samples[0]["stages"]
+    }
+    modules = set().union(*(s["imports"] for s in samples))
+    imports = []
+    for module in modules:
+        values = [s["imports"][module] for s in samples if module in s["imports"]]
+        imports.append(
+            {
+                "module": module,
+                "self_us": int(statistics.median(v["self_us"] for v in values)),
+                "cumulative_us": int(statistics.median(v["cumulative_us"] for v in values)),
+            }
+        )
+    imports.sort(key=lambda item: item["self_us"], reverse=True)
+    heavy_deps = ("scrapli", "netmiko", "asyncssh", "psycopg2", "paramiko", "ttp", "textfsm")
+    return {
+        "samples": len(samples),
+        "stages_ms": stages,
+        "top_imports": imports[:top],
+        "modules_imported": len(modules),
+        "heavy_dependencies_imported": sorted(
+            {m.split(".")[0] for m in modules if m.split(".")[0] in heavy_deps}
+        ),
+    }
+
+
+def run(runs: int, devices: int, top: int) -> Dict[str, Any]:
+    """Collect *runs* cold and *runs* warm samples and return the report."""
+    cold: List[Dict[str, Any]] = []
+    warm: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="netimate-startup-") as tmp:
+        workspace = Path(tmp)
+        _write_workspace(workspace, devices)
+        for i in range(runs):
+            cache_dir = workspace / f"cache{i}"
+            cold.append(_sample(workspace, cache_dir))  # populates cache_dir
+            warm.append(_sample(workspace, cache_dir))
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    try:
+        version = metadata.version("netimate")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "benchmark": "startup",
+        "netimate_version": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "devices": devices,
+        "cold": _summarise(cold, top),
+        "warm": _summarise(warm, top),
+    }
+
+
+def _compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> str:
+    lines = [f"{'stage':<28}{'baseline ms':>14}{'current ms':>14}{'delta':>10}"]
+    for mode in ("cold", "warm"):
+        lines.append(f"[{mode}]")
+        for stage, current in report[mode]["stages_ms"].items():
+            before: Optional[float] = baseline.get(mode, {}).get("stages_ms", {}).get(stage)
+            delta = f"{(current - before) / before * 100:+.0f}%" if before else "n/a"
+            shown = f"{before:.1f}" if before is not None else "-"
+            lines.append(f"{stage:<28}{shown:>14}{current:>14.1f}{delta:>10}")
+    return "\n".join(lines)
+
+
+def _print_summary(report: Dict[str, Any]) -> None:
+    for mode in ("cold", "warm"):
+        summary = report[mode]
+        print(f"[{mode}] median of {summary['samples']} run(s)")
+        for stage, ms in summary["stages_ms"].items():
+            print(f"  {stage:<28}{ms:>10.1f} ms")
+        heavy = ", ".join(summary["heavy_dependencies_imported"]) or "none"
+        print(f"  heavy dependencies imported: {heavy}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="netimate startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="samples per mode (default 5)")
+    parser.add_argument("--devices", type=int, default=50, help="devices in the fake inventory")
+    parser.add_argument("--top", type=int, default=30, help="imports to keep in the report")
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="print deltas against a previous report")
+    args = parser.parse_args(argv)
+
+    report = run(args.runs, args.devices, args.top)
+    _print_summary(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+    if args.compare:
+        print(_compare(report, json.loads(args.compare.read_text())))
+
+
+if __name__ == "__main__":
+    main()
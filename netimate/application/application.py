@@ -14,22 +14,36 @@ call the same `Application` façade.
 """
 
 import logging
-from difflib import unified_diff
+from contextlib import aclosing
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from netimate.application.command_executor_service import CommandExecutorService
+from netimate.application.inventory_service import InventoryService, expand_names
 from netimate.application.snapshot_service import SnapshotService
+from netimate.errors import ConfigError, RegistryError
 from netimate.infrastructure.logging import configure_logging
+from netimate.infrastructure.snapshot_store.content_store import ContentAddressedSnapshotStore
+from netimate.infrastructure.snapshot_store.diff import hierarchical_diff
 from netimate.interfaces.application.application import ApplicationInterface
 from netimate.interfaces.core.registry import PluginRegistryInterface
 from netimate.interfaces.core.runner import RunnerInterface
 from netimate.interfaces.infrastructure.settings import SettingsInterface
+from netimate.interfaces.infrastructure.snapshot_store import SnapshotStoreInterface
 from netimate.interfaces.infrastructure.template_provider import TemplateProviderInterface
+from netimate.interfaces.plugin.async_device_repository import AsyncDeviceRepository
 from netimate.interfaces.plugin.device_repository import DeviceRepository
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DIAGNOSTIC_COMMANDS = (
+    "show-version",
+    "show-ip-interface-brief",
+    "show-memory-stats",
+    "show-processes-cpu",
+    "show-logging",
+)
+
 
 class Application(ApplicationInterface):
     """
@@ -46,15 +60,22 @@ class Application(ApplicationInterface):
         template_provider: TemplateProviderInterface,
         command_executor_service: Optional[CommandExecutorService] = None,
         snapshot_service: Optional[SnapshotService] = None,
+        inventory_service: Optional[InventoryService] = None,
+        snapshot_store: Optional[SnapshotStoreInterface] = None,
     ) -> None:
         self._registry = registry
         self._settings = settings
         self._runner = runner
         self._template_provider = template_provider
+        # One inventory cache shared by listing, completion and execution.
+        self._inventory = inventory_service or InventoryService.from_settings(registry, settings)
         self._command_executor_service = command_executor_service or CommandExecutorService(
-            registry, settings, template_provider, runner
+            registry, settings, template_provider, runner, self._inventory
+        )
+        self._snapshots = snapshot_store or ContentAddressedSnapshotStore(Path("snapshots"))
+        self._snapshot_service = snapshot_service or SnapshotService(
+            self._command_executor_service, store=self._snapshots
         )
-        self._snapshot_service = snapshot_service or SnapshotService(self._command_executor_service)
 
     def get_device_command(self, name: str):
         """Return a device command instance for the given command name."""
@@ -62,88 +83,129 @@ class Application(ApplicationInterface):
             self._template_provider, self._settings.plugin_configs.get(name)
         )
 
-    def get_device_repository(self) -> DeviceRepository:
+    def get_device_repository(self) -> DeviceRepository | AsyncDeviceRepository:
         """Return an instance of the configured device repository plugin."""
-        repo_cls = self._registry.get_device_repository(self._settings.device_repo)
-        return repo_cls(self._settings.plugin_configs.get(self._settings.device_repo))
+        return self._inventory.repository()
 
     def expand_device_names(self, names: List[str]) -> List[str]:
         """
         Expand input names into real device names (devices or sites).
         """
-        all_sites = self.list("sites")
+        return expand_names(self._inventory.inventory(), names)
+
+    async def _expand_device_names_async(self, names: List[str]) -> List[str]:
+        return await self._inventory.expand_async(names)
 
-        expanded = []
-        for name in names:
-            if name in all_sites:
-                expanded.extend(self.list("devices", site=name))
-            else:
-                expanded.append(name)
-        return expanded
+    def diagnostic_commands(self) -> List[str]:
+        """Return the command set run by ``diagnostic`` (``diagnostic.commands`` in settings)."""
+        commands = self._settings.diagnostic_config.get("commands")
+        if commands is None:
+            return list(DEFAULT_DIAGNOSTIC_COMMANDS)
+        if (
+            not isinstance(commands, list)
+            or not commands
+            or not all(isinstance(name, str) for name in commands)
+        ):
+            raise ConfigError("Diagnostic setting 'commands' must be a non-empty list of names")
+        return commands
 
     async def diagnostic(self, device_names: List[str]) -> Dict[str, Dict]:
         """
         Runs a health diagnostic across the specified devices, combining key checks into a report.
+        All checks run back to back over one session per device, devices in parallel.
         Returns a formatted summary for each device.
         """
-        device_names = self.expand_device_names(device_names)
-        logger.info("Running diagnostics...")
+        device_names = await self._expand_device_names_async(device_names)
+        results_by_device: Dict[str, Dict] = {name: {} for name in device_names}
+        async with aclosing(self._stream_diagnostic(device_names)) as results:
+            async for device, outputs in results:
+                results_by_device[device].update(outputs)
+        return results_by_device
 
-        commands = [
-            "show-version",
-            "show-ip-interface-brief",
-            "show-memory-stats",
-            "show-processes-cpu",
-            "show-logging",
-        ]
+    async def stream_diagnostic(
+        self, device_names: List[str]
+    ) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        """
+        Runs the diagnostic like :meth:`diagnostic` but yields ``(device, report)``
+        pairs as soon as each device has run and parsed the whole command set.
+        """
+        device_names = await self._expand_device_names_async(device_names)
+        async with aclosing(self._stream_diagnostic(device_names)) as results:
+            async for device, outputs in results:
+                yield device, outputs
 
-        results_by_device: Dict[str, Dict] = {name: {} for name in device_names}
+    async def _stream_diagnostic(
+        self, device_names: List[str]
+    ) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        logger.info("Running diagnostics...")
+        commands = list(dict.fromkeys(self.diagnostic_commands()))
+        # An unknown command only fails its own entry, not the whole diagnostic.
+        unresolved: Dict[str, str] = {}
         for command in commands:
             try:
-                command_results = await self.run_device_command(device_names, command)
-                for device, output in command_results.items():
-                    results_by_device[device][command] = output
-            except Exception as e:
-                for device in device_names:
-                    results_by_device[device][command] = f"[error] {str(e)}"
+                self._registry.get_device_command(command)
+            except RegistryError as e:
+                unresolved[command] = f"[error] {str(e)}"
+        runnable = [command for command in commands if command not in unresolved]
 
-        return results_by_device
+        def report(outputs: Dict[str, Any]) -> Dict[str, Any]:
+            return {command: outputs.get(command, unresolved.get(command)) for command in commands}
+
+        pending = dict.fromkeys(device_names)
+        try:
+            if runnable:
+                async with aclosing(
+                    self._command_executor_service.stream_many(device_names, runnable)
+                ) as results:
+                    async for device, outputs in results:
+                        pending.pop(device, None)
+                        yield device, report(outputs)
+        except Exception as e:
+            unresolved.update((command, f"[error] {str(e)}") for command in runnable)
+        for device in pending:
+            yield device, report({})
 
     def list(self, key: str, site: Optional[str] = None) -> list[str]:
         """Return a list of items for the given key and optional site filter."""
         if not key:
             return [
-                "Usage: list [devices|device-commands|device-repositories|snapshots|sites]",
+                "Usage: list [devices|device-commands|device-repositories|snapshots|sites"
+                "|circuit-breakers]",
                 "",
                 "Examples:",
                 "  list devices",
                 "  list snapshots",
             ]
 
-        repo = self.get_device_repository()
-        devices = repo.list_devices()
         match key:
             case "device-repositories":
                 return [name for name in self._registry.all_device_repositories()]
             case "device-commands":
                 return [name for name in self._registry.all_device_commands()]
             case "devices":
-                if site:
-                    devices = [d for d in devices if d.site == site]
-                return [d.name for d in devices]
+                inventory = self._inventory.inventory()
+                return inventory.names_in_site(site) if site else inventory.names()
             case "sites":
-                sites = sorted({d.site for d in devices if d.site})
+                sites = self._inventory.inventory().sites()
                 if not sites:
                     return ["[info] No sites found."]
                 return sites
             case "snapshots":
-                snapshot_dir = Path("snapshots")
-                if not snapshot_dir.exists():
+                if not self._snapshots.exists():
                     return ["[info] No snapshots directory found."]
-                files = sorted(snapshot_dir.glob("*.txt"))
-                if not files:
+                refs = self._snapshots.snapshots()
+                if not refs:
                     return ["[info] No snapshots found."]
-                return [f"[{i}] {file.name}" for i, file in enumerate(files, 1)]
+                return [f"[{i}] {ref.name}" for i, ref in enumerate(refs, 1)]
+            case "circuit-breakers":
+                breakers = self._runner.circuit_breakers()
+                if not breakers:
+                    return ["[info] All circuit breakers closed."]
+                return [
+                    f"{b['key']}: {b['state']} ({b['failures']} consecutive failure(s)"
+                    + (f", probe in {b['retry_in']:g}s)" if b["state"] == "open" else ")")
+                    for b in breakers
+                ]
             case _:
                 return [
                     f"[error] Unknown list key: {key}",
@@ -163,17 +225,36 @@ class Application(ApplicationInterface):
         Returns:
             List of parsed results or exceptions, one per device.
         """
-        expanded_device_names = self.expand_device_names(device_names)
+        expanded_device_names = await self._expand_device_names_async(device_names)
         return await self._command_executor_service.run(expanded_device_names, command_name)
 
+    async def stream_device_command(
+        self, device_names: List[str], command_name: str
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Executes a named device command and yields ``(device, result)`` pairs
+        as soon as each device finishes, instead of waiting for the slowest one.
+        """
+        expanded_device_names = await self._expand_device_names_async(device_names)
+        async with aclosing(
+            self._command_executor_service.stream(expanded_device_names, command_name)
+        ) as results:
+            async for device, result in results:
+                yield device, result
+
     async def snapshot(self, device_names: List[str]) -> Dict[str, str]:
         """
         Takes a snapshot of the running config for each specified device
-        and saves it to a timestamped file in the 'snapshots' directory.
+        and saves it, as each device completes, to the 'snapshots' store.
         """
-        expanded_device_names = self.expand_device_names(device_names)
+        expanded_device_names = await self._expand_device_names_async(device_names)
         return await self._snapshot_service.snapshot(expanded_device_names)
 
+    async def close(self) -> None:
+        """Release resources held across commands (pooled sessions, parse workers)."""
+        await self._runner.close()
+        self._template_provider.close()
+
     def set_log_level(self, level: str) -> None:
         """
         Set the application's log level.
@@ -184,7 +265,9 @@ class Application(ApplicationInterface):
         configure_logging(level)
         self._settings.log_level = level
 
-    def diff_snapshots(self, device: str, snap1: int | str, snap2: int | str) -> str:
+    def diff_snapshots(
+        self, device: str, snap1: int | str, snap2: int | str, hierarchical: bool = False
+    ) -> str:
         # Step 1: Resolve integers to filenames if necessary
         snapshots = self.list_snapshots_for_device(device)
         if isinstance(snap1, int):
@@ -192,30 +275,25 @@ class Application(ApplicationInterface):
         if isinstance(snap2, int):
             snap2 = snapshots[snap2 - 1]
 
-        # Step 2: Load file contents
-        text1 = (Path("snapshots") / snap1).read_text()
-        text2 = (Path("snapshots") / snap2).read_text()
-
-        # Step 3: Diff the files
-        diff = unified_diff(
-            text1.splitlines(),
-            text2.splitlines(),
-            fromfile=snap1,
-            tofile=snap2,
-            lineterm="",
-        )
+        # Step 2: Diff section by section, or from the store (deltas where available)
+        if hierarchical:
+            diff = "\n".join(
+                hierarchical_diff(
+                    self._snapshots.read(device, snap1).splitlines(),
+                    self._snapshots.read(device, snap2).splitlines(),
+                    snap1,
+                    snap2,
+                )
+            )
+        else:
+            diff = self._snapshots.diff(device, snap1, snap2)
+        return diff or "No differences found."
 
-        return "\n".join(diff) or "No differences found."
-
-    @staticmethod
-    def list_snapshots_for_device(device: str) -> List[str]:
-        snapshot_dir = Path("snapshots")
-        if not snapshot_dir.exists():
+    def list_snapshots_for_device(self, device: str) -> List[str]:
+        if not self._snapshots.exists():
             raise FileNotFoundError("No snapshots directory found.")
 
-        device_snapshots = sorted(
-            [f.name for f in snapshot_dir.glob(f"{device}_running_config_*.txt")]
-        )
+        device_snapshots = [ref.name for ref in self._snapshots.snapshots(device)]
         if not device_snapshots:
             raise FileNotFoundError(f"No snapshots found for device {device}.")
         return device_snapshots
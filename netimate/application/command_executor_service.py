@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-from typing import Dict, List, Tuple
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Tuple
 
+from netimate.application.inventory_service import InventoryService
 from netimate.interfaces.core.registry import PluginRegistryInterface
 from netimate.interfaces.core.runner import RunnerInterface
 from netimate.interfaces.infrastructure.settings import SettingsInterface
 from netimate.interfaces.infrastructure.template_provider import TemplateProviderInterface
 from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
-from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.interfaces.plugin.device_command import DeviceCommand
 from netimate.models.device import Device
 
 
@@ -17,37 +19,89 @@ class CommandExecutorService:
         settings: SettingsInterface,
         template_provider: TemplateProviderInterface,
         runner: RunnerInterface,
+        inventory: Optional[InventoryService] = None,
     ):
         self._registry = registry
         self._settings = settings
         self._template_provider = template_provider
         self._runner = runner
+        self._inventory = inventory or InventoryService.from_settings(registry, settings)
 
     async def run(self, device_names: List[str], command_name: str) -> Dict[str, str]:
         """
         Run a command on the given list of device names.
         Note: device_names should be pre-expanded and must correspond exactly to device names.
         """
-        repository_cls = self._registry.get_device_repository(self._settings.device_repo)
-        repository: DeviceRepository = repository_cls(
-            self._settings.plugin_configs.get(self._settings.device_repo)
-        )
-        devices = repository.list_devices()
+        devices = await self._select_devices(device_names)
+        device_protocol_pairs = list(self._with_protocols(devices))
+        command = self._command(command_name)
 
-        selected_devices = [d for d in devices if d.name in device_names]
-        if len(selected_devices) != len(device_names):
-            raise ValueError("One or more device names not found.")
+        results = await self._runner.run(device_protocol_pairs, command)
+        return {r["device"]: r["result"] for r in results}
+
+    async def stream(
+        self, device_names: List[str], command_name: str
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Run a command on the given devices and yield ``(device name, result)``
+        pairs as each device completes.  Protocol instances are created lazily
+        as the runner's scheduler picks devices up.
+        Note: device_names should be pre-expanded and must correspond exactly to device names.
+        """
+        devices = await self._select_devices(device_names)
+        command = self._command(command_name)
+
+        async with aclosing(self._runner.stream(self._with_protocols(devices), command)) as results:
+            async for result in results:
+                yield result["device"], result["result"]
+
+    async def run_many(
+        self, device_names: List[str], command_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several commands on the given devices, one session per device.
+        Note: device_names should be pre-expanded and must correspond exactly to device names.
+
+        Returns a mapping of device name -> command name -> parsed result (or error message).
+        """
+        devices = await self._select_devices(device_names)
+        device_protocol_pairs = list(self._with_protocols(devices))
+        commands = [self._command(name) for name in command_names]
 
+        results = await self._runner.run_many(device_protocol_pairs, commands)
+        return {r["device"]: r["result"] for r in results}
+
+    async def stream_many(
+        self, device_names: List[str], command_names: List[str]
+    ) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        """
+        Run several commands on the given devices, one session per device, and
+        yield ``(device name, command name -> result)`` pairs as each device
+        completes.
+        Note: device_names should be pre-expanded and must correspond exactly to device names.
+        """
+        devices = await self._select_devices(device_names)
+        commands = [self._command(name) for name in command_names]
+
+        async with aclosing(
+            self._runner.stream_many(self._with_protocols(devices), commands)
+        ) as results:
+            async for result in results:
+                yield result["device"], result["result"]
+
+    def _command(self, command_name: str) -> DeviceCommand:
         command_cls = self._registry.get_device_command(command_name)
-        command = command_cls(self._template_provider)
+        return command_cls(self._template_provider)
+
+    async def _select_devices(self, device_names: List[str]) -> List[Device]:
+        try:
+            return await self._inventory.select_async(device_names)
+        except KeyError as err:
+            raise ValueError(f"One or more device names not found: {err.args[0]}") from err
 
-        device_protocol_pairs: List[Tuple[Device, ConnectionProtocol]] = []
-        for device in selected_devices:
+    def _with_protocols(self, devices: List[Device]) -> Iterator[Tuple[Device, ConnectionProtocol]]:
+        for device in devices:
             protocol_name = device.protocol
             protocol_cls = self._registry.get_protocol(protocol_name)
             protocol_config: str | Dict = self._settings.plugin_configs.get(protocol_name, {})
-            protocol = protocol_cls(protocol_config)
-            device_protocol_pairs.append((device, protocol))
-
-        results = await self._runner.run(device_protocol_pairs, command)
-        return {r["device"]: r["result"] for r in results}
+            yield device, protocol_cls(device, protocol_config)
@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.application.inventory_service
+--------------------------------------
+Caching layer in front of the configured :class:`DeviceRepository`.
+
+Listing devices, expanding sites, tab completion and command execution all
+need the inventory, often several times per user action.  Instead of
+re‑reading ``devices.yaml`` or reconnecting to Postgres each time, they share
+one :class:`InventoryService`, which keeps the last device list and reloads
+it when
+
+* the repository's :meth:`~DeviceRepository.change_token` changes (checked
+  at most every ``check_interval`` seconds), or
+* the list is older than ``ttl`` seconds, whatever the token says.
+
+Async callers (command execution) use :meth:`InventoryService.inventory_async`,
+which goes through :class:`AsyncDeviceRepository` – synchronous plugins run
+in a worker thread – so a slow CMDB never stalls sessions already in flight.
+:meth:`InventoryService.expand_async` and :meth:`InventoryService.select_async`
+resolve the names a command targets.  When nothing usable is cached and the
+repository filters at the source (overrides ``find_devices`` /
+``get_devices``), they ask it for just those devices – device names in one
+query, site names through site‑filtered queries – instead of loading the
+whole inventory.  Other repositories are loaded in full and cached, which is
+what listing and completion need anyway.
+
+Configured through the ``inventory`` block of ``settings.yaml``::
+
+    inventory:
+      ttl: 300            # seconds before a forced reload
+      check_interval: 2   # seconds between change-token checks
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+from netimate.errors import ConfigError
+from netimate.interfaces.core.registry import PluginRegistryInterface
+from netimate.interfaces.infrastructure.settings import SettingsInterface
+from netimate.interfaces.plugin.async_device_repository import (
+    AsyncDeviceRepository,
+    ThreadedDeviceRepository,
+)
+from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+from netimate.models.inventory import DeviceInventory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300.0
+DEFAULT_CHECK_INTERVAL = 2.0
+
+T = TypeVar("T")
+
+
+_FRESH, _CHECK, _RELOAD = "fresh", "check", "reload"
+
+
+def _safe_token(change_token: Callable[[], Optional[Hashable]]) -> Optional[Hashable]:
+    try:
+        return change_token()
+    except Exception as err:  # pylint: disable=broad-except
+        logger.debug("Inventory change check failed: %s", err)
+        return None
+
+
+def _unchanged(token: Optional[Hashable], previous: Optional[Hashable]) -> bool:
+    # No token means no change signal: rely on the TTL.
+    return token is None or token == previous
+
+
+def _run_sync(factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+    """Run a coroutine from sync code, even when called from inside a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(factory())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, factory()).result()
+
+
+def expand_names(inventory: DeviceInventory, names: Iterable[str]) -> List[str]:
+    """Replace every site name in *names* by the names of its devices."""
+    expanded: List[str] = []
+    for name in names:
+        if inventory.is_site(name):
+            expanded.extend(inventory.names_in_site(name))
+        else:
+            expanded.append(name)
+    return expanded
+
+
+def _seconds(name: str, value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ConfigError(f"Inventory setting '{name}' must be a number >= 0, got {value!r}")
+    return float(value)
+
+
+class InventoryService:
+    """Shared, change‑aware cache of the device inventory."""
+
+    def __init__(
+        self,
+        registry: PluginRegistryInterface,
+        settings: SettingsInterface,
+        ttl: float = DEFAULT_TTL,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._registry = registry
+        self._settings = settings
+        self.ttl = _seconds("ttl", ttl)
+        self.check_interval = _seconds("check_interval", check_interval)
+        self._clock = clock
+
+        self._repository: Optional[DeviceRepository | AsyncDeviceRepository] = None
+        self._async_repository: Optional[AsyncDeviceRepository] = None
+        self._repository_name: Optional[str] = None
+        self._inventory: Optional[DeviceInventory] = None
+        self._token: Optional[Hashable] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+    @classmethod
+    def from_settings(
+        cls, registry: PluginRegistryInterface, settings: SettingsInterface
+    ) -> "InventoryService":
+        """Build the service from the ``inventory`` settings block."""
+        config: Dict[str, Any] = settings.inventory_config or {}
+        return cls(
+            registry,
+            settings,
+            ttl=config.get("ttl", DEFAULT_TTL),
+            check_interval=config.get("check_interval", DEFAULT_CHECK_INTERVAL),
+        )
+
+    def repository(self) -> DeviceRepository | AsyncDeviceRepository:
+        """Return the configured repository plugin instance (created once)."""
+        name = self._settings.device_repo
+        if self._repository is None or name != self._repository_name:
+            repo_cls = self._registry.get_device_repository(name)
+            self._repository = repo_cls(self._settings.plugin_configs.get(name))
+            self._repository_name = name
+            self._async_repository = None
+            self.invalidate()
+        return self._repository
+
+    def async_repository(self) -> AsyncDeviceRepository:
+        """Return the repository behind the async contract (sync plugins run in threads)."""
+        repository = self.repository()
+        if self._async_repository is None:
+            self._async_repository = (
+                repository
+                if isinstance(repository, AsyncDeviceRepository)
+                else ThreadedDeviceRepository(repository)
+            )
+        return self._async_repository
+
+    def _state(self) -> str:
+        now = self._clock()
+        if self._inventory is None or now - self._loaded_at >= self.ttl:
+            return _RELOAD
+        if now - self._checked_at < self.check_interval:
+            return _FRESH
+        self._checked_at = now
+        return _CHECK
+
+    def _store(self, table: DeviceTable, token: Optional[Hashable]) -> DeviceInventory:
+        self._inventory = DeviceInventory(table)
+        self._token = token
+        self._loaded_at = self._checked_at = self._clock()
+        return self._inventory
+
+    def inventory(self) -> DeviceInventory:
+        """Return the indexed inventory, reloading it only when it may have changed."""
+        repository = self.repository()
+        if isinstance(repository, AsyncDeviceRepository):
+            return _run_sync(self.inventory_async)
+
+        state = self._state()
+        if state == _FRESH and self._inventory is not None:
+            return self._inventory
+        # Take the token before loading so a change made during the load is seen next time.
+        token = _safe_token(repository.change_token)
+        if state == _CHECK and self._inventory is not None and _unchanged(token, self._token):
+            return self._inventory
+
+        logger.info("Loading device inventory from '%s'", self._repository_name)
+        return self._store(repository.list_device_table(), token)
+
+    async def inventory_async(self) -> DeviceInventory:
+        """
+        Like :meth:`inventory`, but awaits the repository so change checks and
+        loads overlap with device I/O instead of blocking the event loop.
+        """
+        repository = self.async_repository()
+        state = self._state()
+        if state == _FRESH and self._inventory is not None:
+            return self._inventory
+        try:
+            token = await repository.change_token()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Inventory change check failed: %s", err)
+            token = None
+        if state == _CHECK and self._inventory is not None and _unchanged(token, self._token):
+            return self._inventory
+
+        logger.info("Loading device inventory from '%s'", self._repository_name)
+        return self._store(await repository.list_device_table(), token)
+
+    def filters_at_source(self) -> bool:
+        """Return whether the repository looks devices up itself rather than filtering a full load."""
+        repository = self.repository()
+        if isinstance(repository, DeviceRepository):
+            return type(repository).find_devices is not DeviceRepository.find_devices
+        if isinstance(repository, AsyncDeviceRepository):
+            return type(repository).get_devices is not AsyncDeviceRepository.get_devices
+        return False
+
+    def _pushdown(self) -> bool:
+        """Whether to query the repository instead of loading (or using) the full inventory."""
+        stale = self._inventory is None or self._clock() - self._loaded_at >= self.ttl
+        return stale and self.filters_at_source()
+
+    async def expand_async(self, names: Iterable[str]) -> List[str]:
+        """
+        Replace every site name in *names* by the names of its devices; other
+        names are kept as given (unknown ones fail later, in :meth:`select_async`).
+
+        Without a usable cache, a repository that filters at the source is
+        asked which names are devices, and only the others are looked up as
+        sites (so a name used for both a device and a site means the device).
+        """
+        names = list(names)
+        if not self._pushdown():
+            return expand_names(await self.inventory_async(), names)
+
+        repository = self.async_repository()
+        devices = {device.name for device in await repository.get_devices(names)}
+        expanded: List[str] = []
+        for name in names:
+            in_site = (
+                []
+                if name in devices
+                else [d.name async for d in repository.iter_devices(site=name)]
+            )
+            expanded.extend(in_site or [name])
+        return expanded
+
+    async def select_async(self, names: Iterable[str]) -> List[Device]:
+        """
+        Return the devices called *names*, in the order given and without
+        duplicates.  Raises ``KeyError`` listing every unknown name.
+
+        A cached inventory within its TTL is used as is; otherwise a repository
+        that filters at the source is asked for just these devices.
+        """
+        wanted = list(dict.fromkeys(names))
+        if not self._pushdown():
+            return (await self.inventory_async()).select(wanted)
+
+        logger.info("Looking up %d device(s) in '%s'", len(wanted), self._repository_name)
+        found = {
+            device.name: device for device in await self.async_repository().get_devices(wanted)
+        }
+        missing = [name for name in wanted if name not in found]
+        if missing:
+            raise KeyError(missing)
+        return [found[name] for name in wanted]
+
+    def devices(self) -> List[Device]:
+        """Return the inventory as a list, in repository order."""
+        return self.inventory().devices
+
+    def invalidate(self) -> None:
+        """Drop the cached inventory; the next :meth:`devices` call reloads it."""
+        self._inventory = None
+        self._token = None
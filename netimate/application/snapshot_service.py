@@ -1,26 +1,45 @@
 # SPDX-License-Identifier: MPL-2.0
+from contextlib import aclosing
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from netimate.application.command_executor_service import CommandExecutorService
+from netimate.infrastructure.snapshot_store.content_store import ContentAddressedSnapshotStore
+from netimate.infrastructure.snapshot_store.writer import SnapshotWriter
+from netimate.interfaces.infrastructure.snapshot_store import SnapshotStoreInterface
 
 
 class SnapshotService:
-    def __init__(self, executor: CommandExecutorService, snapshot_dir: Path = Path("snapshots")):
+    def __init__(
+        self,
+        executor: CommandExecutorService,
+        snapshot_dir: Path = Path("snapshots"),
+        store: Optional[SnapshotStoreInterface] = None,
+    ):
         self._executor = executor
-        self._snapshot_dir = snapshot_dir
+        self._store = store or ContentAddressedSnapshotStore(snapshot_dir)
 
     async def snapshot(self, device_names: List[str]) -> Dict[str, str]:
-        results = await self._executor.run(device_names, "show-running-config")
+        """
+        Capture the running config of each device and save it as it arrives;
+        configs are written in batches off the event loop, so only a bounded
+        number are held in memory.
+
+        Returns a mapping of device name -> saved snapshot name.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
 
-        for device, output in results.items():
-            file_path = self._snapshot_dir / f"{device}_running_config_{timestamp}.txt"
-            if isinstance(output, dict) and "config_lines" in output:
-                file_path.write_text("\n".join(output["config_lines"]))
-            else:
-                file_path.write_text(str(output))
+        async with SnapshotWriter(self._store, timestamp) as writer:
+            results = self._executor.stream(device_names, "show-running-config")
+            async with aclosing(results):
+                async for device, output in results:
+                    await writer.write(device, self._config_text(output))
+
+        return writer.saved
 
-        return results
+    @staticmethod
+    def _config_text(output: Any) -> str:
+        if isinstance(output, dict) and "config_lines" in output:
+            return "\n".join(output["config_lines"])
+        return str(output)
@@ -7,7 +7,8 @@ Manual dependency‑injection container (a.k.a. composition root).
 Responsibilities:
 1. Load user settings from YAML.
 2. Configure global logging.
-3. Build an in‑memory PluginRegistry and auto‑register built‑in + extra plugins.
+3. Build an in‑memory PluginRegistry and auto‑register built‑in + extra plugins
+   (lazily, from a cached plugin manifest).
 4. Instantiate core services (TemplateProvider, Runner).
 5. Return an :class:`ApplicationInterface` ready for consumption by CLI/Shell.
 
@@ -16,6 +17,7 @@ side‑effects and simplifies future refactoring to an IoC/DI framework.
 """
 
 import os
+from typing import Callable, Optional
 
 from netimate.application.application import Application
 from netimate.core.plugin_engine.plugin_registry import PluginKind, PluginRegistry
@@ -24,50 +26,76 @@ from netimate.core.runner import Runner
 from netimate.infrastructure.config_loader import ConfigLoader
 from netimate.infrastructure.logging import configure_logging
 from netimate.infrastructure.template_provider.filesystem import FileSystemTemplateProvider
+from netimate.infrastructure.template_provider.parse_executor import ParseExecutor
+from netimate.infrastructure.utils.file_management import user_cache_dir
 from netimate.interfaces.application.application import ApplicationInterface
+from netimate.interfaces.plugin.async_device_repository import AsyncDeviceRepository
 from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
 from netimate.interfaces.plugin.device_command import DeviceCommand
 from netimate.interfaces.plugin.device_repository import DeviceRepository
 
 
-def composition_root() -> ApplicationInterface:
+def composition_root(on_stage: Optional[Callable[[str], None]] = None) -> ApplicationInterface:
     """Compose and return a ready‑to‑use :class:`ApplicationInterface`.
 
+    Parameters
+    ----------
+    on_stage:
+        Optional callback invoked with a stage name as each wiring stage
+        completes (used by the startup benchmark to time the real wiring).
+
     Returns
     -------
     ApplicationInterface
         Fully initialised application façade injected with:
         * Settings          – parsed from YAML via ConfigLoader.
-        * Template provider – FileSystemTemplateProvider for TextFSM/TTP.
+        * Template provider – FileSystemTemplateProvider for TextFSM/TTP, parsing
+                              in a worker pool via ParseExecutor.
         * Runner            – asynchronous execution engine.
         * Plugin registry   – populated with built‑in & extra plugins.
     """
+    stage = on_stage or (lambda name: None)
+
     # 1. Load settings
     config_loader = ConfigLoader(os.getenv("NETIMATE_CONFIG_PATH", "settings.yaml"))
     settings = config_loader.load()
+    stage("config_loader")
 
     # 2. Configure logging
     configure_logging(settings.log_level)
+    stage("logging")
 
     # 3. Register plugins
     registry = PluginRegistry()
-    registrar = PluginRegistrar(registry)
+    registrar = PluginRegistrar(registry, user_cache_dir() / "plugin-manifest.json")
 
     registrar.register_plugins(
         PluginKind.DEVICE_COMMAND, "netimate.plugins.device_commands", DeviceCommand
     )
+    stage("register_device_commands")
     registrar.register_plugins(
         PluginKind.PROTOCOL, "netimate.plugins.connection_protocols", ConnectionProtocol
     )
+    stage("register_protocols")
     registrar.register_plugins(
         PluginKind.REPOSITORY, "netimate.plugins.device_repositories", DeviceRepository
     )
+    registrar.register_plugins(
+        PluginKind.REPOSITORY, "netimate.plugins.device_repositories", AsyncDeviceRepository
+    )
+    stage("register_repositories")
 
     # 3. Create dependencies
-    template_provider = FileSystemTemplateProvider(settings.template_paths)
-    runner = Runner(settings.plugin_configs)
+    template_provider = FileSystemTemplateProvider(
+        settings.template_paths,
+        ParseExecutor.from_config(settings.parsing_config),
+        index_path=user_cache_dir() / "template-index.json",
+    )
+    stage("template_provider")
+    runner = Runner(settings.plugin_configs, settings.runner_config)
 
     # 4. Initialise application
     app = Application(registry, settings, runner, template_provider)
+    stage("runner_and_application")
 
     return app
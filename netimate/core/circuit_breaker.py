@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.core.circuit_breaker
+-----------------------------
+Fail fast on devices that are known to be unreachable.
+
+Without a breaker every fan‑out (each diagnostic, each shell ``run``) waits
+out a full connect timeout for the same dead devices.  The Runner keeps a
+:class:`CircuitBreakerRegistry` for its lifetime that counts consecutive
+transport failures (``ConnectionProtocolError`` / ``ConnectionTimeoutError``,
+not authentication or parse errors) per device and per site, the network
+path devices of one site share:
+
+* **closed** – requests flow; ``failure_threshold`` consecutive failures
+  open the breaker.
+* **open** – requests fail at once with :class:`CircuitOpenError` until
+  ``cooldown`` seconds have passed.
+* **half‑open** – one probe request is let through; success closes the
+  breaker, failure opens it for another cool‑down.
+
+Site breakers are off unless ``site_failure_threshold`` is set.  A site is
+shared by healthy and unreachable devices alike, so reaching the threshold
+does not open a site breaker straight away: it goes half‑open, the next
+device of the site is let through as its probe (other devices of the site
+keep flowing meanwhile) and only a failed probe opens it.  A fan‑out
+therefore never skips a site's devices until one has been tried after the
+failures were counted, and any success in the site closes the breaker.
+
+Configured through the ``runner.circuit_breaker`` block of ``settings.yaml``::
+
+    runner:
+      circuit_breaker:
+        enabled: true
+        failure_threshold: 3        # per device
+        site_failure_threshold: 0   # per site; 0 (default) disables site breakers
+        cooldown: 60                # seconds an open breaker fails fast
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from netimate.errors import CircuitOpenError, ConfigError
+from netimate.models.device import Device
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_SITE_FAILURE_THRESHOLD = 0
+DEFAULT_COOLDOWN = 60.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+# Error types (``error_type`` of a Runner result) that count against a breaker.
+TRIPPING_ERRORS = frozenset({"ConnectionProtocolError", "ConnectionTimeoutError"})
+
+
+@dataclass
+class CircuitBreaker:
+    """Consecutive‑failure breaker for one device or site.
+
+    With ``probe_first`` (site breakers) reaching the threshold only makes the
+    breaker half‑open: requests keep flowing while the next one probes, and
+    only that probe failing opens it.
+    """
+
+    key: str
+    failure_threshold: int
+    cooldown: float
+    probe_first: bool = False
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probe: Optional[str] = None
+
+    def blocked(self, now: float) -> bool:
+        """Return whether a request must fail fast right now."""
+        if self.state == OPEN and now - self.opened_at < self.cooldown:
+            return True
+        return self.state == HALF_OPEN and self.probe is not None and not self.probe_first
+
+    def admit(self, name: str) -> None:
+        """Let *name* through, making it the probe if the breaker is not closed."""
+        if self.state != CLOSED and self.probe is None:
+            self.state = HALF_OPEN
+            self.probe = name
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.probe = None
+
+    def record_failure(self, now: float, name: str) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN:
+            if name == self.probe or not self.probe_first:
+                self._open(now)
+        elif self.failures >= self.failure_threshold:
+            if self.probe_first:
+                self.state = HALF_OPEN
+            else:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self.probe = None
+
+    def retry_in(self, now: float) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (now - self.opened_at))
+
+
+def _positive(name: str, value: Any, minimum: float) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+        raise ConfigError(
+            f"Runner setting 'circuit_breaker.{name}' must be >= {minimum:g}, got {value!r}"
+        )
+    return value
+
+
+class CircuitBreakerRegistry:
+    """Per‑device and per‑site breakers shared by every fan‑out of a Runner."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        site_failure_threshold: int = DEFAULT_SITE_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = bool(enabled)
+        self.failure_threshold = int(_positive("failure_threshold", failure_threshold, 1))
+        self.site_failure_threshold = int(
+            _positive("site_failure_threshold", site_failure_threshold, 0)
+        )
+        self.cooldown = float(_positive("cooldown", cooldown, 0))
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_config(cls, breaker_config: Optional[Dict[str, Any]]) -> "CircuitBreakerRegistry":
+        """Build a registry from the ``runner.circuit_breaker`` settings block (may be ``None``)."""
+        breaker_config = breaker_config or {}
+        return cls(
+            enabled=breaker_config.get("enabled", True),
+            failure_threshold=breaker_config.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+            site_failure_threshold=breaker_config.get(
+                "site_failure_threshold", DEFAULT_SITE_FAILURE_THRESHOLD
+            ),
+            cooldown=breaker_config.get("cooldown", DEFAULT_COOLDOWN),
+        )
+
+    def _breakers_for(self, device: Device) -> List[CircuitBreaker]:
+        breakers = [self._breaker(f"device:{device.name}", self.failure_threshold, False)]
+        if device.site and self.site_failure_threshold:
+            breakers.append(self._breaker(f"site:{device.site}", self.site_failure_threshold, True))
+        return breakers
+
+    def _breaker(self, key: str, threshold: int, probe_first: bool) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                key, threshold, self.cooldown, probe_first
+            )
+        return breaker
+
+    def check(self, device: Device) -> None:
+        """Raise :class:`CircuitOpenError` if *device* (or its site) is failing fast."""
+        if not self.enabled:
+            return
+        now = self._clock()
+        breakers = self._breakers_for(device)
+        for breaker in breakers:
+            if breaker.blocked(now):
+                raise CircuitOpenError(
+                    f"Circuit open for {breaker.key}; skipping {device.name} "
+                    f"(retry in {breaker.retry_in(now):.0f}s)"
+                )
+        for breaker in breakers:
+            breaker.admit(device.name)
+
+    def release(self, device: Device) -> None:
+        """Forget an admitted request that ended without an outcome (e.g. cancelled)."""
+        for breaker in self._breakers_for(device):
+            if breaker.probe == device.name:
+                breaker.probe = None
+
+    def record(self, device: Device, error_type: Optional[str]) -> None:
+        """Record the outcome of a device run from its result's ``error_type``."""
+        if not self.enabled:
+            return
+        now = self._clock()
+        for breaker in self._breakers_for(device):
+            if error_type in TRIPPING_ERRORS:
+                breaker.record_failure(now, device.name)
+            else:
+                breaker.record_success()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return the state of every breaker that is not cleanly closed."""
+        now = self._clock()
+        return [
+            {
+                "key": breaker.key,
+                "state": breaker.state,
+                "failures": breaker.failures,
+                "retry_in": round(breaker.retry_in(now), 1),
+            }
+            for breaker in self._breakers.values()
+            if breaker.state != CLOSED or breaker.failures
+        ]
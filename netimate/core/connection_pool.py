@@ -0,0 +1,322 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.core.connection_pool
+-----------------------------
+Keeps authenticated :class:`ConnectionProtocol` sessions open between
+commands so repeated fan‑outs against the same devices (diagnostics, shell
+sessions) pay the login cost once instead of once per command.
+
+Sessions are keyed by ``(device name, protocol plugin name)`` and are only
+ever handed to one caller at a time.  Idle sessions expire after
+``idle_ttl`` seconds; a background reaper (started with the first idle
+session, stopped by :meth:`ConnectionPool.close`) closes them on time even
+when no further command runs.  ``max_sessions`` caps every open session,
+idle or checked out: a new connection first evicts the oldest idle session
+and, when all of them are in use, waits for one to be released.
+Optionally, every idle session is health‑checked via
+:meth:`ConnectionProtocol.is_alive` before it is reused.
+
+Configured through the ``runner.pool`` block of ``settings.yaml``::
+
+    runner:
+      pool:
+        enabled: true
+        idle_ttl: 60        # seconds an unused session is kept open
+        max_sessions: 500   # sessions open at once across all devices
+        health_check: true
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+from netimate.errors import ConfigError, ConnectionTimeoutError
+from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
+from netimate.models.device import Device
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TTL = 60.0
+DEFAULT_MAX_SESSIONS = 500
+
+SessionKey = Tuple[str, str]
+
+
+@dataclass(eq=False)
+class _PooledSession:
+    key: SessionKey
+    protocol: ConnectionProtocol
+    loop: asyncio.AbstractEventLoop
+    released_at: float = field(default=0.0)
+
+
+def _session_key(device: Device, protocol: ConnectionProtocol) -> SessionKey:
+    try:
+        protocol_name = protocol.plugin_name()
+    except Exception:  # pylint: disable=broad-except
+        protocol_name = type(protocol).__name__
+    return device.name, protocol_name
+
+
+class ConnectionPool:
+    """Pool of connected protocol sessions with idle TTL, cap and health checks."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        health_check: bool = True,
+    ):
+        if isinstance(idle_ttl, bool) or not isinstance(idle_ttl, (int, float)) or idle_ttl < 0:
+            raise ConfigError(f"Runner setting 'pool.idle_ttl' must be >= 0, got {idle_ttl!r}")
+        if isinstance(max_sessions, bool) or not isinstance(max_sessions, int) or max_sessions < 0:
+            raise ConfigError(
+                f"Runner setting 'pool.max_sessions' must be >= 0, got {max_sessions!r}"
+            )
+        self.enabled = bool(enabled) and idle_ttl > 0 and max_sessions > 0
+        self.idle_ttl = float(idle_ttl)
+        self.max_sessions = max_sessions
+        self.health_check = health_check
+
+        # Idle sessions in release order (oldest first) plus a per‑key index.
+        self._idle: "OrderedDict[int, _PooledSession]" = OrderedDict()
+        self._idle_by_key: Dict[SessionKey, "OrderedDict[int, _PooledSession]"] = {}
+        self._in_use: Dict[int, _PooledSession] = {}
+        # New sessions being connected count against max_sessions too.
+        self._connecting = 0
+        self._slot_waiters: Deque[asyncio.Future] = deque()
+        self._reaper: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(cls, pool_config: Optional[Dict[str, Any]]) -> "ConnectionPool":
+        """Build a pool from the ``runner.pool`` settings block (may be ``None``)."""
+        pool_config = pool_config or {}
+        return cls(
+            enabled=pool_config.get("enabled", True),
+            idle_ttl=pool_config.get("idle_ttl", DEFAULT_IDLE_TTL),
+            max_sessions=pool_config.get("max_sessions", DEFAULT_MAX_SESSIONS),
+            health_check=pool_config.get("health_check", True),
+        )
+
+    # ------------------------------------------------------------------ #
+    #                            Bookkeeping                             #
+    # ------------------------------------------------------------------ #
+    @property
+    def open_sessions(self) -> int:
+        """Number of sessions currently open (idle + checked out)."""
+        return len(self._idle) + len(self._in_use)
+
+    @property
+    def idle_sessions(self) -> int:
+        return len(self._idle)
+
+    def _pop_idle(self, session_id: int) -> _PooledSession:
+        session = self._idle.pop(session_id)
+        per_key = self._idle_by_key[session.key]
+        del per_key[session_id]
+        if not per_key:
+            del self._idle_by_key[session.key]
+        return session
+
+    def _push_idle(self, session: _PooledSession) -> None:
+        session.released_at = time.monotonic()
+        self._idle[id(session)] = session
+        self._idle_by_key.setdefault(session.key, OrderedDict())[id(session)] = session
+        self._start_reaper()
+        self._wake_slot_waiter()  # an idle session can be evicted for a waiter
+
+    def _start_reaper(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._reaper is None or self._reaper.done() or self._reaper.get_loop() is not loop:
+            self._reaper = loop.create_task(self._reap())
+
+    async def _reap(self) -> None:
+        """Close idle sessions as they expire; ends when none are left."""
+        while self._idle:
+            oldest = next(iter(self._idle.values()))
+            await asyncio.sleep(max(0.0, oldest.released_at + self.idle_ttl - time.monotonic()))
+            await self._evict_expired()
+
+    def _wake_slot_waiter(self) -> None:
+        while self._slot_waiters:
+            waiter = self._slot_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _reserve_slot(self) -> None:
+        """Wait until one more session fits under ``max_sessions``, evicting idle ones."""
+        while self.open_sessions + self._connecting >= self.max_sessions:
+            if self._idle:
+                await self._evict_oldest()
+                continue
+            waiter = asyncio.get_running_loop().create_future()
+            self._slot_waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_slot_waiter()  # pass the wake-up on
+                raise
+        self._connecting += 1
+
+    async def _close(self, session: _PooledSession, reason: str) -> None:
+        logger.debug("[Pool] Closing session %s (%s)", session.key, reason)
+        self._wake_slot_waiter()
+        try:
+            if session.loop is asyncio.get_running_loop():
+                await session.protocol.disconnect()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("[Pool] Ignoring disconnect failure for %s: %s", session.key, err)
+
+    async def _evict_expired(self) -> None:
+        deadline = time.monotonic() - self.idle_ttl
+        while self._idle:
+            session_id, session = next(iter(self._idle.items()))
+            if session.released_at > deadline:
+                break
+            await self._close(self._pop_idle(session_id), "idle ttl expired")
+
+    async def _evict_oldest(self) -> None:
+        if self._idle:
+            await self._close(self._pop_idle(next(iter(self._idle))), "max sessions reached")
+
+    async def _is_healthy(self, session: _PooledSession) -> bool:
+        if session.loop is not asyncio.get_running_loop():
+            return False
+        if not self.health_check:
+            return True
+        try:
+            return bool(await session.protocol.is_alive())
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("[Pool] Health check failed for %s: %s", session.key, err)
+            return False
+
+    # ------------------------------------------------------------------ #
+    #                             Public API                             #
+    # ------------------------------------------------------------------ #
+    async def acquire(
+        self,
+        device: Device,
+        protocol: ConnectionProtocol,
+        connect_timeout: Optional[float] = None,
+    ) -> ConnectionProtocol:
+        """
+        Return a connected session for *device*.
+
+        Reuses a healthy idle session when one exists; otherwise connects
+        *protocol* (which must be a fresh, unconnected instance for *device*),
+        giving up with :class:`ConnectionTimeoutError` after *connect_timeout*
+        seconds.  Connecting waits while ``max_sessions`` sessions are in use.
+        """
+        key = _session_key(device, protocol)
+        if self.enabled:
+            await self._evict_expired()
+            per_key = self._idle_by_key.get(key)
+            while per_key:
+                session = self._pop_idle(next(reversed(per_key)))
+                if await self._is_healthy(session):
+                    logger.debug("[Pool] Reusing session for %s", device.name)
+                    self._in_use[id(session.protocol)] = session
+                    return session.protocol
+                await self._close(session, "failed health check")
+                per_key = self._idle_by_key.get(key)
+
+            await self._reserve_slot()
+            try:
+                await self._connect(device, protocol, connect_timeout)
+            except BaseException:
+                self._wake_slot_waiter()
+                raise
+            finally:
+                self._connecting -= 1
+        else:
+            await self._connect(device, protocol, connect_timeout)
+        logger.debug("Connected to %s", device.host)
+        session = _PooledSession(key, protocol, asyncio.get_running_loop())
+        self._in_use[id(protocol)] = session
+        return protocol
+
+    @staticmethod
+    async def _connect(
+        device: Device, protocol: ConnectionProtocol, timeout: Optional[float]
+    ) -> None:
+        try:
+            await asyncio.wait_for(protocol.connect(), timeout)
+        except BaseException as err:
+            # Failed, timed out or cancelled (e.g. by the device's total
+            # deadline): the transport may be half open, so close it best
+            # effort before passing the original error on.
+            try:
+                await asyncio.shield(protocol.disconnect())
+            except (Exception, asyncio.CancelledError):  # pylint: disable=broad-except
+                pass
+            if isinstance(err, asyncio.TimeoutError):
+                raise ConnectionTimeoutError(
+                    f"Connecting to {device.name} timed out after {timeout:g}s"
+                ) from err
+            raise
+
+    async def release(self, device: Device, protocol: ConnectionProtocol) -> None:
+        """Return a healthy session obtained from :meth:`acquire` for reuse."""
+        session = self._in_use.pop(id(protocol), None)
+        if session is None:
+            return
+        if self.enabled and self.open_sessions < self.max_sessions:
+            self._push_idle(session)
+            await self._evict_expired()
+            return
+        await self._close(session, "pool disabled or full")
+        logger.debug("Disconnected from %s", device.host)
+
+    async def discard(self, device: Device, protocol: ConnectionProtocol) -> None:
+        """Close a session that failed mid‑use instead of returning it to the pool."""
+        session = self._in_use.pop(id(protocol), None)
+        if session is not None:
+            await self._close(session, "discarded after error")
+
+    @asynccontextmanager
+    async def session(
+        self,
+        device: Device,
+        protocol: ConnectionProtocol,
+        connect_timeout: Optional[float] = None,
+    ) -> AsyncIterator[ConnectionProtocol]:
+        """Context manager wrapping :meth:`acquire` / :meth:`release` / :meth:`discard`."""
+        connection = await self.acquire(device, protocol, connect_timeout)
+        try:
+            yield connection
+        except BaseException:
+            await self.discard(device, connection)
+            raise
+        else:
+            await self.release(device, connection)
+
+    async def close(self) -> None:
+        """Stop the reaper and disconnect every idle session (checked‑out sessions are left alone)."""
+        reaper, self._reaper = self._reaper, None
+        if (
+            reaper is not None
+            and not reaper.done()
+            and reaper.get_loop() is asyncio.get_running_loop()
+        ):
+            reaper.cancel()
+            await asyncio.gather(reaper, return_exceptions=True)
+        while self._idle:
+            await self._close(self._pop_idle(next(iter(self._idle))), "pool closed")
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of pool occupancy for diagnostics."""
+        return {
+            "open": self.open_sessions,
+            "idle": self.idle_sessions,
+            "in_use": len(self._in_use),
+            "max_sessions": self.max_sessions,
+        }
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.core.plugin_engine.manifest
+------------------------------------
+Persisted record of which plugin classes live in which modules, so startup can
+register plugins *without importing them*.
+
+Discovering plugins means importing every module of every plugin package,
+which drags in scrapli, netmiko, asyncssh, psycopg2 … even when a CLI call
+needs one command and one protocol.  The manifest stores, per plugin package
+and interface, the ``(plugin name, module, class)`` triples found by the last
+full scan together with a fingerprint of the package: the mtime and size of
+each of its ``.py`` files plus the installed netimate version.  While the
+fingerprint matches, the registrar registers lazy loaders from the manifest
+and a plugin module is only imported when the plugin is first looked up.
+
+The manifest file location is chosen by the caller (the composition root
+keeps it in the user cache directory); a missing, corrupt or stale manifest
+simply triggers a full scan.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import os
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+PluginEntry = Tuple[str, str, str]  # (plugin name, module, class qualname)
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("netimate")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _package_dir(pkg_name: str) -> Optional[Path]:
+    """Locate *pkg_name* on disk without importing its plugin modules."""
+    try:
+        spec = importlib.util.find_spec(pkg_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return Path(list(spec.submodule_search_locations)[0])
+
+
+def _fingerprint(pkg_dir: Path) -> Dict[str, List[int]]:
+    files: Dict[str, List[int]] = {}
+    for file in sorted(pkg_dir.rglob("*.py")):
+        stat = file.stat()
+        files[file.relative_to(pkg_dir).as_posix()] = [stat.st_mtime_ns, stat.st_size]
+    return files
+
+
+def _interface_id(interface: Type) -> str:
+    return f"{interface.__module__}.{interface.__qualname__}"
+
+
+class PluginManifest:
+    """Load/validate/store plugin entries per ``(package, interface)``."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._version = _package_version()
+        self._entries: Dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as err:
+            logger.debug("No usable plugin manifest at %s: %s", self.path, err)
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_VERSION
+            or data.get("netimate_version") != self._version
+        ):
+            return {}
+        packages = data.get("packages")
+        return packages if isinstance(packages, dict) else {}
+
+    @staticmethod
+    def _key(pkg_name: str, interface: Type) -> str:
+        return f"{pkg_name}|{_interface_id(interface)}"
+
+    def lookup(self, pkg_name: str, interface: Type) -> Optional[List[PluginEntry]]:
+        """Return cached entries for *pkg_name*, or ``None`` if missing or stale."""
+        record = self._entries.get(self._key(pkg_name, interface))
+        pkg_dir = _package_dir(pkg_name)
+        if record is None or pkg_dir is None:
+            return None
+        try:
+            if record["files"] != _fingerprint(pkg_dir):
+                logger.debug("Plugin manifest stale for %s", pkg_name)
+                return None
+            return [(name, module, qualname) for name, module, qualname in record["plugins"]]
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def record(self, pkg_name: str, interface: Type, plugins: List[PluginEntry]) -> None:
+        """Store the result of a full scan of *pkg_name*."""
+        pkg_dir = _package_dir(pkg_name)
+        if pkg_dir is None:
+            return
+        self._entries[self._key(pkg_name, interface)] = {
+            "files": _fingerprint(pkg_dir),
+            "plugins": [list(entry) for entry in plugins],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if anything changed (best effort, atomic)."""
+        if not self._dirty:
+            return
+        data = {
+            "version": MANIFEST_VERSION,
+            "netimate_version": self._version,
+            "packages": self._entries,
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as err:
+            logger.debug("Could not write plugin manifest %s: %s", self.path, err)
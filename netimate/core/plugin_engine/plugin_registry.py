@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
+import logging
 from enum import Enum
-from typing import Callable, Dict, Type
+from typing import Any, Callable, Dict, Type
 
 from netimate.errors import RegistryError
 from netimate.interfaces.core.registry import PluginRegistryInterface
+from netimate.interfaces.plugin.async_device_repository import AsyncDeviceRepository
 from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
 from netimate.interfaces.plugin.device_command import DeviceCommand
 from netimate.interfaces.plugin.device_repository import DeviceRepository
@@ -16,6 +18,8 @@ connection protocols, and device repositories. This registry is used during
 application boot to register and lookup plugins dynamically.
 """
 
+logger = logging.getLogger(__name__)
+
 
 class PluginKind(Enum):
     DEVICE_COMMAND = "device_command"
@@ -28,18 +32,29 @@ class PluginRegistry(PluginRegistryInterface):
     In‑memory implementation of the PluginRegistryInterface.
     Keeps three dictionaries keyed by plugin name and exposes helper
     methods for registration and lookup during application boot.
+
+    Plugins may also be registered *lazily* with a zero‑argument loader; the
+    loader (typically an import) runs on the first lookup of that name.
     """
 
     def __init__(self):
         self._device_commands: Dict[str, Type[DeviceCommand]] = {}
         self._protocols: Dict[str, Type[ConnectionProtocol]] = {}
-        self._repositories: Dict[str, Type[DeviceRepository]] = {}
+        self._repositories: Dict[str, Type[DeviceRepository] | Type[AsyncDeviceRepository]] = {}
 
         self._handlers: Dict[PluginKind, Callable] = {
             PluginKind.DEVICE_COMMAND: self.register_device_command,
             PluginKind.PROTOCOL: self.register_protocol,
             PluginKind.REPOSITORY: self.register_device_repository,
         }
+        self._tables: Dict[PluginKind, Dict[str, Any]] = {
+            PluginKind.DEVICE_COMMAND: self._device_commands,
+            PluginKind.PROTOCOL: self._protocols,
+            PluginKind.REPOSITORY: self._repositories,
+        }
+        self._lazy: Dict[PluginKind, Dict[str, Callable[[], Type[Plugin]]]] = {
+            kind: {} for kind in PluginKind
+        }
 
     def register(self, kind: PluginKind, name: str, plugin: Type[Plugin]):
         """Register a plugin of the specified kind under the given name."""
@@ -47,48 +62,76 @@ class PluginRegistry(PluginRegistryInterface):
             raise ValueError(f"Unknown plugin kind: {kind}")
         self._handlers[kind](name, plugin)
 
+    def register_lazy(self, kind: PluginKind, name: str, load: Callable[[], Type[Plugin]]):
+        """Register *name* with a *load* callable that returns the plugin class on demand."""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown plugin kind: {kind}")
+        self._tables[kind].pop(name, None)
+        self._lazy[kind][name] = load
+
+    def _lookup(self, kind: PluginKind, name: str) -> Any:
+        table = self._tables[kind]
+        if name not in table and name in self._lazy[kind]:
+            load = self._lazy[kind].pop(name)
+            try:
+                table[name] = load()
+            except Exception as e:
+                logger.warning("Failed to load %s plugin '%s': %s", kind.value, name, e)
+                raise RegistryError(f"Plugin '{name}' could not be loaded: {e}") from e
+        return table[name]
+
+    def _names(self, kind: PluginKind):
+        return (self._lazy[kind] | self._tables[kind]).keys()
+
     def register_device_command(self, name: str, command_cls: Type[DeviceCommand]):
         """Register a DeviceCommand implementation under *name*."""
+        self._lazy[PluginKind.DEVICE_COMMAND].pop(name, None)
         self._device_commands[name] = command_cls
 
     def register_protocol(self, name: str, protocol_cls: Type[ConnectionProtocol]):
         """Register a ConnectionProtocol implementation under *name*."""
+        self._lazy[PluginKind.PROTOCOL].pop(name, None)
         self._protocols[name] = protocol_cls
 
-    def register_device_repository(self, name: str, repo_cls: Type[DeviceRepository]):
-        """Register a DeviceRepository implementation under *name*."""
+    def register_device_repository(
+        self, name: str, repo_cls: Type[DeviceRepository] | Type[AsyncDeviceRepository]
+    ):
+        """Register a DeviceRepository (or AsyncDeviceRepository) implementation under *name*."""
+        self._lazy[PluginKind.REPOSITORY].pop(name, None)
         self._repositories[name] = repo_cls
 
     def get_device_command(self, name: str) -> Type[DeviceCommand]:
         """Return the DeviceCommand class registered under *name*."""
         try:
-            return self._device_commands[name]
+            return self._lookup(PluginKind.DEVICE_COMMAND, name)
         except KeyError as e:
             raise RegistryError(f"No device command plugin named '{name}' is registered.") from e
 
     def get_protocol(self, name: str) -> type:
         try:
-            return self._protocols[name]
+            return self._lookup(PluginKind.PROTOCOL, name)
         except KeyError as e:
             raise RegistryError(
                 f"No connection protocol plugin named '{name}' is registered."
             ) from e
 
-    def get_device_repository(self, name: str) -> Type[DeviceRepository]:
-        """Return the DeviceRepository class registered under *name*."""
+    def get_device_repository(
+        self, name: str
+    ) -> Type[DeviceRepository] | Type[AsyncDeviceRepository]:
+        """Return the (sync or async) repository class registered under *name*."""
         try:
-            return self._repositories[name]
+            return self._lookup(PluginKind.REPOSITORY, name)
         except KeyError as e:
             raise RegistryError(f"No repository plugin named '{name}' is registered.") from e
 
     def all_device_commands(self):
         """Return all registered device command names."""
-        return self._device_commands.keys()
+        return self._names(PluginKind.DEVICE_COMMAND)
 
     def all_device_repositories(self):
         """Return all registered device repository names."""
-        return self._repositories.keys()
+        return self._names(PluginKind.REPOSITORY)
 
     def all_protocols(self):
         """Return all registered protocol names."""
-        return self._protocols.keys()
+        return self._names(PluginKind.PROTOCOL)
@@ -6,21 +6,38 @@ Binds the discovery layer (PluginLoader) to the in‑memory PluginRegistry.
 It resolves the list of package roots to scan based on the built‑in
 *base_path* plus any additional roots provided via the
 ``NETIMATE_EXTRA_PLUGIN_PACKAGES`` environment variable.
+
+When given a *manifest_path*, registration is lazy: packages whose plugin
+manifest is still current are registered without importing a single plugin
+module (see :mod:`netimate.core.plugin_engine.manifest`).
 """
 
+import importlib
 import logging
 import os
-from typing import Type
+from functools import reduce
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Type
 
 from netimate.core.plugin_engine.loader import PluginLoader
+from netimate.core.plugin_engine.manifest import PluginEntry, PluginManifest
 from netimate.core.plugin_engine.plugin_registry import PluginKind, PluginRegistry
 
 logger = logging.getLogger(__name__)
 
 
+def _importer(module: str, qualname: str) -> Callable[[], Type]:
+    def load() -> Type:
+        obj: Any = importlib.import_module(module)
+        return reduce(getattr, qualname.split("."), obj)
+
+    return load
+
+
 class PluginRegistrar:
-    def __init__(self, registry: PluginRegistry):
+    def __init__(self, registry: PluginRegistry, manifest_path: Optional[Path] = None):
         self.registry = registry
+        self.manifest = PluginManifest(manifest_path) if manifest_path else None
 
     def register_plugins(self, kind: PluginKind, base_path: str, interface: Type):
         """Discover and register all plugins of *kind* found under *base_path*.
@@ -31,6 +48,10 @@ class PluginRegistrar:
         """
         extra_pkgs = os.getenv("NETIMATE_EXTRA_PLUGIN_PACKAGES", "").split(":")
         pkgs = [base_path, *filter(None, extra_pkgs)]
+        if self.manifest is not None:
+            self._register_from_manifest(kind, pkgs, interface)
+            return
+
         loader = PluginLoader(pkgs, interface)
         discovered = loader.discover()
 
@@ -39,3 +60,29 @@ class PluginRegistrar:
             self.registry.register(kind, plugin.plugin_name(), plugin)
 
         logger.info(f"Registered {len(discovered)} {kind.value}(s) from {base_path}")
+
+    def _register_from_manifest(self, kind: PluginKind, pkgs: List[str], interface: Type):
+        """Register lazy loaders per package, rescanning only stale packages."""
+        assert self.manifest is not None
+        count = 0
+        for pkg in pkgs:
+            entries = self.manifest.lookup(pkg, interface)
+            if entries is None:
+                logger.info(f"Scanning {pkg} for {kind.value} plugins")
+                discovered = PluginLoader(pkg, interface).discover()
+                entries = list(
+                    dict.fromkeys(
+                        (plugin.plugin_name(), plugin.__module__, plugin.__qualname__)
+                        for plugin in discovered
+                    )
+                )
+                self.manifest.record(pkg, interface, entries)
+            count += self._register_entries(kind, entries)
+        self.manifest.save()
+        logger.info(f"Registered {count} {kind.value}(s) from {pkgs[0]} (lazy)")
+
+    def _register_entries(self, kind: PluginKind, entries: List[PluginEntry]) -> int:
+        for name, module, qualname in entries:
+            logger.debug(f"Registering lazy {kind.value} plugin: {name} ({module})")
+            self.registry.register_lazy(kind, name, _importer(module, qualname))
+        return len(entries)
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.core.retry
+-------------------
+Targeted automatic retries for transient per‑device failures.
+
+A :class:`RetryPolicy` decides, per error class, how many attempts a device
+gets and how long to wait between them: exponential backoff capped at
+``max_backoff`` with jitter, so hundreds of devices that failed together do
+not come back together and hammer the same AAA server.  Policies are set per
+connection protocol in ``plugin_configs``::
+
+    plugin_configs:
+      scrapli-asyncssh:
+        retry:
+          attempts: 3          # attempts per device, first one included
+          backoff: 1.0         # delay before the first retry (seconds)
+          multiplier: 2.0      # growth per further retry
+          max_backoff: 30
+          jitter: full         # full | equal | none
+          on:                  # optional per error class attempts
+            ConnectionTimeoutError: 3
+            ConnectionProtocolError: 2
+            AuthError: 1       # never retry bad credentials
+
+Errors are matched on the most specific class in their MRO named under
+``on``; unmatched errors are not retried.  Without ``on`` the policy retries
+``ConnectionTimeoutError`` and ``ConnectionProtocolError`` (but not
+``AuthError``) up to ``attempts`` times.
+
+A :class:`RetryBudget` caps retries across one fan‑out to ``min_retries``
+plus ``ratio`` × devices started, so a systemic outage turns into fast
+failures instead of a retry storm::
+
+    runner:
+      retry_budget:
+        ratio: 0.1
+        min_retries: 10
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Optional
+
+from netimate.errors import ConfigError
+
+DEFAULT_BACKOFF = 1.0
+DEFAULT_MULTIPLIER = 2.0
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_BUDGET_RATIO = 0.1
+DEFAULT_BUDGET_MIN_RETRIES = 10
+JITTER_MODES = ("full", "equal", "none")
+
+
+def _number(name: str, value: Any, minimum: float = 0.0) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+        raise ConfigError(f"Retry setting '{name}' must be a number >= {minimum:g}, got {value!r}")
+    return float(value)
+
+
+def _attempts(name: str, value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ConfigError(f"Retry setting '{name}' must be an integer >= 1, got {value!r}")
+    return value
+
+
+class RetryPolicy:
+    """Per error class attempt limits plus exponential backoff with jitter."""
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, int]] = None,
+        backoff: float = DEFAULT_BACKOFF,
+        multiplier: float = DEFAULT_MULTIPLIER,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: str = "full",
+        rng: Optional[random.Random] = None,
+    ):
+        if jitter not in JITTER_MODES:
+            raise ConfigError(
+                f"Retry setting 'jitter' must be one of {JITTER_MODES}, got {jitter!r}"
+            )
+        self.rules = dict(rules or {})
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+
+    @classmethod
+    def from_config(cls, retry_config: Optional[Dict[str, Any]]) -> "RetryPolicy":
+        """Build a policy from a protocol's ``retry`` block (``None`` = never retry)."""
+        if not retry_config:
+            return cls()
+        if not isinstance(retry_config, dict):
+            raise ConfigError("Retry settings must be a mapping")
+        attempts = _attempts("attempts", retry_config.get("attempts", 3))
+        on = retry_config.get("on")
+        if on is None:
+            rules = {
+                "ConnectionTimeoutError": attempts,
+                "ConnectionProtocolError": attempts,
+                "AuthError": 1,
+            }
+        elif isinstance(on, dict):
+            rules = {str(name): _attempts(f"on.{name}", value) for name, value in on.items()}
+        else:
+            raise ConfigError("Retry setting 'on' must be a mapping of error class -> attempts")
+        return cls(
+            rules,
+            backoff=_number("backoff", retry_config.get("backoff", DEFAULT_BACKOFF)),
+            multiplier=_number("multiplier", retry_config.get("multiplier", DEFAULT_MULTIPLIER), 1),
+            max_backoff=_number(
+                "max_backoff", retry_config.get("max_backoff", DEFAULT_MAX_BACKOFF)
+            ),
+            jitter=retry_config.get("jitter", "full"),
+        )
+
+    def attempts_for(self, err: BaseException) -> int:
+        """Total attempts allowed when an attempt fails with *err*."""
+        for cls in type(err).__mro__:
+            if cls.__name__ in self.rules:
+                return self.rules[cls.__name__]
+        return 1
+
+    def delay(self, err: BaseException, attempt: int) -> Optional[float]:
+        """
+        Return the wait before attempt ``attempt + 1`` after attempt *attempt*
+        (1‑based) failed with *err*, or ``None`` if *err* is not retried again.
+        """
+        if attempt >= self.attempts_for(err):
+            return None
+        ceiling = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        if self.jitter == "full":
+            return self._rng.uniform(0, ceiling)
+        if self.jitter == "equal":
+            return ceiling / 2 + self._rng.uniform(0, ceiling / 2)
+        return ceiling
+
+
+class RetryBudget:
+    """Caps retries in one fan‑out to ``min_retries + ratio × devices started``."""
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_BUDGET_RATIO,
+        min_retries: int = DEFAULT_BUDGET_MIN_RETRIES,
+    ):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.started = 0
+        self.retries = 0
+
+    @classmethod
+    def from_config(cls, budget_config: Optional[Dict[str, Any]]) -> "RetryBudget":
+        """Build a budget from the ``runner.retry_budget`` settings block."""
+        config = budget_config or {}
+        min_retries = config.get("min_retries", DEFAULT_BUDGET_MIN_RETRIES)
+        if isinstance(min_retries, bool) or not isinstance(min_retries, int) or min_retries < 0:
+            raise ConfigError(
+                f"Runner setting 'retry_budget.min_retries' must be >= 0, got {min_retries!r}"
+            )
+        return cls(
+            _number("retry_budget.ratio", config.get("ratio", DEFAULT_BUDGET_RATIO)), min_retries
+        )
+
+    def start(self) -> None:
+        """Record a device's first attempt."""
+        self.started += 1
+
+    def spend(self) -> bool:
+        """Take one retry from the budget; ``False`` when it is exhausted."""
+        if self.retries >= self.min_retries + self.ratio * self.started:
+            return False
+        self.retries += 1
+        return True
@@ -1,9 +1,26 @@
 # SPDX-License-Identifier: MPL-2.0
 import asyncio
 import logging
-from typing import Any, Dict, List, Tuple
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from netimate.errors import NetimateError, RunnerError
+from netimate.core.circuit_breaker import CircuitBreakerRegistry
+from netimate.core.connection_pool import ConnectionPool
+from netimate.core.retry import RetryBudget, RetryPolicy
+from netimate.core.scheduler import Scheduler
+from netimate.core.timeouts import TimeoutPolicy, Timeouts
+from netimate.errors import CircuitOpenError, ConnectionTimeoutError, NetimateError, RunnerError
 from netimate.interfaces.core.runner import RunnerInterface
 from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
 from netimate.interfaces.plugin.device_command import DeviceCommand
@@ -12,35 +29,293 @@ from netimate.models.device import Device
 logger = logging.getLogger(__name__)
 
 
+def _command_name(command: DeviceCommand) -> Optional[str]:
+    try:
+        return command.plugin_name()
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _check_unique(commands: Sequence[DeviceCommand]) -> None:
+    """Results are keyed by plugin name, so a repeated command would lose output."""
+    names = [command.plugin_name() for command in commands]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Commands listed more than once: {', '.join(duplicates)}")
+
+
 class Runner(RunnerInterface):
     """
     Orchestrates parallel command execution across multiple devices.
-    Selects appropriate runner per device using RunnerSelector.
+    Fans work out through a bounded :class:`Scheduler`, reuses logged‑in
+    sessions through a :class:`ConnectionPool`, bounds every device by the
+    deadlines of a :class:`TimeoutPolicy` and retries transient connection
+    failures per the protocol's :class:`RetryPolicy` within a fan‑out wide
+    :class:`RetryBudget`.  Devices that keep failing are skipped for a while
+    by a :class:`CircuitBreakerRegistry`.  All of it is configured from the
+    ``runner`` settings block (retry policies from ``plugin_configs``).
     """
 
-    def __init__(self, plugin_configs: Dict[str, Any]):
+    def __init__(self, plugin_configs: Dict[str, Any], runner_config: Optional[Dict] = None):
         self.plugin_configs = plugin_configs
+        self.runner_config = runner_config or {}
+        self._scheduler = Scheduler.from_config(self.runner_config)
+        self._pool = ConnectionPool.from_config(self.runner_config.get("pool"))
+        self._timeouts = TimeoutPolicy.from_config(self.runner_config.get("timeouts"))
+        RetryBudget.from_config(self.runner_config.get("retry_budget"))  # validate early
+        self._retry_policies: Dict[str, RetryPolicy] = {}
+        self._breakers = CircuitBreakerRegistry.from_config(
+            self.runner_config.get("circuit_breaker")
+        )
 
     async def run(
         self, device_protocols: List[Tuple[Device, ConnectionProtocol]], command: DeviceCommand
     ) -> (List)[dict[str, Any]]:
         """
-        Executes the command on all devices concurrently using their associated protocol instances.
+        Executes the command on all devices concurrently using their associated protocol instances,
+        never working on more devices at once than the scheduler's limits allow.
+
+        Returns:
+            A list of results (or errors) per device, in input order.
+        """
+
+        budget = self._retry_budget()
+
+        async def work(device: Device, protocol: ConnectionProtocol) -> Dict[str, Any]:
+            return await self._run_on_device(device, protocol, command, budget)
+
+        return await self._scheduler.run(device_protocols, work)
+
+    async def stream(
+        self,
+        device_protocols: Iterable[Tuple[Device, ConnectionProtocol]],
+        command: DeviceCommand,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Executes the command like :meth:`run` but yields each per‑device result
+        as soon as that device finishes, so callers can render or persist it
+        without waiting for (or holding) the whole fan‑out.
+
+        *device_protocols* may be any iterable, including a lazy generator.
+        """
+
+        budget = self._retry_budget()
+
+        async def work(device: Device, protocol: ConnectionProtocol) -> Dict[str, Any]:
+            return await self._run_on_device(device, protocol, command, budget)
+
+        async with aclosing(self._scheduler.stream(device_protocols, work)) as results:
+            async for result in results:
+                yield result
+
+    async def run_many(
+        self,
+        device_protocols: List[Tuple[Device, ConnectionProtocol]],
+        commands: Sequence[DeviceCommand],
+    ) -> List[dict[str, Any]]:
+        """
+        Executes every command in *commands* on each device over a single session.
+
+        Devices are still fanned out concurrently through the scheduler; on each
+        device the commands run back to back and each output is parsed while
+        the next command is in flight.
 
         Returns:
-            A list of results (or errors) per device.
+            A list of per‑device results, in input order, whose ``result`` maps
+            each command's plugin name to its parsed output (or error message).
+
+        Raises:
+            ValueError: if *commands* holds the same command more than once.
         """
-        tasks = [
-            self._run_on_device(device, protocol, command) for device, protocol in device_protocols
-        ]
-        return await asyncio.gather(*tasks)
+
+        _check_unique(commands)
+        budget = self._retry_budget()
+
+        async def work(device: Device, protocol: ConnectionProtocol) -> Dict[str, Any]:
+            return await self._run_many_on_device(device, protocol, commands, budget)
+
+        return await self._scheduler.run(device_protocols, work)
+
+    async def stream_many(
+        self,
+        device_protocols: Iterable[Tuple[Device, ConnectionProtocol]],
+        commands: Sequence[DeviceCommand],
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Executes *commands* like :meth:`run_many` but yields each per‑device
+        result as soon as that device has run (and parsed) the whole set.
+        """
+        _check_unique(commands)
+        budget = self._retry_budget()
+
+        async def work(device: Device, protocol: ConnectionProtocol) -> Dict[str, Any]:
+            return await self._run_many_on_device(device, protocol, commands, budget)
+
+        async with aclosing(self._scheduler.stream(device_protocols, work)) as results:
+            async for result in results:
+                yield result
+
+    async def close(self) -> None:
+        """Disconnect every pooled session."""
+        await self._pool.close()
+
+    def circuit_breakers(self) -> List[Dict[str, Any]]:
+        """Return the state of every open, half‑open or failing circuit breaker."""
+        return self._breakers.snapshot()
+
+    async def _guarded(
+        self, device: Device, work: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Run *work* for *device* unless its circuit breaker is open, and record
+        the outcome against the breaker.
+        """
+        try:
+            self._breakers.check(device)
+        except CircuitOpenError as err:
+            logger.info("[Runner] %s", err)
+            return self._failure(device, err)
+        try:
+            result = await work()
+        except BaseException:
+            self._breakers.release(device)
+            raise
+        self._breakers.record(device, result["error_type"])
+        return result
+
+    def _retry_budget(self) -> RetryBudget:
+        """Return a fresh budget shared by every device of one fan‑out."""
+        return RetryBudget.from_config(self.runner_config.get("retry_budget"))
+
+    def _retry_policy(self, device: Device) -> RetryPolicy:
+        """Return (and cache) the retry policy of *device*'s connection protocol."""
+        name = device.protocol
+        policy = self._retry_policies.get(name)
+        if policy is None:
+            protocol_config = self.plugin_configs.get(name)
+            retry_config = (
+                protocol_config.get("retry") if isinstance(protocol_config, dict) else None
+            )
+            policy = self._retry_policies[name] = RetryPolicy.from_config(retry_config)
+        return policy
+
+    async def _backoff(
+        self,
+        device: Device,
+        err: Exception,
+        attempt: int,
+        budget: Optional[RetryBudget],
+    ) -> bool:
+        """
+        Wait before retrying *device* after its *attempt*‑th attempt failed with
+        *err*.  Returns ``False`` without waiting when the error is not retried
+        (again) or the fan‑out's retry budget is spent.
+        """
+        delay = self._retry_policy(device).delay(err, attempt)
+        if delay is None:
+            return False
+        if budget is not None and not budget.spend():
+            logger.warning("[Runner] Retry budget exhausted; not retrying %s", device.name)
+            return False
+        logger.info(
+            "[Runner] Attempt %d on %s failed (%s); retrying in %.2fs",
+            attempt,
+            device.name,
+            err.__class__.__name__,
+            delay,
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    @staticmethod
+    def _failure(device: Device, err: Exception) -> Dict[str, Any]:
+        """Shape *err* into the standard failed per‑device result."""
+        if isinstance(err, NetimateError):
+            # Expected, domain‑specific failure (connection, auth, registry, etc.)
+            logger.warning("Netimate error on %s: %s", device.name, err)
+            return {
+                "device": device.name,
+                "success": False,
+                "result": str(err),
+                "error": str(err),
+                "error_type": err.__class__.__name__,
+            }
+
+        # Unexpected bug – wrap in RunnerError so upper layers stay clean
+        logger.exception("Unexpected error on %s", device.name, exc_info=err)
+        wrapped = RunnerError("Unexpected runner failure")
+        wrapped.__cause__ = err
+        return {
+            "device": device.name,
+            "success": False,
+            "result": str(err),
+            "error": str(wrapped),
+            "error_type": "RunnerError",
+        }
+
+    @staticmethod
+    async def _send(
+        session: ConnectionProtocol, device: Device, command_string: str, timeout: Optional[float]
+    ) -> str:
+        """Send one command, raising :class:`ConnectionTimeoutError` after *timeout* seconds."""
+        try:
+            return await asyncio.wait_for(session.send_command(command_string), timeout)
+        except asyncio.TimeoutError as err:
+            raise ConnectionTimeoutError(
+                f"Command '{command_string}' on {device.name} timed out after {timeout:g}s"
+            ) from err
+
+    @staticmethod
+    def _deadline_exceeded(device: Device, total: Optional[float]) -> ConnectionTimeoutError:
+        return ConnectionTimeoutError(f"{device.name} did not finish within {total:g}s")
 
     async def _run_on_device(
-        self, device: Device, protocol: ConnectionProtocol, command: DeviceCommand
+        self,
+        device: Device,
+        protocol: ConnectionProtocol,
+        command: DeviceCommand,
+        budget: Optional[RetryBudget] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run :meth:`_execute_on_device` under the device's overall deadline,
+        which also bounds any retries, unless its circuit breaker is open.
+
+        When the deadline passes the work is cancelled (the session is
+        discarded, not pooled) and a ``ConnectionTimeoutError`` failure is
+        returned for the device.
+        """
+        timeouts = self._timeouts.resolve(device.platform, _command_name(command))
+
+        async def work() -> Dict[str, Any]:
+            if budget is not None:
+                budget.start()
+            try:
+                return await asyncio.wait_for(
+                    self._execute_on_device(device, protocol, command, timeouts, budget),
+                    timeouts.total,
+                )
+            except asyncio.TimeoutError:
+                return self._failure(device, self._deadline_exceeded(device, timeouts.total))
+
+        return await self._guarded(device, work)
+
+    async def _execute_on_device(
+        self,
+        device: Device,
+        protocol: ConnectionProtocol,
+        command: DeviceCommand,
+        timeouts: Timeouts,
+        budget: Optional[RetryBudget] = None,
     ) -> Dict[str, Any]:
         """
         Execute *command* on *device* using the provided *protocol* instance and return a structured per‑device result.
 
+        *protocol* is only connected when the pool holds no reusable session for
+        *device*; the session is returned to the pool afterwards, or discarded
+        if anything went wrong while it was checked out.  Transport failures
+        are retried on the same *protocol* instance as the device's
+        :class:`RetryPolicy` and *budget* allow; parse failures never are.
+
         The method guarantees that no third‑party exceptions leak; any unexpected
         error is wrapped as ``RunnerError``.  The shape of the returned dict is::
 
@@ -59,16 +334,21 @@ class Runner(RunnerInterface):
         )
 
         try:
-            await protocol.connect()
-            logger.debug("Connected to %s", device.host)
-
-            raw_output = await protocol.send_command(command.command_string())
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    async with self._pool.session(device, protocol, timeouts.connect) as session:
+                        raw_output = await self._send(
+                            session, device, command.command_string(), timeouts.command
+                        )
+                    break
+                except Exception as err:  # pylint: disable=broad-except
+                    if not await self._backoff(device, err, attempt, budget):
+                        raise
             logger.debug("Raw output: %s", raw_output)
 
-            await protocol.disconnect()
-            logger.debug("Disconnected from %s", device.host)
-
-            parsed = command.parse(raw_output)
+            parsed = await command.parse_async(raw_output)
             logger.info("Parsed result for %s: %s", device.name, parsed)
 
             return {
@@ -79,26 +359,113 @@ class Runner(RunnerInterface):
                 "error_type": None,
             }
 
-        except NetimateError as err:
-            # Expected, domain‑specific failure (connection, auth, registry, etc.)
-            logger.warning("Netimate error on %s: %s", device.name, err)
-            return {
-                "device": device.name,
-                "success": False,
-                "result": str(err),
-                "error": str(err),
-                "error_type": err.__class__.__name__,
-            }
-
         except Exception as err:  # pylint: disable=broad-except
-            # Unexpected bug – wrap in RunnerError so upper layers stay clean
-            logger.exception("Unexpected error on %s", device.name, exc_info=err)
-            wrapped = RunnerError("Unexpected runner failure")
-            wrapped.__cause__ = err
-            return {
-                "device": device.name,
-                "success": False,
-                "result": str(err),
-                "error": str(wrapped),
-                "error_type": "RunnerError",
-            }
+            return self._failure(device, err)
+
+    async def _run_many_on_device(
+        self,
+        device: Device,
+        protocol: ConnectionProtocol,
+        commands: Sequence[DeviceCommand],
+        budget: Optional[RetryBudget] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run :meth:`_execute_many_on_device` under the device's overall deadline
+        unless its circuit breaker is open; on expiry (or an open breaker)
+        every command reports the error.  The deadline and the connect limit
+        are the most lenient of the commands' own (see
+        :meth:`TimeoutPolicy.resolve_many`).
+        """
+        timeouts = self._timeouts.resolve_many(
+            device.platform, [command.plugin_name() for command in commands]
+        )
+
+        async def work() -> Dict[str, Any]:
+            if budget is not None:
+                budget.start()
+            try:
+                return await asyncio.wait_for(
+                    self._execute_many_on_device(device, protocol, commands, timeouts, budget),
+                    timeouts.total,
+                )
+            except asyncio.TimeoutError:
+                return self._failure(device, self._deadline_exceeded(device, timeouts.total))
+
+        result = await self._guarded(device, work)
+        if not isinstance(result["result"], dict):
+            result["result"] = {command.plugin_name(): result["result"] for command in commands}
+        return result
+
+    async def _execute_many_on_device(
+        self,
+        device: Device,
+        protocol: ConnectionProtocol,
+        commands: Sequence[DeviceCommand],
+        timeouts: Timeouts,
+        budget: Optional[RetryBudget] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute *commands* in order over one session on *device*, connecting
+        within ``timeouts.connect``; each send gets its own command's limit.
+
+        A parse failure only affects its own command.  A transport failure
+        discards the session; if the retry policy allows, a new session picks
+        up from the command that failed, otherwise the failure is reported for
+        every command that had not completed yet.  ``success``/``error``/
+        ``error_type`` describe the transport failure if there was one (it is
+        what the circuit breaker counts), else the first parse failure;
+        ``result`` always holds one entry per command.
+        """
+        logger.info("[Runner] Running %d command(s) on '%s'", len(commands), device.name)
+        results: Dict[str, Any] = {}
+        first_failure: Optional[Dict[str, Any]] = None
+        transport_failure: Optional[Dict[str, Any]] = None
+        # Each output is parsed in the background while the next command is
+        # already in flight on the session; parses[i] belongs to commands[i].
+        parses: List[asyncio.Future] = []
+
+        attempt = 0
+        try:
+            while len(parses) < len(commands):
+                attempt += 1
+                try:
+                    async with self._pool.session(device, protocol, timeouts.connect) as session:
+                        for command in commands[len(parses) :]:
+                            name = command.plugin_name()
+                            raw_output = await self._send(
+                                session,
+                                device,
+                                command.command_string(),
+                                self._timeouts.resolve(device.platform, name).command,
+                            )
+                            logger.debug("Raw output for '%s': %s", name, raw_output)
+                            parses.append(asyncio.ensure_future(command.parse_async(raw_output)))
+                except Exception as err:  # pylint: disable=broad-except
+                    if not await self._backoff(device, err, attempt, budget):
+                        transport_failure = self._failure(device, err)
+                        break
+
+            for command, parse in zip(commands, parses):
+                try:
+                    results[command.plugin_name()] = await parse
+                except Exception as err:  # pylint: disable=broad-except
+                    failure = self._failure(device, err)
+                    first_failure = first_failure or failure
+                    results[command.plugin_name()] = failure["result"]
+        finally:
+            # Also reached when the device deadline cancels us mid‑send.
+            for parse in parses:
+                parse.cancel()
+
+        if transport_failure is not None:
+            first_failure = transport_failure
+            for command in commands:
+                results.setdefault(command.plugin_name(), transport_failure["result"])
+
+        return {
+            "device": device.name,
+            "success": first_failure is None,
+            "result": results,
+            "error": first_failure["error"] if first_failure else None,
+            "error_type": first_failure["error_type"] if first_failure else None,
+        }
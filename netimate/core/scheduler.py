@@ -0,0 +1,297 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.core.scheduler
+-----------------------
+Bounded‑concurrency work‑queue scheduler used by the Runner to fan a job out
+across many devices without opening every session at once.
+
+A dispatcher pulls ``(device, payload)`` jobs lazily from the input iterable
+and starts one task per job, never more than the global limit at once, so the
+number of live coroutines (and therefore sockets, file descriptors and AAA
+requests) stays bounded however large the fleet is.  Optional per‑site and
+per‑platform limits further cap how many devices sharing the same site or
+platform are worked on at the same time.
+
+A job only takes a global slot once its site and platform limits admit it.
+A job whose site is saturated waits in a bounded look‑ahead buffer while
+runnable jobs behind it (other sites) are started, so one busy site never
+idles the rest of the fan‑out.  Waiting jobs are queued under the limit that
+stopped them and only that queue is revisited when the limit frees up, so
+dispatch cost does not grow with the size of the buffer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Sized
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from netimate.errors import ConfigError
+from netimate.models.device import Device
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_LIMIT_KEY = "default"
+LOOKAHEAD_FACTOR = 8  # blocked jobs buffered per global slot
+
+_DONE = object()  # end‑of‑stream marker for Scheduler.stream
+
+_Key = Tuple[str, str]  # ("site" | "platform", name)
+
+
+def _validate_limit(name: str, value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ConfigError(f"Runner setting '{name}' must be a positive integer, got {value!r}")
+    return value
+
+
+def _validate_limits(name: str, limits: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    if not limits:
+        return {}
+    if not isinstance(limits, dict):
+        raise ConfigError(f"Runner setting '{name}' must be a mapping of name -> limit")
+    return {str(key): _validate_limit(f"{name}.{key}", value) for key, value in limits.items()}
+
+
+class _KeyedLimiter:
+    """Per‑run in‑use counters keyed by site and platform.
+
+    Admission is non‑blocking: the dispatcher asks which limit, if any, stops
+    a device from starting now and parks it on that limit instead of waiting.
+    """
+
+    def __init__(self, site_limits: Dict[str, int], platform_limits: Dict[str, int]):
+        self._limits = {"site": site_limits, "platform": platform_limits}
+        self._in_use: Dict[_Key, int] = {}
+
+    def _keys(self, device: Device) -> List[Tuple[_Key, int]]:
+        keys = []
+        for kind, key in (("site", device.site), ("platform", device.platform)):
+            if not key:
+                continue
+            limits = self._limits[kind]
+            limit = limits.get(key, limits.get(DEFAULT_LIMIT_KEY))
+            if limit is not None:
+                keys.append(((kind, key), limit))
+        return keys
+
+    def blocker(self, device: Device) -> Optional[_Key]:
+        """Return the first saturated limit that applies to *device*, else ``None``."""
+        for key, limit in self._keys(device):
+            if self._in_use.get(key, 0) >= limit:
+                return key
+        return None
+
+    def acquire(self, device: Device) -> None:
+        for key, _ in self._keys(device):
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+
+    def release(self, device: Device) -> List[_Key]:
+        """Give back *device*'s slots and return the limits that were freed."""
+        keys = [key for key, _ in self._keys(device)]
+        for key in keys:
+            self._in_use[key] -= 1
+        return keys
+
+
+class Scheduler:
+    """
+    Work‑queue scheduler with a global concurrency limit plus optional
+    per‑site and per‑platform limits.
+
+    Limits are read from the ``runner`` block of ``settings.yaml``::
+
+        runner:
+          max_concurrency: 100      # global cap on devices worked in parallel
+          site_limits:
+            default: 25             # applies to every site not listed
+            dc1: 50
+          platform_limits:
+            nxos: 10
+
+    Limits apply per fan‑out (one call to :meth:`run` or :meth:`stream`).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        site_limits: Optional[Dict[str, int]] = None,
+        platform_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.max_concurrency = _validate_limit("max_concurrency", max_concurrency)
+        self.site_limits = _validate_limits("site_limits", site_limits)
+        self.platform_limits = _validate_limits("platform_limits", platform_limits)
+
+    @classmethod
+    def from_config(cls, runner_config: Optional[Dict[str, Any]]) -> "Scheduler":
+        """Build a scheduler from the ``runner`` settings block (may be ``None``)."""
+        runner_config = runner_config or {}
+        return cls(
+            max_concurrency=runner_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+            site_limits=runner_config.get("site_limits"),
+            platform_limits=runner_config.get("platform_limits"),
+        )
+
+    def _worker_count(self, jobs: Iterable[Any]) -> int:
+        if isinstance(jobs, Sized):
+            return max(1, min(self.max_concurrency, len(jobs)))
+        return self.max_concurrency
+
+    async def _drive(
+        self,
+        jobs: Iterable[Tuple[Device, P]],
+        worker: Callable[[Device, P], Awaitable[R]],
+        emit: Callable[[int, R], Awaitable[None]],
+    ) -> None:
+        """Run *worker* over *jobs* and hand each ``(index, result)`` to *emit*."""
+        worker_count = self._worker_count(jobs)
+        lookahead = worker_count * LOOKAHEAD_FACTOR
+        limiter = _KeyedLimiter(self.site_limits, self.platform_limits)
+        source = enumerate(jobs)
+        exhausted = False
+        # Jobs waiting on a site/platform limit, queued (input order) under the
+        # limit that stopped them.  ``woken`` holds the limits freed since their
+        # queue was last drained; it is an insertion‑ordered set.
+        blocked: Dict[_Key, deque] = {}
+        blocked_count = 0
+        woken: Dict[_Key, None] = {}
+        active: Dict[asyncio.Future, Tuple[int, Device]] = {}
+
+        def start(index: int, device: Device, payload: P) -> None:
+            limiter.acquire(device)
+            active[asyncio.ensure_future(worker(device, payload))] = (index, device)
+
+        def park(key: _Key, job: Tuple[int, Device, P]) -> None:
+            blocked.setdefault(key, deque()).append(job)
+
+        def drain(key: _Key) -> bool:
+            """Start what *key*'s queue can; return ``True`` once nothing more can run."""
+            nonlocal blocked_count
+            queue = blocked.get(key)
+            while queue and len(active) < worker_count:
+                index, device, payload = queue[0]
+                stopper = limiter.blocker(device)
+                if stopper == key:
+                    return True  # still saturated; wait for the next release
+                queue.popleft()
+                if stopper is None:
+                    blocked_count -= 1
+                    start(index, device, payload)
+                else:
+                    park(stopper, (index, device, payload))  # now waiting on its other limit
+            if not queue:
+                blocked.pop(key, None)
+                return True
+            return False  # out of global slots; resume on the next completion
+
+        logger.debug("[Scheduler] Starting fan‑out with up to %d worker(s)", worker_count)
+        try:
+            while True:
+                # Blocked jobs whose limit freed up first, then fresh ones from the source.
+                while woken and len(active) < worker_count:
+                    key = next(iter(woken))
+                    if not drain(key):
+                        break
+                    del woken[key]
+                while not exhausted and len(active) < worker_count and blocked_count < lookahead:
+                    try:
+                        index, (device, payload) = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    stopper = limiter.blocker(device)
+                    if stopper is None:
+                        start(index, device, payload)
+                    else:
+                        blocked_count += 1
+                        park(stopper, (index, device, payload))
+
+                if not active:
+                    break  # nothing running means nothing can be blocked either
+                done, _ = await asyncio.wait(active, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, device = active.pop(task)
+                    for key in limiter.release(device):
+                        if key in blocked:
+                            woken[key] = None
+                    await emit(index, task.result())
+        finally:
+            for task in active:
+                task.cancel()
+            await asyncio.gather(*active, return_exceptions=True)
+
+    async def run(
+        self,
+        jobs: Iterable[Tuple[Device, P]],
+        worker: Callable[[Device, P], Awaitable[R]],
+    ) -> List[R]:
+        """
+        Apply *worker* to every ``(device, payload)`` job and return the results
+        in input order.
+
+        The worker is expected to handle its own errors; an exception escaping
+        it aborts the whole fan‑out and is re‑raised after the remaining
+        workers have been cancelled.
+        """
+        results: Dict[int, R] = {}
+
+        async def emit(index: int, result: R) -> None:
+            results[index] = result
+
+        await self._drive(jobs, worker, emit)
+        return [results[index] for index in range(len(results))]
+
+    async def stream(
+        self,
+        jobs: Iterable[Tuple[Device, P]],
+        worker: Callable[[Device, P], Awaitable[R]],
+    ) -> AsyncGenerator[R, None]:
+        """
+        Apply *worker* to every ``(device, payload)`` job and yield each result
+        as soon as it is ready (completion order, not input order).
+
+        At most one result per worker is buffered, so a slow consumer applies
+        back‑pressure instead of letting results pile up in memory.  Leaving
+        the loop early cancels the outstanding work.
+        """
+        output: asyncio.Queue = asyncio.Queue(maxsize=self._worker_count(jobs))
+
+        async def emit(_: int, result: R) -> None:
+            await output.put(result)
+
+        async def drive() -> None:
+            try:
+                await self._drive(jobs, worker, emit)
+            except asyncio.CancelledError:
+                raise  # consumer left early; nobody is waiting for _DONE
+            except BaseException:
+                await output.put(_DONE)
+                raise
+            await output.put(_DONE)
+
+        driver = asyncio.ensure_future(drive())
+        try:
+            while (item := await output.get()) is not _DONE:
+                yield item
+            await driver
+        finally:
+            if not driver.done():
+                driver.cancel()
+                await asyncio.gather(driver, return_exceptions=True)
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.core.timeouts
+----------------------
+Connect, command and overall per‑device deadlines for the Runner.
+
+Without deadlines of its own a fan‑out lasts as long as the slowest device's
+transport defaults allow.  :class:`TimeoutPolicy` resolves three limits for
+every device/command pair:
+
+* ``connect`` – opening (and authenticating) a new session,
+* ``command`` – one ``send_command`` round trip,
+* ``total``   – everything done for the device in one call, parsing included.
+
+Values are layered global < platform < command plugin, each layer overriding
+only the keys it sets.  Unset (or ``null``) means no limit.  Several commands
+sent over one session get the most lenient ``connect`` and ``total`` of the
+set, so a long‑running command keeps its allowance when batched.  Configured through
+the ``runner.timeouts`` block of ``settings.yaml``::
+
+    runner:
+      timeouts:
+        connect: 15
+        command: 60
+        total: 300
+        platforms:
+          ios-xr: {command: 120}
+        commands:
+          show-running-config: {command: 180, total: 240}
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from netimate.errors import ConfigError
+
+_KEYS = ("connect", "command", "total")
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """Resolved limits in seconds (``None`` = unlimited)."""
+
+    connect: Optional[float] = None
+    command: Optional[float] = None
+    total: Optional[float] = None
+
+    def merged(self, override: "Timeouts") -> "Timeouts":
+        """Return a copy with every limit *override* sets replacing ours."""
+        values = {
+            f.name: (
+                getattr(override, f.name)
+                if getattr(override, f.name) is not None
+                else getattr(self, f.name)
+            )
+            for f in fields(self)
+        }
+        return Timeouts(**values)
+
+    def widened(self, other: "Timeouts") -> "Timeouts":
+        """Return the larger of each limit (``None``, unlimited, wins)."""
+        values = {
+            f.name: (
+                None
+                if getattr(self, f.name) is None or getattr(other, f.name) is None
+                else max(getattr(self, f.name), getattr(other, f.name))
+            )
+            for f in fields(self)
+        }
+        return Timeouts(**values)
+
+
+def _seconds(name: str, value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ConfigError(f"Runner setting '{name}' must be a positive number, got {value!r}")
+    return float(value)
+
+
+def _timeouts(name: str, config: Any) -> Timeouts:
+    if not isinstance(config, dict):
+        raise ConfigError(f"Runner setting '{name}' must be a mapping of connect/command/total")
+    unknown = set(config) - set(_KEYS)
+    if unknown:
+        raise ConfigError(f"Unknown keys in runner setting '{name}': {sorted(unknown)}")
+    return Timeouts(**{key: _seconds(f"{name}.{key}", config.get(key)) for key in _KEYS})
+
+
+def _layer(name: str, config: Any) -> Dict[str, Timeouts]:
+    if not config:
+        return {}
+    if not isinstance(config, dict):
+        raise ConfigError(f"Runner setting '{name}' must be a mapping of name -> timeouts")
+    return {str(key): _timeouts(f"{name}.{key}", value) for key, value in config.items()}
+
+
+class TimeoutPolicy:
+    """Resolve :class:`Timeouts` for a platform and command plugin."""
+
+    def __init__(
+        self,
+        default: Optional[Timeouts] = None,
+        platforms: Optional[Dict[str, Timeouts]] = None,
+        commands: Optional[Dict[str, Timeouts]] = None,
+    ):
+        self.default = default or Timeouts()
+        self.platforms = platforms or {}
+        self.commands = commands or {}
+        self._resolved: Dict[Tuple[Optional[str], Optional[str]], Timeouts] = {}
+
+    @classmethod
+    def from_config(cls, timeouts_config: Optional[Dict[str, Any]]) -> "TimeoutPolicy":
+        """Build a policy from the ``runner.timeouts`` settings block (may be ``None``)."""
+        config = dict(timeouts_config or {})
+        platforms = _layer("timeouts.platforms", config.pop("platforms", None))
+        commands = _layer("timeouts.commands", config.pop("commands", None))
+        return cls(_timeouts("timeouts", config), platforms, commands)
+
+    def resolve(self, platform: Optional[str], command: Optional[str] = None) -> Timeouts:
+        """Return the limits for *command* on a device of *platform*."""
+        key = (platform, command)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = self.default
+            if platform in self.platforms:
+                resolved = resolved.merged(self.platforms[platform])
+            if command in self.commands:
+                resolved = resolved.merged(self.commands[command])
+            self._resolved[key] = resolved
+        return resolved
+
+    def resolve_many(self, platform: Optional[str], commands: Iterable[str]) -> Timeouts:
+        """Return limits that fit every one of *commands* run back to back on *platform*."""
+        resolved: Optional[Timeouts] = None
+        for command in commands:
+            limits = self.resolve(platform, command)
+            resolved = limits if resolved is None else resolved.widened(limits)
+        return resolved or self.resolve(platform)
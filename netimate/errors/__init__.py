@@ -8,7 +8,12 @@ from .base import NetimateError
 from .cli import CliUsageError
 from .command import CommandError
 from .config import ConfigError
-from .connection import AuthError, ConnectionProtocolError, ConnectionTimeoutError
+from .connection import (
+    AuthError,
+    CircuitOpenError,
+    ConnectionProtocolError,
+    ConnectionTimeoutError,
+)
 from .registry import RegistryError
 from .runner import RunnerError
 from .shell import ShellRuntimeError
@@ -21,6 +26,7 @@ __all__ = [
     "ConnectionProtocolError",
     "AuthError",
     "ConnectionTimeoutError",
+    "CircuitOpenError",
     "RegistryError",
     "RunnerError",
     "ShellRuntimeError",
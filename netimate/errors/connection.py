@@ -22,3 +22,9 @@ class ConnectionTimeoutError(ConnectionProtocolError):
     """Operation timed out."""
 
     default_message = "Connection timed out"
+
+
+class CircuitOpenError(ConnectionProtocolError):
+    """Device skipped because its circuit breaker is open."""
+
+    default_message = "Circuit breaker open"
@@ -55,6 +55,10 @@ class ConfigLoader:
                 log_level=data["log_level"],
                 template_paths=data["template_paths"],
                 plugin_configs=data.get("plugin_configs"),
+                runner_config=data.get("runner"),
+                parsing_config=data.get("parsing"),
+                inventory_config=data.get("inventory"),
+                diagnostic_config=data.get("diagnostic"),
             )
         except KeyError as e:
             raise ValueError(f"Missing required config value: {e}")
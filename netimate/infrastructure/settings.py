@@ -21,6 +21,10 @@ class SettingsImpl(SettingsInterface):
         log_level: str,
         template_paths: list[str],
         plugin_configs: Dict | None = None,
+        runner_config: Dict | None = None,
+        parsing_config: Dict | None = None,
+        inventory_config: Dict | None = None,
+        diagnostic_config: Dict | None = None,
     ):
         """
         Parameters
@@ -36,6 +40,17 @@ class SettingsImpl(SettingsInterface):
         plugin_configs:
             Optional mapping passed verbatim to plugin constructors so each
             plugin can read its own configuration block.
+        runner_config:
+            Optional ``runner`` block (concurrency limits etc.) forwarded to
+            the core Runner.
+        parsing_config:
+            Optional ``parsing`` block (executor type, worker count, batching)
+            for the template provider's parse executor.
+        inventory_config:
+            Optional ``inventory`` block (cache TTL, change-check interval)
+            for the application's inventory cache.
+        diagnostic_config:
+            Optional ``diagnostic`` block (the command set ``diagnostic`` runs).
         """
         self._device_repo = device_repo
         self._log_level = log_level
@@ -44,6 +59,10 @@ class SettingsImpl(SettingsInterface):
             self._plugin_configs = dict()
         else:
             self._plugin_configs = plugin_configs
+        self._runner_config = runner_config or dict()
+        self._parsing_config = parsing_config or dict()
+        self._inventory_config = inventory_config or dict()
+        self._diagnostic_config = diagnostic_config or dict()
 
     @property
     def device_repo(self) -> str:
@@ -61,6 +80,22 @@ class SettingsImpl(SettingsInterface):
     def plugin_configs(self) -> Dict:
         return self._plugin_configs or dict()
 
+    @property
+    def runner_config(self) -> Dict:
+        return self._runner_config
+
+    @property
+    def parsing_config(self) -> Dict:
+        return self._parsing_config
+
+    @property
+    def inventory_config(self) -> Dict:
+        return self._inventory_config
+
+    @property
+    def diagnostic_config(self) -> Dict:
+        return self._diagnostic_config
+
     @property
     def template_paths(self) -> list[str]:
         """Return user‑specified template directories merged with built‑ins."""
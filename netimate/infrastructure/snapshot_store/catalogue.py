@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.snapshot_store.catalogue
+------------------------------------------------
+SQLite catalogue of stored snapshots (device, timestamp, name, digest, size).
+
+Listing snapshots must not depend on the number of files on disk: the shell
+completer asks for a device's snapshots on every keystroke of
+``diff-snapshots``.  The catalogue answers per‑device, time‑range and
+latest‑N queries from indexes, and a batch of snapshots is recorded in a
+single transaction, so a fan‑out is either fully catalogued or not at all.
+
+Timestamps use the snapshot name format ``%Y%m%d_%H%M%S``, which sorts
+chronologically as text.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+from netimate.models.snapshot import SnapshotRef
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    name     TEXT PRIMARY KEY,
+    device   TEXT NOT NULL,
+    taken_at TEXT NOT NULL,
+    digest   TEXT,
+    size     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS snapshots_device_time ON snapshots (device, taken_at);
+CREATE INDEX IF NOT EXISTS snapshots_time ON snapshots (taken_at);
+CREATE INDEX IF NOT EXISTS snapshots_digest ON snapshots (digest);
+"""
+
+_COLUMNS = "name, device, taken_at, digest, size"
+
+
+def _timestamp(value: str | datetime) -> str:
+    return value.strftime(TIMESTAMP_FORMAT) if isinstance(value, datetime) else value
+
+
+class SnapshotCatalogue:
+    """Thread‑safe wrapper around the ``catalogue.sqlite3`` file of a snapshot store."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return self._conn is not None or self.path.exists()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def create(self, refs: Iterable[SnapshotRef]) -> None:
+        """
+        Create the catalogue holding *refs*.  The database is built in a
+        temporary file and renamed into place, so the catalogue only exists
+        once every row is in it.
+        """
+        rows = [(r.name, r.device, r.taken_at, r.digest, r.size) for r in refs]
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.unlink(missing_ok=True)
+        try:
+            conn = sqlite3.connect(tmp)
+            try:
+                conn.executescript(_SCHEMA)
+                with conn:
+                    conn.executemany(
+                        f"INSERT INTO snapshots ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows
+                    )
+            finally:
+                conn.close()
+            os.replace(tmp, self.path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def add(self, refs: Iterable[SnapshotRef]) -> None:
+        """Record *refs* in one transaction (a name seen before is replaced)."""
+        rows = [(r.name, r.device, r.taken_at, r.digest, r.size) for r in refs]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO snapshots ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows
+                )
+
+    def _fetch(self, sql: str, params: List[Any]) -> List[SnapshotRef]:
+        if not self.exists():
+            return []
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [SnapshotRef(*row) for row in rows]
+
+    def get(self, name: str) -> Optional[SnapshotRef]:
+        refs = self._fetch(f"SELECT {_COLUMNS} FROM snapshots WHERE name = ?", [name])
+        return refs[0] if refs else None
+
+    def query(
+        self,
+        device: Optional[str] = None,
+        since: Optional[str | datetime] = None,
+        until: Optional[str | datetime] = None,
+        latest: Optional[int] = None,
+    ) -> List[SnapshotRef]:
+        """
+        Return snapshots ordered by device then time, optionally for one
+        *device*, taken in ``[since, until]`` and/or only the *latest* N.
+
+        Raises ``ValueError`` if *latest* is negative (SQLite would read a
+        negative ``LIMIT`` as no limit at all).
+        """
+        if latest is not None and latest < 0:
+            raise ValueError(f"latest must be zero or more, got {latest}")
+        clauses: List[str] = []
+        params: List[Any] = []
+        if device is not None:
+            clauses.append("device = ?")
+            params.append(device)
+        if since is not None:
+            clauses.append("taken_at >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("taken_at <= ?")
+            params.append(_timestamp(until))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {_COLUMNS} FROM snapshots{where}"
+        if latest is not None:
+            sql = f"SELECT * FROM ({sql} ORDER BY taken_at DESC, name DESC LIMIT ?)"
+            params.append(latest)
+        return self._fetch(f"{sql} ORDER BY device, taken_at", params)
+
+    def has_digest(self, digest: str) -> bool:
+        """Return whether any catalogued snapshot is stored under *digest*."""
+        if not self.exists():
+            return False
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT 1 FROM snapshots WHERE digest = ? LIMIT 1", [digest])
+                .fetchone()
+            )
+        return row is not None
+
+    def latest_digest(self, device: str) -> Optional[str]:
+        """Return the digest of *device*'s most recent stored snapshot."""
+        refs = self._fetch(
+            f"SELECT {_COLUMNS} FROM snapshots WHERE device = ? AND digest IS NOT NULL"
+            " ORDER BY taken_at DESC LIMIT 1",
+            [device],
+        )
+        return refs[0].digest if refs else None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,417 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.snapshot_store.content_store
+----------------------------------------------------
+Content‑addressed, compressed storage for running‑config snapshots.
+
+Writing every snapshot as its own plain‑text file makes hourly snapshots of a
+large estate fill the disk and one directory with millions of files, even
+though most configs do not change between runs.  This store keeps:
+
+* ``objects/<2 hex>/<62 hex>.gz`` – one gzip blob per distinct config,
+  named by the SHA‑256 of its text, so an unchanged config costs no new blob;
+* ``catalogue.sqlite3`` – one row per snapshot (device, timestamp, digest,
+  size), see :mod:`.catalogue`; listings are indexed queries instead of
+  directory globs.
+
+A changed config is normally stored as ``<digest>.delta.gz``: the line‑level
+delta (see :mod:`.delta`) against the device's previous snapshot.  Every
+``keyframe_interval``‑th version in a chain, or whenever the delta would not
+be clearly smaller, a full keyframe is written instead, so rebuilding any
+version reads at most one keyframe plus a bounded number of small deltas.
+Diffs between versions of one chain start from the stored deltas rather than
+reading both configs in full.
+
+Snapshots are saved in batches (:meth:`put_many`).  Blobs are written to
+temporary files and renamed into place, then fsynced together before the batch
+is catalogued in one transaction.  A crash therefore never leaves a catalogued
+snapshot without its data.
+
+Snapshots written by earlier versions – ``<device>_running_config_<timestamp>.txt``
+files and the ``index.jsonl`` of the first blob layout – are imported into the
+catalogue once, when it is created (see :meth:`import_legacy`).  Until then,
+plain ``.txt`` files are listed and read directly.  An imported snapshot keeps
+answering to its old ``.txt`` name.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from netimate.infrastructure.snapshot_store.catalogue import TIMESTAMP_FORMAT, SnapshotCatalogue
+from netimate.infrastructure.snapshot_store.delta import (
+    Delta,
+    apply_delta,
+    compose,
+    make_delta,
+    unified_diff_lines,
+)
+from netimate.infrastructure.snapshot_store.diff import (
+    diff_opcodes,
+    render_unified,
+    unified_diff,
+)
+from netimate.interfaces.infrastructure.snapshot_store import SnapshotStoreInterface
+from netimate.models.snapshot import SNAPSHOT_MARKER, SnapshotRef
+
+logger = logging.getLogger(__name__)
+
+CATALOGUE_FILE = "catalogue.sqlite3"
+INDEX_FILE = "index.jsonl"
+OBJECTS_DIR = "objects"
+LEGACY_SUFFIX = ".txt"
+DEFAULT_COMPRESSLEVEL = 6
+DEFAULT_KEYFRAME_INTERVAL = 20
+FULL_SUFFIX = ".gz"
+DELTA_SUFFIX = ".delta.gz"
+_LINES_CACHE_SIZE = 16
+
+
+class ContentAddressedSnapshotStore(SnapshotStoreInterface):
+    """Deduplicating, delta‑encoded gzip blob store with an SQLite catalogue."""
+
+    def __init__(
+        self,
+        root: Path,
+        compresslevel: int = DEFAULT_COMPRESSLEVEL,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ):
+        self.root = Path(root)
+        self.compresslevel = compresslevel
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.catalogue = SnapshotCatalogue(self.root / CATALOGUE_FILE)
+        self._lines_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+
+    # ------------------------------------------------------------------ #
+    #                              Layout                                #
+    # ------------------------------------------------------------------ #
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_FILE
+
+    def blob_path(self, digest: str, suffix: str = FULL_SUFFIX) -> Path:
+        return self.root / OBJECTS_DIR / digest[:2] / f"{digest[2:]}{suffix}"
+
+    def _write_blob(self, path: Path, data: bytes) -> Path:
+        """Atomically replace *path* with compressed *data* (not yet fsynced)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(gzip.compress(data, self.compresslevel, mtime=0))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    @staticmethod
+    def _sync(paths: Iterable[Path]) -> None:
+        """fsync a batch of written blobs, then each directory holding them, once."""
+        dirs: Set[Path] = set()
+        for path in paths:
+            with path.open("rb") as fh:
+                os.fsync(fh.fileno())
+            dirs.update((path.parent, path.parent.parent))
+        for directory in dirs:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:  # e.g. directories cannot be opened on Windows
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _has_blob(self, digest: str) -> bool:
+        return self.blob_path(digest).exists() or self.blob_path(digest, DELTA_SUFFIX).exists()
+
+    def _load_delta(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Return ``{"base", "depth", "ops"}`` if *digest* is stored as a delta."""
+        path = self.blob_path(digest, DELTA_SUFFIX)
+        if not path.exists():
+            return None
+        with gzip.open(path, "rb") as fh:
+            return json.loads(fh.read())
+
+    def _lines(self, digest: str) -> List[str]:
+        """Rebuild the lines of *digest* from its keyframe and deltas."""
+        cached = self._lines_cache.get(digest)
+        if cached is not None:
+            self._lines_cache.move_to_end(digest)
+            return cached
+
+        chain: List[Delta] = []
+        current = digest
+        while True:
+            delta = self._load_delta(current)
+            if delta is None:
+                break
+            chain.append(delta["ops"])
+            current = delta["base"]
+            if current in self._lines_cache:
+                break
+        lines = self._lines_cache.get(current)
+        if lines is None:
+            with gzip.open(self.blob_path(current), "rb") as fh:
+                lines = fh.read().decode("utf-8").split("\n")
+        for ops in reversed(chain):
+            lines = apply_delta(lines, ops)
+
+        self._lines_cache[digest] = lines
+        while len(self._lines_cache) > _LINES_CACHE_SIZE:
+            self._lines_cache.popitem(last=False)
+        return lines
+
+    # ------------------------------------------------------------------ #
+    #                             Catalogue                              #
+    # ------------------------------------------------------------------ #
+    def _catalogued(self) -> bool:
+        """Return whether listings come from the catalogue (vs. legacy files)."""
+        if self.catalogue.exists():
+            return True
+        if self.index_path.exists():
+            self._create_catalogue()
+            return True
+        return False
+
+    def _create_catalogue(self) -> None:
+        # The catalogue only appears once the import has succeeded; a failed
+        # import leaves the legacy layout in charge and is retried next time.
+        if not self.catalogue.exists():
+            self.import_legacy()
+
+    def _ref(self, name: str) -> Optional[SnapshotRef]:
+        if not self._catalogued():
+            return None
+        ref = self.catalogue.get(name)
+        if ref is None and name.endswith(LEGACY_SUFFIX):
+            ref = self.catalogue.get(name[: -len(LEGACY_SUFFIX)])
+        return ref
+
+    def _read_index(self) -> List[SnapshotRef]:
+        refs = []
+        with self.index_path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                    refs.append(
+                        SnapshotRef(
+                            SnapshotRef.make_name(entry["device"], entry["taken_at"]),
+                            entry["device"],
+                            entry["taken_at"],
+                            entry["digest"],
+                            entry.get("size", 0),
+                        )
+                    )
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Skipping corrupt snapshot index line: %r", line)
+        return refs
+
+    def _legacy(self, device: Optional[str]) -> List[SnapshotRef]:
+        pattern = f"{device}{SNAPSHOT_MARKER}*{LEGACY_SUFFIX}" if device else f"*{LEGACY_SUFFIX}"
+        refs = []
+        for path in self.root.glob(pattern):
+            owner, _, taken_at = path.stem.partition(SNAPSHOT_MARKER)
+            refs.append(SnapshotRef(path.name, owner if taken_at else "", taken_at))
+        return refs
+
+    def import_legacy(self) -> int:
+        """
+        Catalogue the snapshots of earlier layouts, all or nothing:
+        entries of ``index.jsonl`` and ``<device>_running_config_<timestamp>.txt``
+        files (stored as blobs; the files themselves are left in place).
+
+        Safe to re‑run – already catalogued snapshots are simply replaced.
+        Returns the number of snapshots imported.
+        """
+        refs = self._read_index() if self.index_path.exists() else []
+        bases: Dict[str, str] = {}
+        written: Dict[str, Path] = {}
+        for path in sorted(self.root.glob(f"*{SNAPSHOT_MARKER}*{LEGACY_SUFFIX}")):
+            device, _, taken_at = path.stem.partition(SNAPSHOT_MARKER)
+            if not device or not taken_at:
+                logger.warning("Skipping unrecognised snapshot file %s", path.name)
+                continue
+            text = path.read_text(encoding="utf-8")
+            refs.append(self._store(device, text, taken_at, bases, written))
+        self._sync(written.values())
+        if self.catalogue.exists():
+            self.catalogue.add(refs)
+        else:
+            self.catalogue.create(refs)
+        if refs:
+            logger.info("Imported %d earlier snapshot(s) into %s", len(refs), self.catalogue.path)
+        return len(refs)
+
+    # ------------------------------------------------------------------ #
+    #                             Public API                             #
+    # ------------------------------------------------------------------ #
+    def exists(self) -> bool:
+        return self.root.exists()
+
+    def put(self, device: str, text: str, taken_at: str) -> SnapshotRef:
+        return self.put_many({device: text}, taken_at)[0]
+
+    def put_many(self, snapshots: Mapping[str, str], taken_at: str) -> List[SnapshotRef]:
+        """
+        Write every blob (atomic renames), fsync them in one pass, then
+        catalogue the whole batch in one transaction.  The catalogue never
+        references a blob that is not on disk.
+        """
+        self._create_catalogue()
+        bases: Dict[str, str] = {}
+        written: Dict[str, Path] = {}
+        refs = [
+            self._store(device, text, taken_at, bases, written)
+            for device, text in snapshots.items()
+        ]
+        self._sync(written.values())
+        self.catalogue.add(refs)
+        return refs
+
+    def _store(
+        self,
+        device: str,
+        text: str,
+        taken_at: str,
+        bases: Dict[str, str],
+        written: Dict[str, Path],
+    ) -> SnapshotRef:
+        """
+        Write the blob for *text* unless it is already catalogued or in this
+        batch.  *bases* tracks each device's latest digest in the batch and
+        *written* the blobs it wrote.  Uncatalogued blobs left by a crash are
+        never reused, only rewritten.
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in written or self.catalogue.has_digest(digest):
+            logger.debug("Snapshot of %s unchanged (%s); reusing blob", device, digest[:12])
+        else:
+            base = bases.get(device) or self.catalogue.latest_digest(device)
+            written[digest] = self._put_delta(base, digest, text) or self._write_blob(
+                self.blob_path(digest), data
+            )
+        bases[device] = digest
+        return SnapshotRef(
+            SnapshotRef.make_name(device, taken_at), device, taken_at, digest, len(data)
+        )
+
+    def _put_delta(self, base: Optional[str], digest: str, text: str) -> Optional[Path]:
+        """Store *text* as a delta on *base* (the device's latest snapshot), if worthwhile."""
+        if base is None or not self._has_blob(base):
+            return None
+        base_delta = self._load_delta(base)
+        depth = (base_delta["depth"] if base_delta else 0) + 1
+        if depth >= self.keyframe_interval:
+            return None
+
+        lines = text.split("\n")
+        ops = make_delta(self._lines(base), lines)
+        payload = json.dumps(
+            {"base": base, "depth": depth, "ops": ops}, separators=(",", ":")
+        ).encode("utf-8")
+        if len(payload) * 2 > len(text):
+            return None
+        self._lines_cache[digest] = lines
+        return self._write_blob(self.blob_path(digest, DELTA_SUFFIX), payload)
+
+    def snapshots(
+        self,
+        device: Optional[str] = None,
+        since: Optional[str | datetime] = None,
+        until: Optional[str | datetime] = None,
+        latest: Optional[int] = None,
+    ) -> List[SnapshotRef]:
+        if not self.root.exists():
+            return []
+        if self._catalogued():
+            return self.catalogue.query(device, since, until, latest)
+        return self._filter(self._legacy(device), since, until, latest)
+
+    @staticmethod
+    def _filter(
+        refs: List[SnapshotRef],
+        since: Optional[str | datetime],
+        until: Optional[str | datetime],
+        latest: Optional[int],
+    ) -> List[SnapshotRef]:
+        if latest is not None and latest < 0:
+            raise ValueError(f"latest must be zero or more, got {latest}")
+        if isinstance(since, datetime):
+            since = since.strftime(TIMESTAMP_FORMAT)
+        if isinstance(until, datetime):
+            until = until.strftime(TIMESTAMP_FORMAT)
+        refs = [
+            ref
+            for ref in refs
+            if (since is None or ref.taken_at >= since) and (until is None or ref.taken_at <= until)
+        ]
+        if latest is not None:
+            newest = sorted(refs, key=lambda ref: (ref.taken_at, ref.name))
+            refs = newest[-latest:] if latest > 0 else []
+        return sorted(refs, key=lambda ref: ref.name)
+
+    def read(self, device: str, name: str) -> str:
+        ref = self._ref(name)
+        if ref is not None and ref.digest:
+            return "\n".join(self._lines(ref.digest))
+        legacy = self.root / name
+        if name.endswith(LEGACY_SUFFIX) and legacy.is_file():
+            return legacy.read_text()
+        raise FileNotFoundError(f"No snapshot {name} for device {device}.")
+
+    def diff(self, device: str, old: str, new: str, context: int = 3) -> str:
+        """
+        Diff two snapshots, from the stored deltas when *old* is an ancestor
+        of *new* in the device's history (falls back to a full comparison).
+
+        A single delta is rendered as is.  Composed deltas are not minimal (a
+        line changed and later reverted would show as ``-X``/``+X``), so for
+        longer chains the target is rebuilt from them and diffed once.
+        """
+        old_ref, new_ref = self._ref(old), self._ref(new)
+        if old_ref is None or new_ref is None or not (old_ref.digest and new_ref.digest):
+            return self._full_diff(device, old, new, context)
+        if old_ref.digest == new_ref.digest:
+            return ""
+
+        chain: List[Delta] = []
+        current = new_ref.digest
+        while current != old_ref.digest:
+            delta = self._load_delta(current)
+            if delta is None:
+                return self._full_diff(device, old, new, context)
+            chain.append(delta["ops"])
+            current = delta["base"]
+
+        old_lines = self._lines(old_ref.digest)
+        if len(chain) == 1:
+            return "\n".join(unified_diff_lines(old_lines, chain[0], old, new, context))
+        ops = chain.pop()
+        while chain:
+            ops = compose(ops, chain.pop())
+        new_lines = apply_delta(old_lines, ops)
+        codes = diff_opcodes(old_lines, new_lines)
+        return "\n".join(render_unified(old_lines, new_lines, codes, old, new, context))
+
+    def _full_diff(self, device: str, old: str, new: str, context: int) -> str:
+        return "\n".join(
+            unified_diff(
+                self.read(device, old).splitlines(),
+                self.read(device, new).splitlines(),
+                old,
+                new,
+                context,
+            )
+        )
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.snapshot_store.delta
+--------------------------------------------
+Line‑level deltas between consecutive snapshots of a device.
+
+A delta rebuilds a *target* list of lines from a *base* list with two ops:
+
+* ``["=", i, j]`` – copy ``base[i:j]``;
+* ``["+", [lines…]]`` – insert literal lines.
+
+Copies are always in increasing base order, so a delta is also a diff: base
+lines skipped between copies were deleted, literal lines were added.  That
+lets :func:`compose` chain deltas (v1→v2 then v2→v3 gives v1→v3) and
+:func:`unified_diff_lines` render a unified diff straight from a delta,
+without re‑comparing two full configs.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, List, Sequence
+
+from netimate.infrastructure.snapshot_store.diff import Opcode, diff_opcodes, render_unified
+
+Delta = List[List[Any]]
+
+
+def make_delta(base: Sequence[str], target: Sequence[str]) -> Delta:
+    """Return the ops that turn *base* into *target*."""
+    ops: Delta = []
+    for tag, i1, i2, j1, j2 in diff_opcodes(base, target):
+        if tag == "equal":
+            _append(ops, ["=", i1, i2])
+        elif j2 > j1:
+            _append(ops, ["+", list(target[j1:j2])])
+    return ops
+
+
+def _append(ops: Delta, op: List[Any]) -> None:
+    """Append *op*, merging it into the previous op when they are contiguous."""
+    if ops:
+        last = ops[-1]
+        if op[0] == "=" and last[0] == "=" and last[2] == op[1]:
+            last[2] = op[2]
+            return
+        if op[0] == "+" and last[0] == "+":
+            last[1] = last[1] + op[1]
+            return
+    ops.append(op)
+
+
+def apply_delta(base: Sequence[str], ops: Delta) -> List[str]:
+    """Rebuild the target lines of *ops* from *base*."""
+    out: List[str] = []
+    for op in ops:
+        if op[0] == "=":
+            out.extend(base[op[1] : op[2]])
+        else:
+            out.extend(op[1])
+    return out
+
+
+def compose(first: Delta, second: Delta) -> Delta:
+    """Return the delta base→v2 from *first* (base→v1) and *second* (v1→v2)."""
+    # Index the v1 line range each op of *first* produces.
+    starts: List[int] = []
+    pos = 0
+    for op in first:
+        starts.append(pos)
+        pos += op[2] - op[1] if op[0] == "=" else len(op[1])
+
+    out: Delta = []
+    for op in second:
+        if op[0] == "+":
+            _append(out, ["+", list(op[1])])
+            continue
+        lo, hi = op[1], op[2]
+        k = bisect.bisect_right(starts, lo) - 1
+        while lo < hi:
+            src = first[k]
+            start = starts[k]
+            length = src[2] - src[1] if src[0] == "=" else len(src[1])
+            take = min(hi, start + length) - lo
+            offset = lo - start
+            if src[0] == "=":
+                _append(out, ["=", src[1] + offset, src[1] + offset + take])
+            else:
+                _append(out, ["+", src[1][offset : offset + take]])
+            lo += take
+            k += 1
+    return out
+
+
+def opcodes(base_len: int, ops: Delta) -> List[Opcode]:
+    """Translate *ops* into :class:`difflib.SequenceMatcher`‑style opcodes."""
+    codes: List[Opcode] = []
+    i = j = 0
+    pending = 0  # inserted lines not yet emitted
+
+    def flush(upto: int) -> None:
+        nonlocal i, j, pending
+        if upto > i and pending:
+            codes.append(("replace", i, upto, j, j + pending))
+        elif upto > i:
+            codes.append(("delete", i, upto, j, j))
+        elif pending:
+            codes.append(("insert", i, i, j, j + pending))
+        j += pending
+        i, pending = upto, 0
+
+    for op in ops:
+        if op[0] == "+":
+            pending += len(op[1])
+            continue
+        flush(op[1])
+        length = op[2] - op[1]
+        codes.append(("equal", i, op[2], j, j + length))
+        i, j = op[2], j + length
+    flush(base_len)
+    return codes
+
+
+def unified_diff_lines(
+    base: Sequence[str],
+    ops: Delta,
+    fromfile: str,
+    tofile: str,
+    n: int = 3,
+) -> List[str]:
+    """Render base→target as unified diff lines (``lineterm=""``) from *ops*."""
+    target_lines: List[str] = []
+    for op in ops:
+        if op[0] == "+":
+            target_lines.extend(op[1])
+        else:
+            target_lines.extend([""] * (op[2] - op[1]))  # equal lines come from base
+
+    return render_unified(base, target_lines, opcodes(len(base), ops), fromfile, tofile, n)
@@ -0,0 +1,370 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.snapshot_store.diff
+-------------------------------------------
+Line diff engine for large configs, replacing :mod:`difflib`.
+
+:class:`difflib.SequenceMatcher` slows down badly on 50k‑line configs (large
+ACLs, prefix‑lists): it repeatedly searches for the longest matching block and
+its "popular line" heuristic throws away lines such as ``!`` or
+``exit-address-family``.  This engine:
+
+1. interns every line to an integer, so comparisons are int compares;
+2. strips the common prefix and suffix;
+3. anchors on lines that occur exactly once on each side, in increasing
+   order (patience diff), and recurses between the anchors;
+4. runs Myers' O(ND) algorithm in its linear‑space form (middle snake,
+   divide and conquer) on the gaps that have no unique lines.  As in GNU
+   diff, lines with no counterpart on the other side are dropped first,
+   since they can never match.  Past an edit cost of :data:`MAX_COST` it
+   stops looking for an optimal split and splits at the furthest‑reaching
+   diagonal instead, so a rewritten block costs O(N·MAX_COST), not O(N²).
+
+:func:`diff_opcodes` returns :meth:`difflib.SequenceMatcher.get_opcodes`‑style
+opcodes, :func:`unified_diff` renders them like :func:`difflib.unified_diff`
+(``lineterm=""``), and :func:`hierarchical_diff` compares IOS‑style configs
+section by section (see its docstring).
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterator, List, Sequence, Tuple
+
+Opcode = Tuple[str, int, int, int, int]
+Match = Tuple[int, int]
+
+MAX_COST = 256
+_MAX_PATIENCE_DEPTH = 8
+
+
+# --------------------------------------------------------------------------- #
+#                                 Matching                                    #
+# --------------------------------------------------------------------------- #
+def _intern(a: Sequence[Hashable], b: Sequence[Hashable]) -> Tuple[List[int], List[int]]:
+    ids: Dict[Hashable, int] = {}
+    return [ids.setdefault(x, len(ids)) for x in a], [ids.setdefault(x, len(ids)) for x in b]
+
+
+def _trim(
+    a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int, out: List[Match]
+) -> Tuple[int, int, int, int, List[Match]]:
+    """Match the common prefix into *out*; return the inner range and the suffix matches."""
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        out.append((alo, blo))
+        alo += 1
+        blo += 1
+    suffix: List[Match] = []
+    while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+        suffix.append((ahi, bhi))
+    suffix.reverse()
+    return alo, ahi, blo, bhi, suffix
+
+
+def _unique_anchors(
+    a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int
+) -> List[Match]:
+    """Return the longest increasing run of lines unique to both ranges (patience)."""
+    seen_a: Dict[int, int] = {}
+    for i in range(alo, ahi):
+        seen_a[a[i]] = -1 if a[i] in seen_a else i
+    seen_b: Dict[int, int] = {}
+    for j in range(blo, bhi):
+        line = b[j]
+        if seen_a.get(line, -1) >= 0:
+            seen_b[line] = -1 if line in seen_b else j
+    pairs = sorted((seen_a[line], j) for line, j in seen_b.items() if j >= 0)
+    if not pairs:
+        return []
+
+    # Longest increasing subsequence of the b positions (patience sorting).
+    tails: List[int] = []
+    tail_index: List[int] = []
+    back: List[int] = [-1] * len(pairs)
+    for idx, (_, j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_index.append(idx)
+        else:
+            tails[pos] = j
+            tail_index[pos] = idx
+        back[idx] = tail_index[pos - 1] if pos else -1
+    anchors: List[Match] = []
+    idx = tail_index[-1]
+    while idx >= 0:
+        anchors.append(pairs[idx])
+        idx = back[idx]
+    anchors.reverse()
+    return anchors
+
+
+def _patience(
+    a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int, out: List[Match], depth: int
+) -> None:
+    alo, ahi, blo, bhi, suffix = _trim(a, alo, ahi, b, blo, bhi, out)
+    if alo < ahi and blo < bhi:
+        anchors = _unique_anchors(a, alo, ahi, b, blo, bhi) if depth < _MAX_PATIENCE_DEPTH else []
+        if anchors:
+            for i, j in anchors:
+                _patience(a, alo, i, b, blo, j, out, depth + 1)
+                out.append((i, j))
+                alo, blo = i + 1, j + 1
+            _patience(a, alo, ahi, b, blo, bhi, out, depth + 1)
+        else:
+            _diff_gap(a, alo, ahi, b, blo, bhi, out)
+    out.extend(suffix)
+
+
+def _diff_gap(
+    a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int, out: List[Match]
+) -> None:
+    """Run Myers on the lines of both ranges that occur on the other side."""
+    in_b = set(b[blo:bhi])
+    keep_a = [i for i in range(alo, ahi) if a[i] in in_b]
+    in_a = set(a[alo:ahi])
+    keep_b = [j for j in range(blo, bhi) if b[j] in in_a]
+    if not keep_a:
+        return
+    pairs: List[Match] = []
+    _myers([a[i] for i in keep_a], 0, len(keep_a), [b[j] for j in keep_b], 0, len(keep_b), pairs)
+    out.extend((keep_a[i], keep_b[j]) for i, j in pairs)
+
+
+def _myers(
+    a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int, out: List[Match]
+) -> None:
+    alo, ahi, blo, bhi, suffix = _trim(a, alo, ahi, b, blo, bhi, out)
+    if alo < ahi and blo < bhi:
+        x0, y0, x1, y1 = _middle_snake(a, alo, ahi, b, blo, bhi)
+        _myers(a, alo, x0, b, blo, y0, out)
+        out.extend(zip(range(x0, x1), range(y0, y1)))
+        _myers(a, x1, ahi, b, y1, bhi, out)
+    out.extend(suffix)
+
+
+def _middle_snake(
+    a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int
+) -> Tuple[int, int, int, int]:
+    """
+    Return a snake ``(x0, y0, x1, y1)`` on an optimal (or, past
+    :data:`MAX_COST`, a good) path through the edit graph of the two
+    ranges, whose first and last lines are known to differ.
+    """
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta & 1
+    offset = (n + m + 1) // 2 + 1
+    forward = [0] * (2 * offset + 1)  # furthest x reached on diagonal k = x - y
+    backward = [0] * (2 * offset + 1)  # same, walking back from (n, m)
+
+    for d in range(offset):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            sx, sy = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            c = delta - k
+            if odd and -d < c < d and x + backward[offset + c] >= n:
+                return alo + sx, blo + sy, alo + x, blo + y
+
+        for c in range(-d, d + 1, 2):
+            if c == -d or (c != d and backward[offset + c - 1] < backward[offset + c + 1]):
+                x = backward[offset + c + 1]
+            else:
+                x = backward[offset + c - 1] + 1
+            y = x - c
+            sx, sy = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + c] = x
+            k = delta - c
+            if not odd and -d <= k <= d and x + forward[offset + k] >= n:
+                return ahi - x, bhi - y, ahi - sx, bhi - sy
+
+        if d >= MAX_COST:
+            # Too expensive: split where the forward search got furthest.
+            best = max(range(-d, d + 1, 2), key=lambda k: 2 * forward[offset + k] - k)
+            x = min(forward[offset + best], n)
+            y = max(0, min(x - best, m))
+            if 0 < x + y < n + m:
+                return alo + x, blo + y, alo + x, blo + y
+    raise AssertionError("unreachable: the forward and backward searches always meet")
+
+
+def matching_pairs(a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Match]:
+    """Return the ``(i, j)`` index pairs of lines kept from *a* in *b*, in order."""
+    ia, ib = _intern(a, b)
+    out: List[Match] = []
+    _patience(ia, 0, len(ia), ib, 0, len(ib), out, 0)
+    return out
+
+
+def diff_opcodes(a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Opcode]:
+    """Return :meth:`difflib.SequenceMatcher.get_opcodes`‑style opcodes from *a* to *b*."""
+    codes: List[Opcode] = []
+    i = j = 0
+    for mi, mj in matching_pairs(a, b) + [(len(a), len(b))]:
+        if mi > i and mj > j:
+            codes.append(("replace", i, mi, j, mj))
+        elif mi > i:
+            codes.append(("delete", i, mi, j, j))
+        elif mj > j:
+            codes.append(("insert", i, i, j, mj))
+        if mi < len(a):
+            if codes and codes[-1][0] == "equal" and codes[-1][2] == mi:
+                tag, i1, _, j1, _ = codes[-1]
+                codes[-1] = (tag, i1, mi + 1, j1, mj + 1)
+            else:
+                codes.append(("equal", mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    return codes
+
+
+# --------------------------------------------------------------------------- #
+#                              Unified output                                 #
+# --------------------------------------------------------------------------- #
+def _grouped(codes: List[Opcode], n: int) -> Iterator[List[Opcode]]:
+    """Group *codes* into hunks with *n* lines of context, as difflib does."""
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+    group: List[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n * 2:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _range(start: int, stop: int) -> str:
+    length = stop - start
+    beginning = start + 1
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def render_unified(
+    a: Sequence[str],
+    b: Sequence[str],
+    codes: List[Opcode],
+    fromfile: str,
+    tofile: str,
+    n: int = 3,
+) -> List[str]:
+    """
+    Render *codes* as unified diff lines (``lineterm=""``).  Context lines
+    are taken from *a*, so *b* only needs the inserted lines filled in.
+    """
+    out: List[str] = []
+    for group in _grouped(codes, n):
+        if not out:
+            out += [f"--- {fromfile}", f"+++ {tofile}"]
+        first, last = group[0], group[-1]
+        out.append(f"@@ -{_range(first[1], last[2])} +{_range(first[3], last[4])} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(" " + line for line in a[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                out.extend("-" + line for line in a[i1:i2])
+            if tag in ("replace", "insert"):
+                out.extend("+" + line for line in b[j1:j2])
+    return out
+
+
+def unified_diff(
+    a: Sequence[str], b: Sequence[str], fromfile: str, tofile: str, n: int = 3
+) -> List[str]:
+    """Drop‑in for ``list(difflib.unified_diff(a, b, fromfile, tofile, lineterm="", n=n))``."""
+    return render_unified(a, b, diff_opcodes(a, b), fromfile, tofile, n)
+
+
+# --------------------------------------------------------------------------- #
+#                             Hierarchical diff                               #
+# --------------------------------------------------------------------------- #
+@dataclass(slots=True)
+class _Section:
+    line: str
+    children: List["_Section"] = field(default_factory=list)
+
+
+def _sections(lines: Sequence[str]) -> List[_Section]:
+    """Parse IOS‑style indentation into a tree; ``!`` separators and blank lines are dropped."""
+    root = _Section("")
+    stack: List[Tuple[int, _Section]] = [(-1, root)]
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped == "!":
+            continue
+        indent = len(line) - len(line.lstrip())
+        while stack[-1][0] >= indent:
+            stack.pop()
+        node = _Section(line.rstrip())
+        stack[-1][1].children.append(node)
+        stack.append((indent, node))
+    return root.children
+
+
+def _emit(sign: str, section: _Section, out: List[str]) -> None:
+    out.append(sign + section.line)
+    for child in section.children:
+        _emit(sign, child, out)
+
+
+def _diff_sections(old: List[_Section], new: List[_Section], out: List[str]) -> None:
+    keys_old = [s.line.strip() for s in old]
+    keys_new = [s.line.strip() for s in new]
+    for tag, i1, i2, j1, j2 in diff_opcodes(keys_old, keys_new):
+        if tag == "equal":
+            for before, after in zip(old[i1:i2], new[j1:j2]):
+                if not (before.children or after.children):
+                    continue
+                changes: List[str] = []
+                _diff_sections(before.children, after.children, changes)
+                if changes:
+                    out.append(" " + after.line)
+                    out.extend(changes)
+            continue
+        for section in old[i1:i2]:
+            _emit("-", section, out)
+        for section in new[j1:j2]:
+            _emit("+", section, out)
+
+
+def hierarchical_diff(a: Sequence[str], b: Sequence[str], fromfile: str, tofile: str) -> List[str]:
+    """
+    Diff two IOS‑style configs section by section.
+
+    Lines are grouped under the closest less‑indented line (``interface …``,
+    ``router bgp …``, ``address-family …``), and each level is diffed on its own.
+    Every change is shown under the full chain of its parent sections, however
+    far away they are.  A removed or added section is shown with all of its
+    children.  Order is kept at each level, so ACL or route‑map entries that
+    were reordered show up as changes.
+    """
+    changes: List[str] = []
+    _diff_sections(_sections(a), _sections(b), changes)
+    return [f"--- {fromfile}", f"+++ {tofile}", *changes] if changes else []
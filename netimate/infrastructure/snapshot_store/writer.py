@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.snapshot_store.writer
+---------------------------------------------
+Pipelined, batched snapshot persistence for an asyncio fan‑out.
+
+:class:`SnapshotWriter` lets a producer hand over each device's config as
+soon as it arrives.  A single drain task pulls whatever has queued up,
+up to ``batch_size`` configs, and saves them with one
+:meth:`~SnapshotStoreInterface.put_many` call in a worker thread.  For the
+content‑addressed store, that means one fsync pass and one catalogue
+transaction per batch.  Configs that arrive while a batch is being written
+form the next batch (group commit), so the event loop never blocks on disk.
+
+The queue is bounded (``max_pending``).  When the disk falls behind,
+:meth:`SnapshotWriter.write` waits, so at most ``max_pending + batch_size``
+configs are held in memory however many devices are snapshotted::
+
+    async with SnapshotWriter(store, taken_at) as writer:
+        async for device, text in results:
+            await writer.write(device, text)
+    writer.saved  # device -> snapshot name
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type
+
+from netimate.interfaces.infrastructure.snapshot_store import SnapshotStoreInterface
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_PENDING = 64
+
+
+class SnapshotWriter:
+    """Bounded queue in front of a snapshot store, drained in batches off the event loop."""
+
+    def __init__(
+        self,
+        store: SnapshotStoreInterface,
+        taken_at: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self._store = store
+        self._taken_at = taken_at
+        self._batch_size = max(1, batch_size)
+        self._queue: asyncio.Queue[Optional[Tuple[str, str]]] = asyncio.Queue(max(1, max_pending))
+        self._task: Optional[asyncio.Task[None]] = None
+        self._error: Optional[BaseException] = None
+        self.saved: Dict[str, str] = {}
+
+    async def __aenter__(self) -> "SnapshotWriter":
+        self._task = asyncio.create_task(self._drain())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        assert self._task is not None
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            return
+        await self._queue.put(None)
+        await self._task
+        if self._error is not None and exc_type is None:
+            raise self._error
+
+    async def write(self, device: str, text: str) -> None:
+        """Queue *text* as *device*'s snapshot (waits while the queue is full)."""
+        if self._error is not None:
+            raise self._error
+        await self._queue.put((device, text))
+
+    async def _drain(self) -> None:
+        finished = False
+        while not finished:
+            item = await self._queue.get()
+            batch: Dict[str, str] = {}
+            while item is not None:
+                batch[item[0]] = item[1]
+                if len(batch) >= self._batch_size or self._queue.empty():
+                    break
+                item = self._queue.get_nowait()
+            finished = item is None
+
+            # After a failure, keep consuming so producers never block forever.
+            if not batch or self._error is not None:
+                continue
+            try:
+                refs = await asyncio.to_thread(self._store.put_many, batch, self._taken_at)
+            except Exception as err:
+                logger.error("Saving %d snapshot(s) failed: %s", len(batch), err)
+                self._error = err
+                continue
+            self.saved.update((ref.device, ref.name) for ref in refs)
+            logger.debug("Saved a batch of %d snapshot(s)", len(refs))
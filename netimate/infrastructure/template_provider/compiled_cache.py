@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.template_provider.compiled_cache
+--------------------------------------------------------
+Bounded LRU cache of compiled TextFSM/TTP parsers.
+
+Building a ``textfsm.TextFSM`` or ``ttp`` object parses the template and
+compiles every regex it contains, which is wasted work when the same template
+parses the output of thousands of devices.  Entries are keyed by template path
+and file mtime, so an edited template is recompiled on its next use.
+
+Each entry keeps a small free‑list of ready parser instances: a parse checks
+one out, runs it, resets it and hands it back, so concurrent parses (thread
+pool) never share an instance and steady state never recompiles.  The cache is
+per process; every parse worker keeps its own.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from io import StringIO
+from typing import Any, Iterator, List, Optional, Tuple
+
+DEFAULT_TEMPLATE_CACHE_SIZE = 128
+MAX_IDLE_PARSERS = 8  # instances kept per template; more are built on demand
+
+TemplateKey = Tuple[str, int]  # (resolved template path, mtime in ns)
+
+
+class CompiledTemplate:
+    """A compiled template plus a free‑list of parser instances."""
+
+    def __init__(self, suffix: str, text: str):
+        self.suffix = suffix
+        self.text = text
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+        self._idle.append(self._build())  # fail fast on a broken template
+
+    def _build(self) -> Any:
+        if self.suffix == ".textfsm":
+            import textfsm
+
+            return textfsm.TextFSM(StringIO(self.text))
+        from ttp import ttp
+
+        return ttp(template=self.text)
+
+    def _reset(self, parser: Any) -> None:
+        if self.suffix == ".textfsm":
+            parser.Reset()
+        else:
+            parser.clear_input()
+            parser.clear_result()
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """Yield a parser instance that is exclusive to the caller."""
+        with self._lock:
+            parser = self._idle.pop() if self._idle else None
+        if parser is None:
+            parser = self._build()
+        yield parser  # an instance that raised is simply not returned
+        self._reset(parser)
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_PARSERS:
+                self._idle.append(parser)
+
+    def parse(self, raw_output: str) -> Any:
+        with self.checkout() as parser:
+            if self.suffix == ".textfsm":
+                rows = parser.ParseText(raw_output)
+                return [dict(zip(parser.header, r)) for r in rows]
+            parser.add_input(raw_output)
+            parser.parse(one=True)
+            return parser.result(structure="flat_list")[0]
+
+
+class CompiledTemplateCache:
+    """LRU of :class:`CompiledTemplate` keyed by ``(path, mtime)``."""
+
+    def __init__(self, maxsize: int = DEFAULT_TEMPLATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[int, CompiledTemplate]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: TemplateKey, suffix: str, text: str) -> CompiledTemplate:
+        """Return the compiled form of *text*, compiling it on a miss or stale mtime."""
+        path, mtime = key
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        compiled = CompiledTemplate(suffix, text)  # compile outside the lock
+        if self.maxsize <= 0:
+            return compiled
+        with self._lock:
+            self._entries[path] = (mtime, compiled)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache: Optional[CompiledTemplateCache] = None
+
+
+def template_cache() -> CompiledTemplateCache:
+    """Return this process's compiled‑template cache."""
+    global _cache
+    if _cache is None:
+        _cache = CompiledTemplateCache()
+    return _cache
+
+
+def configure_template_cache(maxsize: int) -> None:
+    """Resize this process's cache (also used as the parse worker initialiser)."""
+    cache = template_cache()
+    with cache._lock:
+        cache.maxsize = maxsize
+        while len(cache._entries) > max(maxsize, 0):
+            cache._entries.popitem(last=False)
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 import logging
 from functools import lru_cache
-from io import StringIO
 from pathlib import Path
-from typing import List
-
-import textfsm
-from ttp import ttp
+from typing import Any, List, Optional
 
+from netimate.infrastructure.template_provider.compiled_cache import TemplateKey
+from netimate.infrastructure.template_provider.parse_executor import ParseExecutor, parse_text
+from netimate.infrastructure.template_provider.template_index import (
+    DEFAULT_CHECK_INTERVAL,
+    TemplateIndex,
+)
 from netimate.interfaces.infrastructure.template_provider import (
     TemplateProviderInterface,
 )
@@ -21,24 +23,50 @@ class FileSystemTemplateProvider(TemplateProviderInterface):
     """Load ``*.tmpl`` files from one or more directories.
 
     * Search order respects the order of *search_paths*.
-    * Results are cached in-memory (LRU) for speed.
+    * Results are cached in-memory (LRU) for speed, and so are the compiled
+      TextFSM/TTP parsers (keyed by path and mtime, see ``compiled_cache``).
+    * Template names resolve through a :class:`TemplateIndex` built once and
+      refreshed on directory mtime changes; pass *index_path* to persist it
+      across runs.
+    * When a :class:`ParseExecutor` is supplied, :meth:`parse_async` runs the
+      CPU-bound parsing in its worker pool instead of on the event loop.
     """
 
-    def __init__(self, search_paths: List[str]):
+    def __init__(
+        self,
+        search_paths: List[str],
+        parse_executor: Optional[ParseExecutor] = None,
+        index_path: Optional[Path] = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ):
         logger.debug("Initialising FileSystemTemplateProvider with search paths: %s", search_paths)
         self._roots: list[Path] = [Path(p).expanduser().resolve() for p in search_paths]
+        self._parse_executor = parse_executor
+        self._index = TemplateIndex(self._roots, index_path, check_interval)
 
     @lru_cache(maxsize=128)
-    def _read(self, abs_path: Path) -> str:
-        # Separate helper so @lru_cache works with Path arg.
+    def _read(self, abs_path: Path, mtime_ns: int) -> str:
+        # Separate helper so @lru_cache works with Path arg; the mtime makes an
+        # edited template a cache miss.
         return abs_path.read_text(encoding="utf-8")
 
     def _get(self, name: str | Path) -> str:
+        return self._load(name)[1]
+
+    def _load(self, name: str | Path) -> tuple[TemplateKey, str]:
+        """Return the compiled-cache key and text of template *name*."""
+        resolved = self._index.resolve(name)
+        if resolved is not None:
+            path, mtime_ns = resolved
+            return (str(path), mtime_ns), self._read(path, mtime_ns)
+
+        # Not indexed (absolute path, or added since the last index check).
         for root in self._roots:
             candidate = root / name
             if candidate.is_file():
                 logger.debug("Template resolved: %s", candidate)
-                return self._read(candidate)
+                mtime_ns = candidate.stat().st_mtime_ns
+                return (str(candidate), mtime_ns), self._read(candidate, mtime_ns)
         logger.warning("Template '%s' not found in any configured search paths", name)
         raise FileNotFoundError(
             f"Template '{name}' not found in search paths: {', '.join(map(str, self._roots))}"
@@ -56,47 +84,37 @@ class FileSystemTemplateProvider(TemplateProviderInterface):
             return
 
         logger.debug("Parsing output using template '%s'", template_path)
-        template_path_obj = Path(template_path)
-        suffix = template_path_obj.suffix.lower()
-        logger.debug(f"Suffix is {suffix}")
-
-        template = self._get(template_path)
-        try:
-            if suffix == ".textfsm":
-                fsm = textfsm.TextFSM(StringIO(template))
-                headers = fsm.header
-                rows = fsm.ParseText(raw_output)
-                logger.debug("Parsed %d records using %s", len(rows), suffix)
-                return [dict(zip(headers, r)) for r in rows]
-
-            elif suffix == ".ttp":
-                logger.debug(f"Suffix is {suffix}, running .ttp block")
-                parser = ttp(raw_output, template)
-                parser.parse()
-                logger.debug(
-                    "Parsed %d records using %s",
-                    len(parser.result(structure="flat_list")[0]),
-                    suffix,
-                )
-                return parser.result(structure="flat_list")[0]
-
-        except ModuleNotFoundError as e:
-            logger.error("Optional parsing library missing (%s). Returning raw text.", e)
-            # Optional deps not installed – fall through to raw text.
-
-        logger.debug("Returning raw output (no parsing performed)")
-        # Fallback: return raw text (so caller still gets something useful)
-        return raw_output
+        suffix = Path(template_path).suffix.lower()
+        key, template = self._load(template_path)
+        return parse_text(suffix, template, raw_output, key)
+
+    async def parse_async(self, template_path: str | Path | None, raw_output: str) -> Any:
+        """Like :meth:`parse`, but dispatched to the parse executor when one is configured."""
+        if not template_path or self._parse_executor is None:
+            return self.parse(template_path, raw_output)
+
+        logger.debug(
+            "Dispatching parse of '%s' to %s pool", template_path, self._parse_executor.mode
+        )
+        suffix = Path(template_path).suffix.lower()
+        key, template = self._load(template_path)
+        return await self._parse_executor.parse(suffix, template, raw_output, key)
+
+    def close(self) -> None:
+        """Stop the parse executor's workers, if any."""
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown()
 
     def exists(self, name: str) -> bool:
         """Return ``True`` if *name* exists in any configured search root."""
+        if self._index.resolve(name) is not None:
+            return True
         return any((root / name).is_file() for root in self._roots)
 
     def list_templates(self) -> List[str]:
         """Return names of all ``.textfsm`` and ``.ttp`` templates reachable."""
-        templates = []
-        for path in self._roots:
-            for file in Path(path).rglob("*"):
-                if file.suffix in (".textfsm", ".ttp"):
-                    templates.append(file.name)
-        return templates
+        return [
+            Path(name).name
+            for name in self._index.names()
+            if Path(name).suffix in (".textfsm", ".ttp")
+        ]
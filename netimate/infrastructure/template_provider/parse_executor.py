@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.template_provider.parse_executor
+--------------------------------------------------------
+Runs TextFSM/TTP parsing off the event loop.
+
+Parsing large ``show`` outputs is pure CPU work; doing it inline on the event
+loop stalls every other SSH session the Runner is driving.  A
+:class:`ParseExecutor` ships each ``(suffix, template text, raw output)`` job to
+a pool of worker processes (falling back to threads where processes are not
+available) and hands the result back as an awaitable.
+
+Small outputs are batched: jobs below ``small_output_bytes`` are collected for
+up to ``batch_delay`` seconds (or until ``batch_size`` jobs are waiting) and
+sent to a worker together, so the per‑job IPC cost does not dominate when a
+large fleet returns short outputs.
+
+Configured through the ``parsing`` block of ``settings.yaml``::
+
+    parsing:
+      executor: process        # process | thread | inline
+      workers: 4               # default: CPU count - 1
+      batch_size: 32           # max small outputs per worker round‑trip
+      small_output_bytes: 16384
+      batch_delay: 0.005       # seconds to wait for a batch to fill
+      template_cache_size: 128 # compiled templates kept per process
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import StringIO
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from netimate.errors import ConfigError
+from netimate.infrastructure.template_provider.compiled_cache import (
+    DEFAULT_TEMPLATE_CACHE_SIZE,
+    TemplateKey,
+    configure_template_cache,
+    template_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ("process", "thread", "inline")
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_SMALL_OUTPUT_BYTES = 16 * 1024
+DEFAULT_BATCH_DELAY = 0.005
+
+# (template suffix, template text, raw output, cache key)
+ParseJob = Tuple[str, str, str, Optional[TemplateKey]]
+
+
+def default_workers() -> int:
+    """Leave one core for the event loop, but always use at least one worker."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def parse_text(
+    suffix: str, template: str, raw_output: str, key: Optional[TemplateKey] = None
+) -> Any:
+    """
+    Parse *raw_output* with the TextFSM/TTP *template* text.
+
+    * ``.textfsm`` -> list of dicts keyed by the template's ``Value`` names.
+    * ``.ttp``     -> the first result of ``ttp``'s ``flat_list`` structure.
+    * other        -> *raw_output* unchanged.
+
+    With a *key* (template path and mtime) the compiled parser is taken from
+    this process's :func:`template_cache` instead of being rebuilt.
+
+    Module‑level (and free of provider state) so it can run in worker processes.
+    """
+    try:
+        if key is not None and suffix in (".textfsm", ".ttp"):
+            return template_cache().get(key, suffix, template).parse(raw_output)
+
+        if suffix == ".textfsm":
+            import textfsm
+
+            fsm = textfsm.TextFSM(StringIO(template))
+            headers = fsm.header
+            rows = fsm.ParseText(raw_output)
+            logger.debug("Parsed %d records using %s", len(rows), suffix)
+            return [dict(zip(headers, r)) for r in rows]
+
+        elif suffix == ".ttp":
+            from ttp import ttp
+
+            parser = ttp(raw_output, template)
+            parser.parse()
+            result = parser.result(structure="flat_list")[0]
+            logger.debug("Parsed %d records using %s", len(result), suffix)
+            return result
+
+    except ModuleNotFoundError as e:
+        logger.error("Optional parsing library missing (%s). Returning raw text.", e)
+        # Optional deps not installed – fall through to raw text.
+
+    logger.debug("Returning raw output (no parsing performed)")
+    return raw_output
+
+
+def _parse_batch(jobs: List[ParseJob]) -> List[Tuple[bool, Any]]:
+    """Worker entry point: parse every job, capturing failures per job."""
+    outcomes: List[Tuple[bool, Any]] = []
+    for suffix, template, raw_output, key in jobs:
+        try:
+            outcomes.append((True, parse_text(suffix, template, raw_output, key)))
+        except Exception as err:  # pylint: disable=broad-except
+            outcomes.append((False, err))
+    return outcomes
+
+
+def _number(name: str, value: Any, minimum: float, kind: type = int) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+        raise ConfigError(f"Parsing setting '{name}' must be a number >= {minimum}, got {value!r}")
+    return kind(value)
+
+
+class ParseExecutor:
+    """Dispatches parse jobs to a process (or thread) pool, batching small ones."""
+
+    def __init__(
+        self,
+        mode: str = "process",
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        small_output_bytes: int = DEFAULT_SMALL_OUTPUT_BYTES,
+        batch_delay: float = DEFAULT_BATCH_DELAY,
+        template_cache_size: int = DEFAULT_TEMPLATE_CACHE_SIZE,
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ConfigError(
+                f"Parsing setting 'executor' must be one of {', '.join(EXECUTOR_MODES)}, "
+                f"got {mode!r}"
+            )
+        self.mode = mode
+        self.workers = default_workers() if workers is None else _number("workers", workers, 1)
+        self.batch_size = _number("batch_size", batch_size, 1)
+        self.small_output_bytes = _number("small_output_bytes", small_output_bytes, 0)
+        self.batch_delay = _number("batch_delay", batch_delay, 0, float)
+        self.template_cache_size = _number("template_cache_size", template_cache_size, 0)
+        configure_template_cache(self.template_cache_size)  # thread / inline parsing
+
+        self._pool: Optional[Executor] = None
+        self._pending: List[Tuple[ParseJob, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Future] = set()
+
+    @classmethod
+    def from_config(cls, parsing_config: Optional[Dict[str, Any]]) -> "ParseExecutor":
+        """Build an executor from the ``parsing`` settings block (may be ``None``)."""
+        parsing_config = parsing_config or {}
+        return cls(
+            mode=parsing_config.get("executor", "process"),
+            workers=parsing_config.get("workers"),
+            batch_size=parsing_config.get("batch_size", DEFAULT_BATCH_SIZE),
+            small_output_bytes=parsing_config.get("small_output_bytes", DEFAULT_SMALL_OUTPUT_BYTES),
+            batch_delay=parsing_config.get("batch_delay", DEFAULT_BATCH_DELAY),
+            template_cache_size=parsing_config.get(
+                "template_cache_size", DEFAULT_TEMPLATE_CACHE_SIZE
+            ),
+        )
+
+    # ------------------------------------------------------------------ #
+    #                            Worker pool                             #
+    # ------------------------------------------------------------------ #
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                )
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=configure_template_cache,
+                    initargs=(self.template_cache_size,),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="netimate-parse"
+                )
+            logger.debug("[Parse] Started %s pool with %d worker(s)", self.mode, self.workers)
+        return self._pool
+
+    def _fall_back_to_threads(self, err: BaseException) -> None:
+        logger.warning("Process pool unavailable for parsing (%s); falling back to threads", err)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.mode = "thread"
+
+    async def _submit(self, jobs: List[ParseJob]) -> List[Tuple[bool, Any]]:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor(), _parse_batch, jobs)
+        except (BrokenProcessPool, OSError, NotImplementedError) as err:
+            if self.mode != "process":
+                raise
+            self._fall_back_to_threads(err)
+            return await loop.run_in_executor(self._executor(), _parse_batch, jobs)
+
+    # ------------------------------------------------------------------ #
+    #                              Batching                              #
+    # ------------------------------------------------------------------ #
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: List[Tuple[ParseJob, asyncio.Future]]) -> None:
+        logger.debug("[Parse] Dispatching batch of %d small output(s)", len(batch))
+        try:
+            outcomes = await self._submit([job for job, _ in batch])
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for (_, future), (ok, value) in zip(batch, outcomes):
+            if future.done():  # caller went away
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _enqueue(self, job: ParseJob) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((job, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+        return future
+
+    # ------------------------------------------------------------------ #
+    #                             Public API                             #
+    # ------------------------------------------------------------------ #
+    async def parse(
+        self, suffix: str, template: str, raw_output: str, key: Optional[TemplateKey] = None
+    ) -> Any:
+        """Parse *raw_output* with *template* without blocking the event loop.
+
+        *key* identifies the template version for the workers' compiled cache.
+        """
+        if self.mode == "inline":
+            return parse_text(suffix, template, raw_output, key)
+
+        job = (suffix, template, raw_output, key)
+        if self.batch_size > 1 and len(raw_output) < self.small_output_bytes:
+            return await self._enqueue(job)
+
+        [(ok, value)] = await self._submit([job])
+        if not ok:
+            raise value
+        return value
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; a later :meth:`parse` starts a fresh one."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
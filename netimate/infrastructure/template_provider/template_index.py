@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.infrastructure.template_provider.template_index
+--------------------------------------------------------
+In‑memory index of the template files under the provider's search roots.
+
+Maps each relative template name (``"ios/cisco_ios_show_version.textfsm"``)
+to the file that wins in search‑root order, plus the file's mtime, so resolving
+a template on the parse path needs no filesystem probes.
+
+Freshness is tracked by directory mtime: adding, removing or renaming a
+template changes the mtime of its directory, and the index rescans a root when
+any of its directories changed.  Checks are throttled to one every
+``check_interval`` seconds; within that window a template's own mtime is also
+re‑read at most once, so in‑place edits are still picked up by the compiled
+template cache.
+
+When given an *index_path* the per‑root scan results are persisted as JSON, so
+a cold start only stats the (few) directories instead of walking every file.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_CHECK_INTERVAL = 2.0
+
+
+@dataclass
+class _RootScan:
+    """Result of walking one search root."""
+
+    dirs: Dict[str, int] = field(default_factory=dict)  # abs dir -> mtime_ns
+    files: Dict[str, int] = field(default_factory=dict)  # relative name -> mtime_ns
+
+    def is_current(self) -> bool:
+        try:
+            return all(os.stat(d).st_mtime_ns == mtime for d, mtime in self.dirs.items())
+        except OSError:
+            return False
+
+
+def _scan(root: Path) -> _RootScan:
+    scan = _RootScan()
+    if not root.is_dir():
+        return scan
+    for dirpath, _, filenames in os.walk(root):
+        try:
+            scan.dirs[dirpath] = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            continue
+        rel_dir = Path(dirpath).relative_to(root)
+        for filename in filenames:
+            try:
+                mtime = os.stat(os.path.join(dirpath, filename)).st_mtime_ns
+            except OSError:
+                continue
+            scan.files[(rel_dir / filename).as_posix()] = mtime
+    return scan
+
+
+@dataclass
+class _Entry:
+    path: Path
+    mtime_ns: int
+    checked_at: float
+
+
+class TemplateIndex:
+    """Name → path index over ordered search roots."""
+
+    def __init__(
+        self,
+        roots: Sequence[Path],
+        index_path: Optional[Path] = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ):
+        self._roots = list(roots)
+        self._index_path = index_path
+        self.check_interval = check_interval
+        self._scans: Dict[Path, _RootScan] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._checked_at = 0.0
+        self.scans = 0  # number of root walks performed (for diagnostics)
+        self._build(self._load_persisted())
+
+    # ------------------------------------------------------------------ #
+    #                             Persistence                            #
+    # ------------------------------------------------------------------ #
+    def _load_persisted(self) -> Dict[str, _RootScan]:
+        if self._index_path is None:
+            return {}
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return {
+                root: _RootScan(dirs=scan["dirs"], files=scan["files"])
+                for root, scan in data["roots"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as err:
+            logger.debug("Ignoring template index cache %s: %s", self._index_path, err)
+            return {}
+
+    def _persist(self) -> None:
+        if self._index_path is None:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "roots": {
+                str(root): {"dirs": scan.dirs, "files": scan.files}
+                for root, scan in self._scans.items()
+            },
+        }
+        tmp = self._index_path.with_name(f"{self._index_path.name}.{os.getpid()}.tmp")
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self._index_path)
+        except OSError as err:
+            logger.debug("Could not persist template index to %s: %s", self._index_path, err)
+
+    # ------------------------------------------------------------------ #
+    #                               Build                                #
+    # ------------------------------------------------------------------ #
+    def _build(self, previous: Dict[str, _RootScan], force: bool = False) -> None:
+        scanned = set()
+        for root in self._roots:
+            scan = None if force else previous.get(str(root)) or self._scans.get(root)
+            if scan is None or not scan.is_current():
+                logger.debug("Scanning template root %s", root)
+                scan = _scan(root)
+                self.scans += 1
+                scanned.add(root)
+            self._scans[root] = scan
+
+        now = time.monotonic()
+        entries: Dict[str, _Entry] = {}
+        for root in self._roots:  # first root wins, as in a search path
+            # File mtimes that were not just read (persisted or carried over)
+            # are re‑checked on first use.
+            checked_at = now if root in scanned else 0.0
+            for name, mtime in self._scans[root].files.items():
+                entries.setdefault(name, _Entry(root / name, mtime, checked_at))
+        self._entries = entries
+        self._checked_at = now
+        if scanned:
+            self._persist()
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        if not all(scan.is_current() for scan in self._scans.values()):
+            self._build({})
+
+    # ------------------------------------------------------------------ #
+    #                             Public API                             #
+    # ------------------------------------------------------------------ #
+    def resolve(self, name: str | Path) -> Optional[Tuple[Path, int]]:
+        """Return ``(path, mtime_ns)`` for template *name*, or ``None``."""
+        self._refresh()
+        key = Path(name).as_posix()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now - entry.checked_at >= self.check_interval:
+            try:
+                entry.mtime_ns = entry.path.stat().st_mtime_ns
+            except OSError:
+                # Vanished without a directory change we noticed: rescan everything.
+                self._build({}, force=True)
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+            entry.checked_at = now
+        return entry.path, entry.mtime_ns
+
+    def names(self) -> List[str]:
+        """Return every indexed relative name, in search‑root precedence."""
+        self._refresh()
+        return list(self._entries)
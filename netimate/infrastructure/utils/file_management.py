@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
+import os
 from pathlib import Path
 
 
@@ -11,3 +12,16 @@ def find_file_upward(filename: str) -> Path:
     raise FileNotFoundError(
         f"Could not find '{filename}' in any parent directory from {current_dir}"
     )
+
+
+def user_cache_dir() -> Path:
+    """Directory for netimate's disposable caches.
+
+    ``$NETIMATE_CACHE_DIR`` if set, else ``$XDG_CACHE_HOME/netimate`` (default
+    ``~/.cache/netimate``).  The directory is not created here.
+    """
+    override = os.getenv("NETIMATE_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base).expanduser() / "netimate"
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: MPL-2.0
 from abc import abstractmethod
-from typing import Dict, List, Protocol
+from typing import Any, AsyncGenerator, Dict, List, Protocol, Tuple
 
 
 class ApplicationInterface(Protocol):  # pragma: no cover
@@ -36,6 +36,22 @@ class ApplicationInterface(Protocol):  # pragma: no cover
         """
         ...
 
+    @abstractmethod
+    def stream_device_command(
+        self, device_names: List[str], command_name: str
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Execute a device-level command and yield results as devices complete.
+
+        Args:
+            device_names: List of device names (or sites) to target.
+            command_name: Name of the device command to run.
+
+        Yields:
+            ``(device name, parsed result)`` pairs in completion order.
+        """
+        ...
+
     @abstractmethod
     async def snapshot(self, device_names: List[str]) -> Dict[str, str]:
         """
@@ -45,7 +61,7 @@ class ApplicationInterface(Protocol):  # pragma: no cover
             device_names: List of device identifiers.
 
         Returns:
-            Dictionary mapping each device name to the file path of its saved config.
+            Dictionary mapping each device name to the name of its saved snapshot.
         """
         ...
 
@@ -62,6 +78,29 @@ class ApplicationInterface(Protocol):  # pragma: no cover
         """
         ...
 
+    @abstractmethod
+    def stream_diagnostic(
+        self, device_names: List[str]
+    ) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        """
+        Run the diagnostic suite and yield reports as devices complete.
+
+        Args:
+            device_names: List of device names (or sites) to target.
+
+        Yields:
+            ``(device name, command name -> parsed result)`` pairs in completion order.
+        """
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Release resources kept open between commands (e.g. pooled device
+        sessions).  Views call this once, before the event loop shuts down.
+        """
+        ...
+
     @abstractmethod
     def set_log_level(self, level: str) -> None: ...
 
@@ -69,7 +108,9 @@ class ApplicationInterface(Protocol):  # pragma: no cover
         pass
 
     @abstractmethod
-    def diff_snapshots(self, device: str, snap1: int | str, snap2: int | str) -> str:
+    def diff_snapshots(
+        self, device: str, snap1: int | str, snap2: int | str, hierarchical: bool = False
+    ) -> str:
         """
         Diff two snapshots of a device.
 
@@ -77,19 +118,20 @@ class ApplicationInterface(Protocol):  # pragma: no cover
             device: The device name.
             snap1: First snapshot ID or filename.
             snap2: Second snapshot ID or filename.
+            hierarchical: Diff IOS sections (interface, router …) and show each
+                change under its parent section lines instead of a line diff.
 
         Returns:
             A string representing the textual diff output.
         """
         ...
 
-    @staticmethod
     @abstractmethod
-    def list_snapshots_for_device(device: str) -> List[str]:
+    def list_snapshots_for_device(self, device: str) -> List[str]:
         """
         Given a device name, return a list of snapshots
 
         :param device:
-        :return: List of str file paths to snapshots for the provided device
+        :return: List of snapshot names for the provided device, oldest first
         """
         ...
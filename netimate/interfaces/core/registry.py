@@ -10,6 +10,7 @@ in‑memory implementation lives in `plugin_registry.py`.
 
 from typing import Any, Iterable, Protocol, Type
 
+from netimate.interfaces.plugin.async_device_repository import AsyncDeviceRepository
 from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
 from netimate.interfaces.plugin.device_command import DeviceCommand
 from netimate.interfaces.plugin.device_repository import DeviceRepository
@@ -30,7 +31,9 @@ class PluginRegistryInterface(Protocol):
     def register(self, kind: "Any", name: str, plugin: Type[Plugin]) -> None: ...
     def register_device_command(self, name: str, command_cls: Type[DeviceCommand]) -> None: ...
     def register_protocol(self, name: str, protocol_cls: Type[ConnectionProtocol]) -> None: ...
-    def register_device_repository(self, name: str, repo_cls: Type[DeviceRepository]) -> None: ...
+    def register_device_repository(
+        self, name: str, repo_cls: Type[DeviceRepository] | Type[AsyncDeviceRepository]
+    ) -> None: ...
     def get_device_command(self, name: str) -> "Type": ...
     def get_protocol(self, name: str) -> "Type": ...
     def get_device_repository(self, name: str) -> "Type": ...
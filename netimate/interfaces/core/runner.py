@@ -8,7 +8,7 @@ engine responsible for applying a :class:`DeviceCommand` across one or many
 results.
 """
 
-from typing import Any, List, Protocol, Tuple
+from typing import Any, AsyncGenerator, Iterable, List, Protocol, Sequence, Tuple
 
 from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
 from netimate.interfaces.plugin.device_command import DeviceCommand
@@ -24,9 +24,35 @@ class RunnerInterface(Protocol):
     2. Dispatch the provided `DeviceCommand` using the device's connection
        protocol.
     3. Return a list of per‑device result dictionaries that the calling
-       view (CLI/Shell) can render.
+       view (CLI/Shell) can render, or stream them one by one as devices
+       complete.
+    4. Release any sessions they keep open when :meth:`close` is awaited.
+    5. Report the per‑device/per‑site circuit breakers that are not closed
+       via :meth:`circuit_breakers` (an empty list if they keep none).
     """
 
     async def run(
         self, device_protocols: List[Tuple[Device, ConnectionProtocol]], command: DeviceCommand
     ) -> List[dict[str, Any]]: ...
+
+    def stream(
+        self,
+        device_protocols: Iterable[Tuple[Device, ConnectionProtocol]],
+        command: DeviceCommand,
+    ) -> AsyncGenerator[dict[str, Any], None]: ...
+
+    async def run_many(
+        self,
+        device_protocols: List[Tuple[Device, ConnectionProtocol]],
+        commands: Sequence[DeviceCommand],
+    ) -> List[dict[str, Any]]: ...
+
+    def stream_many(
+        self,
+        device_protocols: Iterable[Tuple[Device, ConnectionProtocol]],
+        commands: Sequence[DeviceCommand],
+    ) -> AsyncGenerator[dict[str, Any], None]: ...
+
+    async def close(self) -> None: ...
+
+    def circuit_breakers(self) -> List[dict[str, Any]]: ...
@@ -19,6 +19,10 @@ class SettingsInterface(Protocol):
     • ``log_level``   – current logger level ("off" | "info" | "debug")
     • ``template_paths`` – ordered list of template directories
     • ``plugin_configs`` – arbitrary mapping forwarded to plugin constructors
+    • ``runner_config``  – ``runner`` block (concurrency limits) for the Runner
+    • ``parsing_config`` – ``parsing`` block (parse executor) for the template provider
+    • ``inventory_config`` – ``inventory`` block (cache TTL) for the inventory service
+    • ``diagnostic_config`` – ``diagnostic`` block (command set) for ``diagnostic``
     """
 
     @property
@@ -37,3 +41,15 @@ class SettingsInterface(Protocol):
 
     @property
     def plugin_configs(self) -> Dict[str, str]: ...
+
+    @property
+    def runner_config(self) -> Dict: ...
+
+    @property
+    def parsing_config(self) -> Dict: ...
+
+    @property
+    def inventory_config(self) -> Dict: ...
+
+    @property
+    def diagnostic_config(self) -> Dict: ...
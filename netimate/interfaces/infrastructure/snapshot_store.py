@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MPL-2.0
+"""Infrastructure-layer abstraction for persisting device config snapshots.
+The application saves and reads snapshots through this contract without
+caring how they are laid out on disk (flat files, content-addressed blobs,
+a database, object storage, etc.).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from difflib import unified_diff
+from typing import List, Mapping, Optional
+
+from netimate.models.snapshot import SnapshotRef
+
+
+class SnapshotStoreInterface(ABC):  # pragma: no cover
+    """Thin contract for saving, listing and reading snapshots."""
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """Return whether the store has been created (anything was ever saved)."""
+        ...
+
+    @abstractmethod
+    def put(self, device: str, text: str, taken_at: str) -> SnapshotRef:
+        """Save *text* as the snapshot of *device* taken at *taken_at*."""
+        ...
+
+    def put_many(self, snapshots: Mapping[str, str], taken_at: str) -> List[SnapshotRef]:
+        """Save one snapshot per ``device -> text`` entry, all taken at *taken_at*.
+
+        Stores with an index should record the whole batch atomically.
+        """
+        return [self.put(device, text, taken_at) for device, text in snapshots.items()]
+
+    @abstractmethod
+    def snapshots(
+        self,
+        device: Optional[str] = None,
+        since: Optional[str | datetime] = None,
+        until: Optional[str | datetime] = None,
+        latest: Optional[int] = None,
+    ) -> List[SnapshotRef]:
+        """Return snapshots sorted by device, then oldest first.
+
+        Args:
+            device: Only this device's snapshots (all devices if ``None``).
+            since: Only snapshots taken at or after this time.
+            until: Only snapshots taken at or before this time.
+            latest: Only the *latest* most recent matching snapshots.
+
+        Times are ``datetime`` objects or ``%Y%m%d_%H%M%S`` strings.
+        """
+        ...
+
+    @abstractmethod
+    def read(self, device: str, name: str) -> str:
+        """Return the text of snapshot *name* of *device*.
+
+        Raises:
+            FileNotFoundError: if no such snapshot exists.
+        """
+        ...
+
+    def diff(self, device: str, old: str, new: str, context: int = 3) -> str:
+        """Return a unified diff (``""`` if identical) from snapshot *old* to *new*.
+
+        Stores that keep deltas should override this to avoid re-comparing
+        the two full configs.
+        """
+        return "\n".join(
+            unified_diff(
+                self.read(device, old).splitlines(),
+                self.read(device, new).splitlines(),
+                fromfile=old,
+                tofile=new,
+                lineterm="",
+                n=context,
+            )
+        )
@@ -34,6 +34,18 @@ class TemplateProviderInterface(ABC):  # pragma: no cover
         """
         ...
 
+    async def parse_async(self, template_path: str | Path | None, raw_output: str) -> Any:
+        """Awaitable :meth:`parse` for callers running on the event loop.
+
+        Implementations backed by a worker pool should override this so
+        CPU-bound parsing does not block other sessions; the default parses
+        inline.
+        """
+        return self.parse(template_path, raw_output)
+
+    def close(self) -> None:
+        """Release any resources (e.g. parse workers) held by the provider."""
+
     @abstractmethod
     def exists(self, name: str) -> bool:
         """Cheap test whether a template is available (does **not** load it)."""
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.interfaces.plugin.async_device_repository
+--------------------------------------------------
+Asynchronous counterpart of :class:`DeviceRepository`.
+
+Repository plugins that talk to a database or an HTTP CMDB should not block
+the event loop while device sessions are in flight.  Such plugins implement
+:class:`AsyncDeviceRepository` directly (e.g. with asyncpg or httpx);
+existing synchronous plugins are wrapped in :class:`ThreadedDeviceRepository`,
+which runs each call in the default thread pool.  The inventory service
+accepts either and always talks to the async contract on async paths.
+"""
+
+import asyncio
+from abc import abstractmethod
+from typing import AsyncIterator, Dict, Hashable, Iterable, List, Optional
+
+from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.interfaces.plugin.plugin import Plugin
+from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+
+
+class AsyncDeviceRepository(Plugin):  # pragma: no cover
+    """Base class for device data‑source plugins with a coroutine API."""
+
+    @abstractmethod
+    def __init__(self, plugin_settings: Dict | None = None):
+        super().__init__(plugin_settings)
+
+    @abstractmethod
+    async def list_devices(self) -> List[Device]:
+        """List all available devices."""
+        pass
+
+    async def list_device_table(self) -> DeviceTable:
+        """Return the inventory in columnar form; see :meth:`DeviceRepository.list_device_table`."""
+        return DeviceTable.from_devices(await self.list_devices())
+
+    async def get_devices(self, names: Iterable[str]) -> List[Device]:
+        """Return the devices called *names* (unknown names are skipped)."""
+        return [device async for device in self.iter_devices(names=names)]
+
+    async def iter_devices(
+        self, names: Optional[Iterable[str]] = None, site: Optional[str] = None
+    ) -> AsyncIterator[Device]:
+        """
+        Yield devices matching *names* and/or *site* (all devices by default).
+
+        The default filters :meth:`list_devices`; backends that can filter or
+        page at the source should override it.
+        """
+        wanted = None if names is None else set(names)
+        for device in await self.list_devices():
+            if (wanted is None or device.name in wanted) and (site is None or device.site == site):
+                yield device
+
+    async def change_token(self) -> Optional[Hashable]:
+        """See :meth:`DeviceRepository.change_token`."""
+        return None
+
+
+class ThreadedDeviceRepository(AsyncDeviceRepository):
+    """Adapter exposing a synchronous :class:`DeviceRepository` as async, via threads."""
+
+    def __init__(self, repository: DeviceRepository):
+        super().__init__(repository.plugin_settings)
+        self.repository = repository
+
+    @staticmethod
+    def plugin_name() -> str:
+        return "threaded-adapter"
+
+    async def list_devices(self) -> List[Device]:
+        return await asyncio.to_thread(self.repository.list_devices)
+
+    async def list_device_table(self) -> DeviceTable:
+        return await asyncio.to_thread(self.repository.list_device_table)
+
+    async def get_devices(self, names: Iterable[str]) -> List[Device]:
+        return await asyncio.to_thread(self.repository.find_devices, list(names))
+
+    async def iter_devices(
+        self, names: Optional[Iterable[str]] = None, site: Optional[str] = None
+    ) -> AsyncIterator[Device]:
+        wanted = None if names is None else list(names)
+        for device in await asyncio.to_thread(self.repository.find_devices, wanted, site):
+            yield device
+
+    async def change_token(self) -> Optional[Hashable]:
+        return await asyncio.to_thread(self.repository.change_token)
@@ -67,6 +67,10 @@ class ConnectionProtocol(Plugin):  # pragma: no cover
     1. ``connect``     – open transport / login
     2. ``send_command`` – execute a single command string
     3. ``disconnect``  – cleanly close the session
+
+    Between commands the Runner may keep a connected instance in its
+    connection pool; ``is_alive`` is consulted before an idle session is
+    reused.
     """
 
     def __init_subclass__(cls, **kwargs):
@@ -103,3 +107,12 @@ class ConnectionProtocol(Plugin):  # pragma: no cover
     @abstractmethod
     async def disconnect(self) -> None:
         """Close the transport and free resources."""
+
+    async def is_alive(self) -> bool:
+        """Return ``False`` if a previously connected session can no longer be used.
+
+        Used by the Runner's connection pool as a cheap health check before
+        reusing an idle session.  The default assumes the session is healthy;
+        plugins should override it when the transport exposes a liveness probe.
+        """
+        return True
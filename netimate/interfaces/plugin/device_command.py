@@ -64,6 +64,18 @@ class DeviceCommand(Plugin):  # pragma: no cover
         """
         return self._template_provider.parse(self.template_file(), raw_output)
 
+    async def parse_async(self, raw_output: str) -> Any:
+        """
+        Awaitable variant of :meth:`parse` used by the Runner.
+
+        Commands relying on the default :meth:`parse` have their output parsed
+        by the template provider's worker pool, off the event loop.  Commands
+        that override :meth:`parse` keep their custom logic and run it inline.
+        """
+        if type(self).parse is DeviceCommand.parse:
+            return await self._template_provider.parse_async(self.template_file(), raw_output)
+        return self.parse(raw_output)
+
     def summarise_result(self, result: Any) -> str:
         """
         Optional: provide a 1-line summary of parsed results, for diagnostics.
@@ -7,10 +7,11 @@ from arbitrary backends (YAML file, REST API, SQL DB, etc.).  Implementations
 are looked up via the PluginRegistry when the Application starts.
 """
 from abc import abstractmethod
-from typing import Dict, List
+from typing import Dict, Hashable, Iterable, List, Optional
 
 from netimate.interfaces.plugin.plugin import Plugin
 from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
 
 
 class DeviceRepository(Plugin):  # pragma: no cover
@@ -38,3 +39,40 @@ class DeviceRepository(Plugin):  # pragma: no cover
     def list_devices(self) -> List[Device]:
         """List all available devices."""
         pass
+
+    def list_device_table(self) -> DeviceTable:
+        """
+        Return the inventory in columnar form (see :class:`DeviceTable`).
+
+        The inventory cache loads through this method.  The default converts
+        :meth:`list_devices`; backends that read records or rows in bulk
+        should override it to skip building a :class:`Device` per entry.
+        """
+        return DeviceTable.from_devices(self.list_devices())
+
+    def find_devices(
+        self, names: Optional[Iterable[str]] = None, site: Optional[str] = None
+    ) -> List[Device]:
+        """
+        Return only the devices called *names* and/or in *site*.
+
+        The default filters :meth:`list_devices`; backends that can filter at
+        the source (e.g. in SQL) should override it.
+        """
+        wanted = None if names is None else set(names)
+        return [
+            device
+            for device in self.list_devices()
+            if (wanted is None or device.name in wanted) and (site is None or device.site == site)
+        ]
+
+    def change_token(self) -> Optional[Hashable]:
+        """
+        Return a cheap value that changes whenever the inventory changes
+        (file mtime, a database ``updated_at`` watermark, an ETag …).
+
+        The inventory cache compares tokens to decide whether to load
+        the inventory again.  ``None`` (the default) means the backend
+        offers no change signal and the cache falls back to its TTL.
+        """
+        return None
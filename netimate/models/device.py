@@ -5,12 +5,19 @@ netimate.models.device
 Simple dataclass representing a managed network device.  Instances are
 created by DeviceRepository plugins and consumed by the Runner and
 ConnectionProtocol plugins.
+
+``Device`` uses ``__slots__`` so large inventories do not pay for a
+per‑instance ``__dict__``.  :class:`FrozenDevice` is the immutable, hashable
+variant for use as a dict key or set member; convert with
+:meth:`Device.freeze` / :meth:`FrozenDevice.thaw`.
 """
 
 from dataclasses import dataclass
 
+DEVICE_FIELDS = ("name", "host", "username", "password", "protocol", "platform", "site")
+
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Dataclass holding connection metadata for a single device."""
 
@@ -21,3 +28,22 @@ class Device:
     protocol: str
     platform: str
     site: str | None = None
+
+    def freeze(self) -> "FrozenDevice":
+        return FrozenDevice(*(getattr(self, field) for field in DEVICE_FIELDS))
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenDevice:
+    """Immutable, hashable counterpart of :class:`Device`."""
+
+    name: str
+    host: str
+    username: str
+    password: str
+    protocol: str
+    platform: str
+    site: str | None = None
+
+    def thaw(self) -> Device:
+        return Device(*(getattr(self, field) for field in DEVICE_FIELDS))
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.models.device_table
+----------------------------
+Columnar bulk form of an inventory.
+
+A :class:`DeviceTable` keeps one list per :class:`Device` field instead of
+one object per device.  The low‑cardinality columns (``username``,
+``protocol``, ``platform``, ``site``) are interned, so 50k devices spread
+over a handful of sites share a handful of strings.  Repositories can build
+a table straight from file records or database rows; the inventory indexes
+the columns and only materialises :class:`Device` objects for the rows that
+are actually selected.
+"""
+
+import sys
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from netimate.models.device import DEVICE_FIELDS, Device
+
+_INTERNED = ("username", "protocol", "platform", "site")
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class DeviceTable:
+    """Column‑per‑field storage of device records."""
+
+    __slots__ = DEVICE_FIELDS
+
+    def __init__(self) -> None:
+        self.name: List[str] = []
+        self.host: List[str] = []
+        self.username: List[str] = []
+        self.password: List[str] = []
+        self.protocol: List[str] = []
+        self.platform: List[str] = []
+        self.site: List[Optional[str]] = []
+
+    def append(
+        self,
+        name: str,
+        host: str,
+        username: str,
+        password: str,
+        protocol: str,
+        platform: str,
+        site: Optional[str] = None,
+    ) -> None:
+        """Add one row; takes the same arguments as :class:`Device`."""
+        self.name.append(name)
+        self.host.append(host)
+        self.username.append(_intern(username))
+        self.password.append(password)
+        self.protocol.append(_intern(protocol))
+        self.platform.append(_intern(platform))
+        self.site.append(_intern(site))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "DeviceTable":
+        """Build from mappings such as the entries of ``devices.yaml``."""
+        table = cls()
+        for record in records:
+            table.append(**record)
+        return table
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> "DeviceTable":
+        """Build from tuples in :data:`DEVICE_FIELDS` order (e.g. DB rows)."""
+        table = cls()
+        for row in rows:
+            table.append(*row)
+        return table
+
+    @classmethod
+    def from_columns(cls, columns: Sequence[List[Any]]) -> "DeviceTable":
+        """Build from one list per field, in :data:`DEVICE_FIELDS` order (see :meth:`columns`)."""
+        if len(columns) != len(DEVICE_FIELDS) or len({len(c) for c in columns}) > 1:
+            raise ValueError("Device table columns must match DEVICE_FIELDS and be equally long")
+        table = cls()
+        for field, column in zip(DEVICE_FIELDS, columns):
+            if field in _INTERNED:
+                # Few distinct values: intern each once, then map.
+                interned = {value: _intern(value) for value in set(column)}
+                column = [interned[value] for value in column]
+            setattr(table, field, list(column))
+        return table
+
+    @classmethod
+    def from_devices(cls, devices: Iterable[Device]) -> "DeviceTable":
+        table = cls()
+        for device in devices:
+            table.append(*(getattr(device, field) for field in DEVICE_FIELDS))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def columns(self) -> Tuple[List[Any], ...]:
+        """Return the columns in :data:`DEVICE_FIELDS` order (plain lists, e.g. for caching)."""
+        return tuple(getattr(self, field) for field in DEVICE_FIELDS)
+
+    def column(self, field: str) -> List[Any]:
+        if field not in DEVICE_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def device(self, row: int) -> Device:
+        """Materialise row *row* as a :class:`Device`."""
+        return Device(
+            self.name[row],
+            self.host[row],
+            self.username[row],
+            self.password[row],
+            self.protocol[row],
+            self.platform[row],
+            self.site[row],
+        )
+
+    def to_devices(self) -> List[Device]:
+        return [
+            Device(*row)
+            for row in zip(
+                self.name,
+                self.host,
+                self.username,
+                self.password,
+                self.protocol,
+                self.platform,
+                self.site,
+            )
+        ]
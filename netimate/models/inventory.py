@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.models.inventory
+-------------------------
+Indexed, read‑only view over a list of :class:`Device` objects.
+
+Repositories return a flat list; resolving user input against it ("these
+names", "everything in site X", "all ios devices") used to mean a linear scan
+per lookup.  :class:`DeviceInventory` builds hash indexes by name, site,
+platform and protocol once, so lookups are O(1) and selections are set
+operations.  Results keep the repository's order.
+
+The inventory can also be built from a columnar :class:`DeviceTable`; the
+indexes are then built from the columns and :class:`Device` objects are only
+created for the rows that are looked up or selected.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+
+# attribute value -> device names; the inner dict is an insertion-ordered set.
+_Index = Dict[str, Dict[str, None]]
+
+
+class DeviceInventory:
+    """Devices indexed by name, site, platform and protocol."""
+
+    def __init__(self, devices: Iterable[Device] | DeviceTable):
+        self._rows: Dict[int, Device] = {}
+        if isinstance(devices, DeviceTable):
+            table = devices
+        else:
+            self._rows = dict(enumerate(devices))
+            table = DeviceTable.from_devices(self._rows.values())
+        self._table = table
+
+        # name -> row; the first definition wins, as with a linear search.
+        self._by_name: Dict[str, int] = {}
+        for row, name in enumerate(table.name):
+            self._by_name.setdefault(name, row)
+        self._by_site = self._index(table.site)
+        self._by_platform = self._index(table.platform)
+        self._by_protocol = self._index(table.protocol)
+
+    def _index(self, column: Sequence[Optional[str]]) -> _Index:
+        index: _Index = {}
+        for name, row in self._by_name.items():
+            value = column[row]
+            if value:
+                index.setdefault(value, {})[name] = None
+        return index
+
+    def _device(self, row: int) -> Device:
+        device = self._rows.get(row)
+        if device is None:
+            device = self._rows[row] = self._table.device(row)
+        return device
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __iter__(self) -> Iterator[Device]:
+        return (self._device(row) for row in self._by_name.values())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    @property
+    def table(self) -> DeviceTable:
+        return self._table
+
+    @property
+    def devices(self) -> List[Device]:
+        return list(self)
+
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+    def get(self, name: str) -> Optional[Device]:
+        row = self._by_name.get(name)
+        return None if row is None else self._device(row)
+
+    def sites(self) -> List[str]:
+        return sorted(self._by_site)
+
+    def platforms(self) -> List[str]:
+        return sorted(self._by_platform)
+
+    def protocols(self) -> List[str]:
+        return sorted(self._by_protocol)
+
+    def is_site(self, name: str) -> bool:
+        return name in self._by_site
+
+    def names_in_site(self, site: str) -> List[str]:
+        return list(self._by_site.get(site, ()))
+
+    def names_with_platform(self, platform: str) -> List[str]:
+        return list(self._by_platform.get(platform, ()))
+
+    def names_with_protocol(self, protocol: str) -> List[str]:
+        return list(self._by_protocol.get(protocol, ()))
+
+    def missing(self, names: Iterable[str]) -> List[str]:
+        """Return the entries of *names* that are not device names."""
+        return [name for name in names if name not in self._by_name]
+
+    def select(self, names: Iterable[str]) -> List[Device]:
+        """
+        Return the devices called *names*, in the order given and without
+        duplicates.  Raises ``KeyError`` listing every unknown name.
+        """
+        wanted = list(dict.fromkeys(names))
+        missing = self.missing(wanted)
+        if missing:
+            raise KeyError(missing)
+        return [self._device(self._by_name[name]) for name in wanted]
+
+    def filter(
+        self,
+        site: Optional[str] = None,
+        platform: Optional[str] = None,
+        protocol: Optional[str] = None,
+    ) -> List[Device]:
+        """Return the devices matching every given attribute, in inventory order."""
+        candidates = [
+            index.get(value, {})
+            for index, value in (
+                (self._by_site, site),
+                (self._by_platform, platform),
+                (self._by_protocol, protocol),
+            )
+            if value is not None
+        ]
+        if not candidates:
+            return self.devices
+        # Walk the smallest index (already in inventory order), test the others.
+        candidates.sort(key=len)
+        first, others = candidates[0], candidates[1:]
+        return [
+            self._device(self._by_name[name])
+            for name in first
+            if all(name in other for other in others)
+        ]
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: MPL-2.0
+"""
+netimate.models.snapshot
+------------------------
+Index entry describing one stored running‑config snapshot.  Produced by the
+snapshot store and consumed by ``list snapshots`` / ``diff-snapshots``.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+SNAPSHOT_MARKER = "_running_config_"
+
+
+@dataclass(slots=True, frozen=True)
+class SnapshotRef:
+    """A snapshot as listed to users: ``<device>_running_config_<taken_at>``."""
+
+    name: str
+    device: str
+    taken_at: str
+    digest: Optional[str] = None  # content hash; None for legacy plain‑text files
+    size: int = 0  # uncompressed bytes
+
+    @staticmethod
+    def make_name(device: str, taken_at: str) -> str:
+        return f"{device}{SNAPSHOT_MARKER}{taken_at}"
@@ -9,6 +9,7 @@ supported by Netmiko but not yet by Scrapli.
 
 import asyncio
 import logging
+from typing import Dict
 
 from netmiko import (
     ConnectHandler,
@@ -36,15 +37,17 @@ class NetmikoSSHConnectionProtocol(ConnectionProtocol):
     application remains non‑blocking.
     """
 
-    def __init__(self, device: Device):
+    def __init__(self, device: Device, plugin_settings: Dict | None = None):
         """
         Parameters
         ----------
         device:
             :class:`netimate.models.device.Device` connection parameters for
             the target host (host, username, password, etc.).
+        plugin_settings:
+            Optional plugin‑specific configuration block; currently unused.
         """
-        super().__init__(device)
+        super().__init__(device, plugin_settings)
         self.device = device
         self.connection = None
 
@@ -85,6 +88,13 @@ class NetmikoSSHConnectionProtocol(ConnectionProtocol):
         except Exception as err:  # pylint: disable=broad-except
             raise ConnectionProtocolError("Failed to execute command") from err
 
+    async def is_alive(self) -> bool:
+        """Probe the SSH session without sending a command."""
+        if self.connection is None:
+            return False
+        loop = asyncio.get_running_loop()
+        return bool(await loop.run_in_executor(None, self.connection.is_alive))
+
     async def disconnect(self):
         """Cleanly close the Netmiko SSH session."""
         if self.connection is None:
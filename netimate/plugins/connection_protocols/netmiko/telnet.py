@@ -8,6 +8,7 @@ legacy devices that only expose a Telnet management channel.
 
 import asyncio
 import logging
+from typing import Dict
 
 from netmiko import (
     ConnectHandler,
@@ -29,15 +30,17 @@ logger = logging.getLogger(__name__)
 class NetmikoTelnetConnectionProtocol(ConnectionProtocol):
     """Async wrapper around Netmiko's Telnet ConnectHandler."""
 
-    def __init__(self, device: Device):
+    def __init__(self, device: Device, plugin_settings: Dict | None = None):
         """
         Parameters
         ----------
         device:
             :class:`netimate.models.device.Device` connection parameters for
             the target host (host, username, password, etc.).
+        plugin_settings:
+            Optional plugin‑specific configuration block; currently unused.
         """
-        super().__init__(device)
+        super().__init__(device, plugin_settings)
         self.device = device
         self.connection = None
 
@@ -78,6 +81,13 @@ class NetmikoTelnetConnectionProtocol(ConnectionProtocol):
         except Exception as err:  # pylint: disable=broad-except
             raise ConnectionProtocolError("Failed to execute command") from err
 
+    async def is_alive(self) -> bool:
+        """Probe the Telnet session without sending a command."""
+        if self.connection is None:
+            return False
+        loop = asyncio.get_running_loop()
+        return bool(await loop.run_in_executor(None, self.connection.is_alive))
+
     async def disconnect(self):
         """Close the Telnet session."""
         if self.connection is None:
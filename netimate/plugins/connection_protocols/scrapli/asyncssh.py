@@ -118,6 +118,11 @@ class ScrapliAsyncsshConnectionProtocol(ConnectionProtocol):
         except Exception as err:  # pylint: disable=broad-except
             raise ConnectionProtocolError("Failed to execute command") from err
 
+    async def is_alive(self) -> bool:
+        if not self.client:
+            return False
+        return bool(self.client.isalive())
+
     async def disconnect(self):
         if not self.client:
             return
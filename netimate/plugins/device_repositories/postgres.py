@@ -1,11 +1,59 @@
 # SPDX-License-Identifier: MPL-2.0
+"""
+Postgres device repository.
+
+Connections come from a :class:`~psycopg2.pool.ThreadedConnectionPool`
+shared by every repository instance with the same connection settings, so
+repeated loads (and change checks) reuse a logged‑in connection.  Devices
+are read through a server‑side (named) cursor in ``fetch_size`` batches, so
+an 80k‑row table is streamed rather than buffered twice, and
+:meth:`find_devices` pushes name/site filters into the ``WHERE`` clause.
+
+Plugin settings (all optional)::
+
+    plugin_configs:
+      postgres:
+        dbname: netimate
+        user: netimate
+        password: ...            # or NETIMATE_PG_PASSWORD
+        host: localhost
+        port: 5432
+        query: SELECT name, host, username, password, protocol, platform, site FROM devices
+        change_query: SELECT max(updated_at), count(*) FROM devices
+        pool_min: 1
+        pool_max: 4
+        fetch_size: 2000
+"""
+
+import logging
 import os
-from typing import Dict
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
 
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
 from netimate.interfaces.plugin.device_repository import DeviceRepository
 from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY = "SELECT name, host, username, password, protocol, platform, site FROM devices"
+DEFAULT_CHANGE_QUERY = "SELECT max(updated_at), count(*) FROM devices"
+DEFAULT_FETCH_SIZE = 2000
+
+_pools: Dict[Tuple, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def close_pools() -> None:
+    """Close every pooled connection (used by tests and on shutdown)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
 
 
 class PostgresDeviceRepository(DeviceRepository):
@@ -14,13 +62,14 @@ class PostgresDeviceRepository(DeviceRepository):
         if not self.plugin_settings:
             raise ValueError("Settings file missing postgres config!")
         self._postgres_config: Dict = plugin_settings
+        self._fetch_size = int(plugin_settings.get("fetch_size", DEFAULT_FETCH_SIZE))
 
     @staticmethod
     def plugin_name() -> str:
         return "postgres"
 
-    def list_devices(self) -> list[Device]:
-        conn = psycopg2.connect(
+    def _connect_kwargs(self) -> Dict[str, Any]:
+        return dict(
             dbname=self._postgres_config.get("dbname", "netimate"),
             user=self._postgres_config.get("user", "netimate"),
             password=self._postgres_config.get("password")
@@ -28,26 +77,96 @@ class PostgresDeviceRepository(DeviceRepository):
             host=self._postgres_config.get("host", "localhost"),
             port=self._postgres_config.get("port", "5432"),
         )
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                self._postgres_config.get(
-                    "query",
-                    "SELECT name, host, username, password, protocol, platform, site FROM devices",
-                )
-            )
-            rows = cur.fetchall()
-            return [
-                Device(
-                    name=row[0],
-                    host=row[1],
-                    username=row[2],
-                    password=row[3],
-                    protocol=row[4],
-                    platform=row[5],
-                    site=row[6],
+
+    def _pool(self) -> ThreadedConnectionPool:
+        kwargs = self._connect_kwargs()
+        key = tuple(sorted(kwargs.items()))
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None or pool.closed:
+                pool = _pools[key] = ThreadedConnectionPool(
+                    int(self._postgres_config.get("pool_min", 1)),
+                    int(self._postgres_config.get("pool_max", 4)),
+                    **kwargs,
                 )
-                for row in rows
-            ]
+            return pool
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        pool = self._pool()
+        conn = pool.getconn()
+        try:
+            yield conn
         finally:
-            conn.close()
+            try:
+                # End the read transaction so the pooled connection is idle.
+                conn.rollback()
+                broken = bool(conn.closed)
+            except psycopg2.Error:
+                broken = True
+            pool.putconn(conn, close=broken)
+
+    def _filtered_query(
+        self, names: Optional[Iterable[str]], site: Optional[str]
+    ) -> Tuple[str, Optional[List[Any]]]:
+        query = self._postgres_config.get("query", DEFAULT_QUERY)
+        clauses: List[str] = []
+        params: List[Any] = []
+        if names is not None:
+            clauses.append("name = ANY(%s)")
+            params.append(list(names))
+        if site is not None:
+            clauses.append("site = %s")
+            params.append(site)
+        if clauses:
+            # Wrap the (possibly user supplied) query so filters apply to its result.
+            query = f"SELECT * FROM ({query}) AS devices WHERE {' AND '.join(clauses)}"
+        # No parameters at all, so a literal '%' in a custom query is not taken as a placeholder.
+        return query, params or None
+
+    def iter_rows(
+        self, names: Optional[Iterable[str]] = None, site: Optional[str] = None
+    ) -> Iterator[Tuple]:
+        """Stream device rows through a server‑side cursor, ``fetch_size`` at a time."""
+        query, params = self._filtered_query(names, site)
+        with self._connection() as conn:
+            cur = conn.cursor(name="netimate_devices")
+            try:
+                cur.execute(query, params)
+                while True:
+                    rows = cur.fetchmany(self._fetch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cur.close()
+
+    def list_devices(self) -> list[Device]:
+        return self.list_device_table().to_devices()
+
+    def list_device_table(self) -> DeviceTable:
+        return DeviceTable.from_rows(self.iter_rows())
+
+    def find_devices(
+        self, names: Optional[Iterable[str]] = None, site: Optional[str] = None
+    ) -> List[Device]:
+        return DeviceTable.from_rows(self.iter_rows(names, site)).to_devices()
+
+    def change_token(self) -> Optional[Hashable]:
+        """
+        ``updated_at`` watermark plus row count of the devices table.
+
+        The query can be overridden with ``change_query``; set it to an empty
+        string to disable change detection (the cache then relies on its TTL).
+        """
+        query = self._postgres_config.get("change_query", DEFAULT_CHANGE_QUERY)
+        if not query:
+            return None
+        try:
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute(query)
+                row = cur.fetchone()
+        except psycopg2.Error as e:
+            logger.debug("Postgres change query failed (%s); falling back to TTL", e)
+            return None
+        return tuple(str(value) for value in row) if row else None
@@ -1,15 +1,42 @@
 # SPDX-License-Identifier: MPL-2.0
+"""
+YAML device repository.
+
+Reads ``devices:`` from the file named by ``device_file`` (searched upwards
+from the current directory) with libyaml's ``CSafeLoader`` when PyYAML was
+built with it.  The parsed inventory is also written, column by column, to a
+``marshal`` cache in the user cache directory keyed by the file's path, mtime
+and size, so later loads – including from new CLI processes – skip YAML
+parsing altogether.  The cache holds the inventory's passwords, so it is
+only ever created owner‑only (``0600``, in a ``0700`` directory) and a cache
+file that group or others can read is ignored and rewritten.  Set
+``cache: false`` in the plugin settings to disable the cache.
+"""
+
+import hashlib
 import logging
-from typing import Dict, List
+import marshal
+import os
+import stat
+import sys
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
 
 import yaml
 
-from netimate.infrastructure.utils.file_management import find_file_upward
+from netimate.infrastructure.utils.file_management import find_file_upward, user_cache_dir
 from netimate.interfaces.plugin.device_repository import DeviceRepository
 from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
 
 logger = logging.getLogger(__name__)
 
+# libyaml based loader is ~10x faster; fall back to the pure Python one.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CACHE_VERSION = 1
+CACHE_MODE = 0o600
+
 
 class YamlDeviceRepository(DeviceRepository):
     def __init__(self, plugin_settings: Dict):
@@ -21,16 +48,77 @@ class YamlDeviceRepository(DeviceRepository):
             raise ValueError("Settings file missing yaml.device_file!")
         else:
             self._device_file: str = self._yaml_config["device_file"]
+        self._use_cache = bool(self._yaml_config.get("cache", True))
 
     @staticmethod
     def plugin_name() -> str:
         return "yaml"
 
     def list_devices(self) -> List[Device]:
-        logger.info(f"Loading all devices from YAML: {self._device_file}")
-        path = find_file_upward(self._device_file)
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-        devices = [Device(**item) for item in data.get("devices", [])]
+        devices = self.list_device_table().to_devices()
         logger.debug(f"Loaded devices: {devices}")
         return devices
+
+    def list_device_table(self) -> DeviceTable:
+        path = find_file_upward(self._device_file).resolve()
+        info = path.stat()
+        key = (
+            CACHE_VERSION,
+            sys.implementation.cache_tag,
+            str(path),
+            info.st_mtime_ns,
+            info.st_size,
+        )
+
+        table = self._read_cache(key) if self._use_cache else None
+        if table is None:
+            logger.info(f"Loading all devices from YAML: {path}")
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=SafeLoader) or {}
+            table = DeviceTable.from_records(data.get("devices") or [])
+            if self._use_cache:
+                self._write_cache(key, table)
+        return table
+
+    def change_token(self) -> Optional[Hashable]:
+        """Path, mtime and size of the device file (``None`` if it cannot be found)."""
+        try:
+            path = find_file_upward(self._device_file)
+            info = path.stat()
+        except OSError:
+            return None
+        return str(path), info.st_mtime_ns, info.st_size
+
+    @staticmethod
+    def _cache_path(key: Tuple) -> Path:
+        digest = hashlib.sha1(key[2].encode("utf-8")).hexdigest()[:16]
+        return user_cache_dir() / "inventory" / f"yaml-{digest}.marshal"
+
+    def _read_cache(self, key: Tuple) -> Optional[DeviceTable]:
+        path = self._cache_path(key)
+        try:
+            if path.stat().st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                logger.warning("Ignoring YAML inventory cache readable by others: %s", path)
+                return None
+            stored_key, columns = marshal.loads(path.read_bytes())
+            if stored_key != key:
+                return None
+            table = DeviceTable.from_columns(columns)
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug("YAML inventory cache unusable: %s", e)
+            return None
+        logger.info(f"Loaded {len(table)} devices from cache for {key[2]}")
+        return table
+
+    def _write_cache(self, key: Tuple, table: DeviceTable) -> None:
+        path = self._cache_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, CACHE_MODE)
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump((key, table.columns()), f)
+            os.replace(tmp, path)
+        except (OSError, ValueError) as e:
+            logger.debug("Could not write YAML inventory cache %s: %s", path, e)
+            tmp.unlink(missing_ok=True)
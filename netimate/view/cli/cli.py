@@ -6,25 +6,36 @@ from netimate.interfaces.application.application import ApplicationInterface
 
 def run_cli_mode(app: ApplicationInterface, args, parser):
     """
-    One‑shot CLI execution. Returns the JSON‑serializable result.
+    One‑shot CLI execution. Prints each device's result as soon as it
+    completes; results are not accumulated, so memory stays flat on large runs.
     """
     # validate required parameters
     for param in ("device_names", "command"):
         if getattr(args, param) is None:
             parser.error(f"--{param.replace('_', '-')} is required in CLI mode.")
 
-    results = asyncio.run(
-        app.run_device_command(device_names=args.device_names, command_name=args.command)
-    )
+    try:
+        command = app.get_device_command(args.command)
+    except Exception:
+        command = None
 
-    for device, result in results.items():
-        print("---")
-        print(f"[{device}]")
+    async def _run():
         try:
-            command = app.get_device_command(args.command)
-            formatted_result = command.format_result(result)
-        except Exception:
-            formatted_result = str(result)
-        print(formatted_result)
+            async for device, result in app.stream_device_command(
+                device_names=args.device_names, command_name=args.command
+            ):
+                _print_result(command, device, result)
+        finally:
+            await app.close()
 
-    return results
+    asyncio.run(_run())
+
+
+def _print_result(command, device: str, result) -> None:
+    print("---")
+    print(f"[{device}]")
+    try:
+        formatted_result = command.format_result(result)
+    except Exception:
+        formatted_result = str(result)
+    print(formatted_result, flush=True)
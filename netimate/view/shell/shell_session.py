@@ -43,7 +43,14 @@ class _CommandCompleter(Completer):
             "exit",
         ]
         self.static_args = {
-            "list": ["devices", "device-repositories", "device-commands", "snapshots", "sites"],
+            "list": [
+                "devices",
+                "device-repositories",
+                "device-commands",
+                "snapshots",
+                "sites",
+                "circuit-breakers",
+            ],
             "log_level": ["off", "info", "debug"],
         }
 
@@ -99,6 +106,13 @@ class _CommandCompleter(Completer):
                 yield Completion(dev, display=f"{dev} [device]")
             return
 
+        # options after both snapshots
+        if (len(words) == 4 and before.endswith(" ")) or len(words) == 5:
+            prefix = "" if before.endswith(" ") else words[-1]
+            for opt in self._filter(["--hierarchical"], prefix):
+                yield Completion(opt)
+            return
+
         device = words[1]
         snaps = self.app.list_snapshots_for_device(device)
 
@@ -165,6 +179,9 @@ class netimateShellSession:
             The ApplicationInterface instance to route commands to.
         """
         self.app = app
+        # One event loop for the whole session so pooled device sessions,
+        # which are bound to the loop that opened them, survive between commands.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         # Welcome banner for tests and users
         print("Welcome to netimate Shell – type 'exit' to quit.")
         self.session: PromptSession = PromptSession(
@@ -195,8 +212,20 @@ class netimateShellSession:
         except Exception as exc:
             print(f"Fatal error in shell: {exc}")
         finally:
+            self._shutdown()
             print("Exiting netimate shell.")
 
+    def _shutdown(self):
+        """Release pooled sessions and close the session's event loop."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.run_until_complete(self.app.close())
+        except Exception:
+            pass
+        finally:
+            self._loop.close()
+
     # --------------------------------------------------------------------- #
     #                            Command routing                            #
     # --------------------------------------------------------------------- #
@@ -222,18 +251,43 @@ class netimateShellSession:
     # --------------------------------------------------------------------- #
     #                            Helper utils                               #
     # --------------------------------------------------------------------- #
+    def _run_coro(self, coro):
+        """Run *coro* to completion on the session's event loop."""
+        # If we’re already inside an asyncio loop (e.g. unit test), use anyio’s run‑in‑thread
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+        else:
+            return await_safe(lambda: coro)
+
     def _await(self, coro, desc: str):
         """Run *coro* and show ProgressPrinter while awaiting."""
         prog = ProgressPrinter(desc)
         prog.start()
         try:
-            # If we’re already inside an asyncio loop (e.g. unit test), use anyio’s run‑in‑thread
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                return asyncio.run(coro)
-            else:
-                return await_safe(lambda: coro)
+            return self._run_coro(coro)
+        finally:
+            prog.stop()
+
+    def _consume(self, stream, desc: str, handle: Callable[[Any], None]):
+        """Feed every item of async iterator *stream* to *handle* as it arrives.
+
+        The ProgressPrinter runs only until the first item so its dots do not
+        interleave with rendered results.
+        """
+        prog = ProgressPrinter(desc)
+        prog.start()
+
+        async def consume():
+            async for item in stream:
+                prog.stop()
+                handle(item)
+
+        try:
+            return self._run_coro(consume())
         finally:
             prog.stop()
 
@@ -274,12 +328,10 @@ class netimateShellSession:
             return
 
         print(f"Running '{command_name}' on {', '.join(device_names)}.")
-        results = self._await(
-            self.app.run_device_command(device_names, command_name),
-            f"Run '{command_name}'",
-        )
         cmd_plugin = self.app.get_device_command(command_name)
-        for dev, raw in results.items():
+
+        def render(item):
+            dev, raw = item
             try:
                 rendered = cmd_plugin.format_result(raw)
             except Exception:
@@ -293,6 +345,12 @@ class netimateShellSession:
                 Panel(rendered, title=f"[bold green]{dev}[/bold green]", border_style="green")
             )
 
+        self._consume(
+            self.app.stream_device_command(device_names, command_name),
+            f"Run '{command_name}'",
+            render,
+        )
+
     def _cmd_diagnostic(self, argv: List[str]):
         """Shell command: diagnostic <device...|site>."""
         if not argv:
@@ -300,12 +358,9 @@ class netimateShellSession:
             return
 
         print(f"Diagnostics on {', '.join(argv)}.")
-        results = self._await(
-            self.app.diagnostic(argv),
-            f"Diagnostics on {', '.join(argv)}",
-        )
 
-        for dev, outputs in results.items():
+        def render(item):
+            dev, outputs = item
             table = Table(show_header=True, header_style="bold cyan")
             table.add_column("Command")
             table.add_column("Summary", overflow="fold")
@@ -325,6 +380,12 @@ class netimateShellSession:
                 )
             )
 
+        self._consume(
+            self.app.stream_diagnostic(argv),
+            f"Diagnostics on {', '.join(argv)}",
+            render,
+        )
+
     def _cmd_log_level(self, argv: List[str]):
         """Shell command: log_level <off|info|debug>."""
         if len(argv) != 1:
@@ -338,14 +399,16 @@ class netimateShellSession:
             print(f"Error setting log level: {exc}")
 
     def _cmd_diff_snapshots(self, argv: List[Any]):
-        """Shell command: diff-snapshots <device> <s1> <s2>."""
+        """Shell command: diff-snapshots <device> <s1> <s2> [--hierarchical]."""
+        hierarchical = "--hierarchical" in argv
+        argv = [arg for arg in argv if arg != "--hierarchical"]
         if len(argv) != 3:
-            print("Usage: diff-snapshots <device> <snap1> <snap2>")
+            print("Usage: diff-snapshots <device> <snap1> <snap2> [--hierarchical]")
             return
         device, s1, s2 = argv
         s1 = int(s1) if s1.isdigit() else s1
         s2 = int(s2) if s2.isdigit() else s2
-        diff_text = self.app.diff_snapshots(device, s1, s2)
+        diff_text = self.app.diff_snapshots(device, s1, s2, hierarchical=hierarchical)
         if sys.stdout.isatty() and diff_text:
             # Build a Rich Text object with per‑line colours
             styled = Text()
@@ -368,7 +431,8 @@ class netimateShellSession:
         """Shell command: list <devices|device-commands|...>."""
         if not argv:
             print(
-                "Usage: list <devices [site] | device-repositories | device-commands | snapshots | sites>"
+                "Usage: list <devices [site] | device-repositories | device-commands | snapshots"
+                " | sites | circuit-breakers>"
             )
             return
         key = argv[0]
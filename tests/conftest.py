@@ -1,4 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
+from dataclasses import asdict
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,6 +11,13 @@ from netimate.interfaces.core.runner import RunnerInterface
 from netimate.interfaces.infrastructure.settings import SettingsInterface
 from netimate.interfaces.infrastructure.template_provider import TemplateProviderInterface
 from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep on-disk caches (template index etc.) out of the user's home."""
+    monkeypatch.setenv("NETIMATE_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
 
 
 @pytest.fixture
@@ -40,7 +48,7 @@ def temp_device_and_settings_files(tmp_path):
     devices[-1].protocol = "failing-async"
 
     temp_devices_path = tmp_path / "devices.yaml"
-    temp_devices_path.write_text(yaml.safe_dump({"devices": [d.__dict__ for d in devices]}))
+    temp_devices_path.write_text(yaml.safe_dump({"devices": [asdict(d) for d in devices]}))
 
     settings_yaml = tmp_path / "settings.yaml"
     settings_yaml.write_text(
@@ -73,6 +81,7 @@ def app_with_mock_command_repo_registry(temp_device_and_settings_files):
     # Mock repository
     mock_repo = MagicMock()
     mock_repo.list_devices.return_value = devices
+    mock_repo.list_device_table.return_value = DeviceTable.from_devices(devices)
     mock_repo.plugin_name = "dummy"
 
     # Mock registry
@@ -81,12 +90,14 @@ def app_with_mock_command_repo_registry(temp_device_and_settings_files):
     mock_registry.all_device_repositories.return_value = {mock_repo.plugin_name}
     mock_registry.get_device_command.return_value = mock_command
     mock_registry.get_device_repository.return_value = lambda _: mock_repo
-    mock_registry.get_protocol.return_value = lambda d: None
+    mock_registry.get_protocol.return_value = lambda device, config: None
 
     # Construct minimal Application with mocks
     settings = MagicMock()
     settings.device_repo = "yaml"
     settings.device_file = "devices.yaml"
+    settings.inventory_config = {}
+    settings.diagnostic_config = {}
 
     return Application(
         settings=settings,
@@ -112,6 +123,8 @@ def mock_settings():
     settings = MagicMock(spec=SettingsInterface)
     settings.device_repo = "fake_repo"
     settings.plugin_configs = {}
+    settings.inventory_config = {}
+    settings.diagnostic_config = {}
     return settings
 
 
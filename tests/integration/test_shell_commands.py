@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
 import datetime
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -38,7 +39,7 @@ def test_shell_list_commands_missing_key(temp_device_and_settings_files):
 
     assert (
         "Usage: list <devices [site] | device-repositories |"
-        " device-commands | snapshots | sites>"
+        " device-commands | snapshots | sites | circuit-breakers>"
     ) in result.stdout
 
 
@@ -135,11 +136,7 @@ def test_shell_snapshot_command(temp_device_and_settings_files):
 
     assert "Snapshot saved" in result.stdout or "Saved snapshot" in result.stdout
 
-    snapshot_path = Path("snapshots")
-    if snapshot_path.exists() and snapshot_path.is_dir():
-        for file in snapshot_path.iterdir():
-            file.unlink()
-        snapshot_path.rmdir()
+    shutil.rmtree("snapshots", ignore_errors=True)
 
 
 def test_shell_diagnostic_command(temp_device_and_settings_files):
@@ -232,7 +229,12 @@ def test_shell_diagnostic_prints_summary(capsys):
     from netimate.view.shell.shell_session import netimateShellSession
 
     app_mock = mock.Mock()
-    app_mock.diagnostic = mock.AsyncMock(return_value=fake_outputs)
+
+    async def stream_diagnostic(device_names):
+        for item in fake_outputs.items():
+            yield item
+
+    app_mock.stream_diagnostic = stream_diagnostic
     cmd_mock = mock.Mock()
     cmd_mock.label = "show-version"
     cmd_mock.summarise_result.return_value = "Test Summary"
@@ -283,10 +285,7 @@ def test_shell_diff_snapshots_command(temp_device_and_settings_files):
     assert "+ ip address 1.1.1.2" in stdout
 
     # Cleanup
-    if snapshots_path.exists() and snapshots_path.is_dir():
-        for file in snapshots_path.iterdir():
-            file.unlink()
-        snapshots_path.rmdir()
+    shutil.rmtree(snapshots_path, ignore_errors=True)
 
 
 def test_shell_run_command_on_site(temp_device_and_settings_files):
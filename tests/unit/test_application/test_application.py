@@ -1,14 +1,17 @@
 # SPDX-License-Identifier: MPL-2.0
 import os
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from netimate.application.application import Application
 from netimate.composition import composition_root
 from netimate.core.plugin_engine.plugin_registry import PluginRegistry
-from netimate.errors import RegistryError
+from netimate.errors import ConfigError, RegistryError
+from netimate.infrastructure.snapshot_store.content_store import ContentAddressedSnapshotStore
+from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.models.device import Device
 
 
 def test_list_usage(app_with_mock_command_repo_registry):
@@ -100,6 +103,77 @@ async def test_run_device_command_invalid_device(temp_device_and_settings_files)
             os.environ.pop("NETIMATE_CONFIG_PATH", None)
 
 
+def test_composition_root_reports_stages(temp_device_and_settings_files, monkeypatch):
+    _, _, settings_yaml = temp_device_and_settings_files
+    monkeypatch.setenv("NETIMATE_CONFIG_PATH", str(settings_yaml))
+    stages = []
+
+    composition_root(on_stage=stages.append)
+
+    assert stages == [
+        "config_loader",
+        "logging",
+        "register_device_commands",
+        "register_protocols",
+        "register_repositories",
+        "template_provider",
+        "runner_and_application",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_device_command_pushes_lookups_to_a_filtering_repository():
+    devices = [
+        Device("r1", "h1", "u", "p", "fake-async", "ios", "lab"),
+        Device("r2", "h2", "u", "p", "fake-async", "ios", "lab"),
+        Device("r3", "h3", "u", "p", "fake-async", "ios", "dc1"),
+    ]
+    lookups = []
+
+    class FilteringRepository(DeviceRepository):
+        def __init__(self, plugin_settings=None):
+            super().__init__(plugin_settings)
+
+        @staticmethod
+        def plugin_name() -> str:
+            return "filtering"
+
+        def list_devices(self):
+            raise AssertionError("full inventory loaded despite find_devices")
+
+        def find_devices(self, names=None, site=None):
+            lookups.append((names, site))
+            return [
+                d
+                for d in devices
+                if (names is None or d.name in names) and (site is None or d.site == site)
+            ]
+
+    registry = MagicMock()
+    registry.get_device_repository.return_value = FilteringRepository
+    runner = MagicMock()
+    runner.run = AsyncMock(
+        side_effect=lambda pairs, command: [
+            {"device": device.name, "result": "ok"} for device, _ in pairs
+        ]
+    )
+    app = Application(
+        settings=MagicMock(inventory_config={}, diagnostic_config={}, plugin_configs={}),
+        registry=registry,
+        runner=runner,
+        template_provider=MagicMock(),
+    )
+
+    result = await app.run_device_command(["r3", "lab"], "echo-test")
+
+    assert result == {"r3": "ok", "r1": "ok", "r2": "ok"}
+    assert lookups == [
+        (["r3", "lab"], None),  # which names are devices
+        (None, "lab"),  # the rest are sites
+        (["r3", "r1", "r2"], None),  # the selection itself
+    ]
+
+
 @pytest.mark.asyncio
 async def test_device_not_found(app_with_mock_command_repo_registry):
     """
@@ -116,7 +190,7 @@ async def test_bad_command():
     Test that running a nonexistent command raises a KeyError, even when device and repo are valid.
     """
     app = Application(
-        settings=MagicMock(),
+        settings=MagicMock(inventory_config={}, diagnostic_config={}),
         registry=PluginRegistry(),
         runner=MagicMock(),
         template_provider=MagicMock(),
@@ -147,6 +221,21 @@ def test_diff_snapshots(app_with_mock_command_repo_registry):
     assert "+++ R1_running_config_2.txt" in diff
 
 
+def test_diff_snapshots_hierarchical(app_with_mock_command_repo_registry, tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    app_with_mock_command_repo_registry._snapshots = store
+    store.put("R1", "interface Gig0/0\n ip address 1.1.1.1 255.255.255.0\n!", "20240101_120000")
+    store.put("R1", "interface Gig0/0\n ip address 1.1.1.2 255.255.255.0\n!", "20240101_130000")
+
+    diff = app_with_mock_command_repo_registry.diff_snapshots("R1", 1, 2, hierarchical=True)
+
+    assert diff.splitlines()[2:] == [
+        " interface Gig0/0",
+        "- ip address 1.1.1.1 255.255.255.0",
+        "+ ip address 1.1.1.2 255.255.255.0",
+    ]
+
+
 def test_expand_device_names_expands_sites(app_with_mock_command_repo_registry):
 
     expanded = app_with_mock_command_repo_registry.expand_device_names(["site1"])
@@ -157,3 +246,87 @@ def test_expand_device_names_expands_sites(app_with_mock_command_repo_registry):
 
     expanded = app_with_mock_command_repo_registry.expand_device_names(["site2", "r1"])
     assert sorted(expanded) == ["r1", "r2"]
+
+
+def test_list_circuit_breakers(app_with_mock_command_repo_registry):
+    runner = app_with_mock_command_repo_registry._runner
+    runner.circuit_breakers = MagicMock(return_value=[])
+    assert app_with_mock_command_repo_registry.list("circuit-breakers") == [
+        "[info] All circuit breakers closed."
+    ]
+
+    runner.circuit_breakers.return_value = [
+        {"key": "device:r1", "state": "open", "failures": 3, "retry_in": 42.0}
+    ]
+    assert app_with_mock_command_repo_registry.list("circuit-breakers") == [
+        "device:r1: open (3 consecutive failure(s), probe in 42s)"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_diagnostic_streams_configured_command_set(app_with_mock_command_repo_registry):
+    app = app_with_mock_command_repo_registry
+    app._settings.diagnostic_config = {"commands": ["echo-test"]}
+    seen = []
+
+    async def stream_many(device_protocols, commands):
+        seen.append(len(commands))
+        for device, _ in device_protocols:
+            yield {"device": device.name, "result": {"echo-test": device.name}}
+
+    app._runner.stream_many = stream_many
+
+    streamed = [item async for item in app.stream_diagnostic(["r2", "r1"])]
+    assert streamed == [("r2", {"echo-test": "r2"}), ("r1", {"echo-test": "r1"})]
+    assert await app.diagnostic(["r1", "r2"]) == {
+        "r1": {"echo-test": "r1"},
+        "r2": {"echo-test": "r2"},
+    }
+    assert seen == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_diagnostic_reports_errors_for_every_device(app_with_mock_command_repo_registry):
+    app = app_with_mock_command_repo_registry
+    app._settings.diagnostic_config = {"commands": ["echo-test"]}
+
+    result = await app.diagnostic(["r1", "missing"])
+
+    assert set(result) == {"r1", "missing"}
+    assert result["r1"]["echo-test"].startswith("[error] One or more device names not found")
+
+
+@pytest.mark.asyncio
+async def test_diagnostic_reports_unknown_commands_per_command(
+    app_with_mock_command_repo_registry,
+):
+    app = app_with_mock_command_repo_registry
+    app._settings.diagnostic_config = {"commands": ["no-such-cmd", "echo-test"]}
+    known = app._registry.get_device_command.return_value
+    app._registry.get_device_command.side_effect = lambda name: (
+        known if name == "echo-test" else PluginRegistry().get_device_command(name)
+    )
+    seen = []
+
+    async def stream_many(device_protocols, commands):
+        seen.append(len(commands))
+        for device, _ in device_protocols:
+            yield {"device": device.name, "result": {"echo-test": device.name}}
+
+    app._runner.stream_many = stream_many
+
+    result = await app.diagnostic(["r1"])
+
+    assert seen == [1]
+    assert list(result["r1"]) == ["no-such-cmd", "echo-test"]
+    assert result["r1"]["no-such-cmd"].startswith("[error]")
+    assert result["r1"]["echo-test"] == "r1"
+
+
+def test_diagnostic_commands_default_and_validation(app_with_mock_command_repo_registry):
+    app = app_with_mock_command_repo_registry
+    assert app.diagnostic_commands()[0] == "show-version"
+
+    app._settings.diagnostic_config = {"commands": "show-version"}
+    with pytest.raises(ConfigError):
+        app.diagnostic_commands()
@@ -4,6 +4,8 @@ from unittest.mock import MagicMock
 import pytest
 
 from netimate.application.command_executor_service import CommandExecutorService
+from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.models.device_table import DeviceTable
 
 
 @pytest.mark.asyncio
@@ -17,7 +19,9 @@ async def test_run_valid_command(
     devices, _, _ = temp_device_and_settings_files
     mock_command = MagicMock()
     mock_registry.get_device_repository.return_value = MagicMock(
-        return_value=MagicMock(list_devices=MagicMock(return_value=devices))
+        return_value=MagicMock(
+            list_device_table=MagicMock(return_value=DeviceTable.from_devices(devices))
+        )
     )
     mock_registry.get_device_command.return_value = MagicMock(return_value=mock_command)
     mock_runner.run.return_value = [
@@ -41,9 +45,106 @@ async def test_run_with_missing_device(
 ):
     devices, _, _ = temp_device_and_settings_files
     mock_registry.get_device_repository.return_value = MagicMock(
-        return_value=MagicMock(list_devices=MagicMock(return_value=devices))
+        return_value=MagicMock(
+            list_device_table=MagicMock(return_value=DeviceTable.from_devices(devices))
+        )
     )
     svc = CommandExecutorService(mock_registry, mock_settings, mock_template_provider, mock_runner)
 
     with pytest.raises(ValueError):
         await svc.run(["r1", "does-not-exist"], "some-command")
+
+
+@pytest.mark.asyncio
+async def test_run_many_uses_single_batch(
+    temp_device_and_settings_files,
+    mock_runner,
+    mock_registry,
+    mock_settings,
+    mock_template_provider,
+):
+    devices, _, _ = temp_device_and_settings_files
+    mock_registry.get_device_repository.return_value = MagicMock(
+        return_value=MagicMock(
+            list_device_table=MagicMock(return_value=DeviceTable.from_devices(devices))
+        )
+    )
+    mock_registry.get_device_command.return_value = MagicMock(return_value=MagicMock())
+    mock_runner.run_many.return_value = [
+        {"device": "r1", "result": {"cmd-a": "a", "cmd-b": "b"}},
+    ]
+
+    svc = CommandExecutorService(mock_registry, mock_settings, mock_template_provider, mock_runner)
+    result = await svc.run_many(["r1"], ["cmd-a", "cmd-b"])
+
+    assert result == {"r1": {"cmd-a": "a", "cmd-b": "b"}}
+    mock_runner.run_many.assert_awaited_once()
+    mock_runner.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_device_results(
+    temp_device_and_settings_files,
+    mock_registry,
+    mock_settings,
+    mock_template_provider,
+):
+    devices, _, _ = temp_device_and_settings_files
+    mock_registry.get_device_repository.return_value = MagicMock(
+        return_value=MagicMock(
+            list_device_table=MagicMock(return_value=DeviceTable.from_devices(devices))
+        )
+    )
+    mock_registry.get_device_command.return_value = MagicMock(return_value=MagicMock())
+
+    class StreamingRunner:
+        async def stream(self, device_protocols, command):
+            for device, _ in device_protocols:
+                yield {"device": device.name, "result": f"ok-{device.name}"}
+
+    svc = CommandExecutorService(
+        mock_registry, mock_settings, mock_template_provider, StreamingRunner()
+    )
+    results = [item async for item in svc.stream(["r1", "r2"], "some-command")]
+
+    assert results == [("r1", "ok-r1"), ("r2", "ok-r2")]
+
+
+@pytest.mark.asyncio
+async def test_run_looks_devices_up_at_a_filtering_repository(
+    temp_device_and_settings_files,
+    mock_runner,
+    mock_registry,
+    mock_settings,
+    mock_template_provider,
+):
+    devices, _, _ = temp_device_and_settings_files
+    lookups = []
+
+    class FilteringRepository(DeviceRepository):
+        def __init__(self, plugin_settings=None):
+            super().__init__(plugin_settings)
+
+        @staticmethod
+        def plugin_name() -> str:
+            return "filtering"
+
+        def list_devices(self):
+            raise AssertionError("full inventory loaded despite find_devices")
+
+        def find_devices(self, names=None, site=None):
+            lookups.append((names, site))
+            return [device for device in devices if device.name in names]
+
+    mock_registry.get_device_repository.return_value = FilteringRepository
+    mock_registry.get_device_command.return_value = MagicMock(return_value=MagicMock())
+    mock_runner.run.return_value = [{"device": "r2", "result": "ok"}]
+    svc = CommandExecutorService(mock_registry, mock_settings, mock_template_provider, mock_runner)
+
+    assert await svc.run(["r2", "r1"], "some-command") == {"r2": "ok"}
+    assert lookups == [(["r2", "r1"], None)]
+    device_protocols = mock_runner.run.await_args.args[0]
+    assert [device.name for device, _ in device_protocols] == ["r2", "r1"]
+
+    with pytest.raises(ValueError, match="missing"):
+        await svc.run(["r1", "missing"], "some-command")
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MPL-2.0
+from unittest.mock import MagicMock
+
+import pytest
+
+from netimate.application.inventory_service import InventoryService
+from netimate.errors import ConfigError
+from netimate.interfaces.plugin.async_device_repository import AsyncDeviceRepository
+from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+
+R1 = Device("r1", "10.0.0.1", "u", "p", "fake-async", "ios", "lab")
+R2 = Device("r2", "10.0.0.2", "u", "p", "fake-async", "ios", "lab")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock()
+    repo.list_device_table.return_value = DeviceTable.from_devices([R1, R2])
+    repo.change_token.return_value = 1
+    return repo
+
+
+@pytest.fixture
+def make_service(repo, mock_registry, mock_settings):
+    mock_registry.get_device_repository.return_value = MagicMock(return_value=repo)
+
+    def make(**kwargs):
+        return InventoryService(mock_registry, mock_settings, clock=kwargs.pop("clock"), **kwargs)
+
+    return make
+
+
+def test_devices_are_cached_while_token_unchanged(make_service, repo):
+    clock = FakeClock()
+    service = make_service(clock=clock, check_interval=1)
+
+    assert service.devices() == [R1, R2]
+    clock.now = 5
+    assert service.devices() == [R1, R2]
+
+    assert repo.list_device_table.call_count == 1
+
+
+def test_token_change_triggers_reload(make_service, repo):
+    clock = FakeClock()
+    service = make_service(clock=clock, check_interval=1)
+    service.devices()
+
+    repo.change_token.return_value = 2
+    repo.list_device_table.return_value = DeviceTable.from_devices([R1])
+    clock.now = 0.5
+    assert service.devices() == [R1, R2]  # within check_interval
+    clock.now = 1.5
+    assert service.devices() == [R1]
+
+
+def test_ttl_forces_reload_without_token(make_service, repo):
+    clock = FakeClock()
+    repo.change_token.return_value = None
+    service = make_service(clock=clock, ttl=10, check_interval=0)
+
+    service.devices()
+    clock.now = 9
+    service.devices()
+    assert repo.list_device_table.call_count == 1
+    clock.now = 10
+    service.devices()
+    assert repo.list_device_table.call_count == 2
+
+
+def test_invalidate_and_failing_token(make_service, repo):
+    service = make_service(clock=FakeClock(), check_interval=0)
+    service.devices()
+
+    repo.change_token.side_effect = RuntimeError("db down")
+    service.devices()
+    assert repo.list_device_table.call_count == 1
+
+    service.invalidate()
+    service.devices()
+    assert repo.list_device_table.call_count == 2
+
+
+def test_from_settings_validates(mock_registry, mock_settings):
+    mock_settings.inventory_config = {"ttl": 60}
+    service = InventoryService.from_settings(mock_registry, mock_settings)
+    assert service.ttl == 60 and service.check_interval == 2
+
+    mock_settings.inventory_config = {"check_interval": -1}
+    with pytest.raises(ConfigError):
+        InventoryService.from_settings(mock_registry, mock_settings)
+
+
+@pytest.mark.asyncio
+async def test_inventory_async_uses_threaded_adapter(make_service, repo):
+    clock = FakeClock()
+    service = make_service(clock=clock, check_interval=1)
+
+    inventory = await service.inventory_async()
+    assert inventory.names() == ["r1", "r2"]
+    clock.now = 0.5
+    assert await service.inventory_async() is inventory
+    assert repo.list_device_table.call_count == 1
+
+    repo.change_token.return_value = 2
+    clock.now = 2
+    await service.inventory_async()
+    assert repo.list_device_table.call_count == 2
+
+
+def test_sync_inventory_over_async_repository(mock_registry, mock_settings):
+    class AsyncRepo(AsyncDeviceRepository):
+        def __init__(self, plugin_settings=None):
+            super().__init__(plugin_settings)
+
+        @staticmethod
+        def plugin_name() -> str:
+            return "async-repo"
+
+        async def list_devices(self):
+            return [R1]
+
+    mock_registry.get_device_repository.return_value = AsyncRepo
+    service = InventoryService(mock_registry, mock_settings)
+
+    assert service.inventory().names() == ["r1"]
+    assert service.async_repository() is service.repository()
@@ -1,20 +1,46 @@
 # SPDX-License-Identifier: MPL-2.0
+from unittest.mock import MagicMock
+
 import pytest
 
 from netimate.application.snapshot_service import SnapshotService
+from netimate.infrastructure.snapshot_store.content_store import ContentAddressedSnapshotStore
 
 
-@pytest.mark.asyncio
-async def test_snapshot_saves_output(tmp_path, mock_runner):
-    class DummyCommand:
-        pass
+def _streaming_executor(results):
+    async def stream(device_names, command_name):
+        for device, output in results.items():
+            yield device, output
+
+    executor = MagicMock()
+    executor.stream = stream
+    return executor
 
-    mock_runner.run.return_value = {"r1": {"config_lines": ["line1", "line2"]}}
+
+@pytest.mark.asyncio
+async def test_snapshot_saves_output(tmp_path):
+    executor = _streaming_executor({"r1": {"config_lines": ["line1", "line2"]}})
     snapshot_dir = tmp_path / "snapshots"
-    snapshot_service = SnapshotService(mock_runner, snapshot_dir=snapshot_dir)
+    snapshot_service = SnapshotService(executor, snapshot_dir=snapshot_dir)
 
     result = await snapshot_service.snapshot(["r1"])
-    assert "r1" in result
-    files = list(snapshot_dir.glob("r1_running_config_*.txt"))
-    assert files
-    assert files[0].read_text() == "line1\nline2"
+
+    store = ContentAddressedSnapshotStore(snapshot_dir)
+    refs = store.snapshots("r1")
+    assert len(refs) == 1
+    assert result == {"r1": refs[0].name}
+    assert refs[0].name.startswith("r1_running_config_")
+    assert store.read("r1", refs[0].name) == "line1\nline2"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_writes_each_device_as_it_arrives(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    devices = {f"r{i}": {"config_lines": [f"hostname r{i}"]} for i in range(100)}
+
+    result = await SnapshotService(_streaming_executor(devices), store=store).snapshot(
+        list(devices)
+    )
+
+    assert set(result) == set(devices)
+    assert store.read("r42", result["r42"]) == "hostname r42"
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MPL-2.0
+import pytest
+
+from netimate.core.circuit_breaker import CircuitBreakerRegistry
+from netimate.errors import CircuitOpenError, ConfigError
+from netimate.models.device import Device
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _device(name="r1", site="lab"):
+    return Device(name, "10.0.0.1", "u", "p", "fake-async", "ios", site)
+
+
+def test_breaker_opens_after_consecutive_failures_and_probes_after_cooldown():
+    clock = FakeClock()
+    registry = CircuitBreakerRegistry(failure_threshold=2, cooldown=10, clock=clock)
+    device = _device()
+
+    for _ in range(2):
+        registry.check(device)
+        registry.record(device, "ConnectionTimeoutError")
+
+    with pytest.raises(CircuitOpenError, match="device:r1"):
+        registry.check(device)
+
+    clock.now = 11
+    registry.check(device)  # half-open probe
+    with pytest.raises(CircuitOpenError):
+        registry.check(device)  # only one probe at a time
+    registry.record(device, None)
+
+    registry.check(device)
+    assert registry.snapshot() == []
+
+
+def test_failed_probe_reopens_breaker():
+    clock = FakeClock()
+    registry = CircuitBreakerRegistry(failure_threshold=1, cooldown=5, clock=clock)
+    device = _device()
+    registry.record(device, "ConnectionProtocolError")
+
+    clock.now = 6
+    registry.check(device)
+    registry.record(device, "ConnectionProtocolError")
+
+    assert registry.snapshot()[0] == {
+        "key": "device:r1",
+        "state": "open",
+        "failures": 2,
+        "retry_in": 5.0,
+    }
+
+
+def test_non_transport_errors_do_not_trip():
+    registry = CircuitBreakerRegistry(failure_threshold=1)
+    device = _device()
+
+    registry.record(device, "AuthError")
+    registry.record(device, "CommandError")
+
+    registry.check(device)
+
+
+def test_site_breaker_skips_the_site_only_after_a_failed_probe():
+    registry = CircuitBreakerRegistry(failure_threshold=5, site_failure_threshold=2)
+    registry.record(_device("r1"), "ConnectionTimeoutError")
+    registry.record(_device("r2"), "ConnectionTimeoutError")
+
+    registry.check(_device("r3"))  # probe
+    registry.check(_device("r4"))  # the site keeps flowing while it probes
+    registry.record(_device("r4"), "ConnectionTimeoutError")  # not the probe
+    registry.check(_device("r5"))
+    registry.record(_device("r3"), "ConnectionTimeoutError")
+
+    with pytest.raises(CircuitOpenError, match="site:lab"):
+        registry.check(_device("r6"))
+    registry.check(_device("r7", site="dc1"))
+
+
+def test_site_breaker_closes_when_its_probe_succeeds():
+    registry = CircuitBreakerRegistry(failure_threshold=5, site_failure_threshold=2)
+    registry.record(_device("r1"), "ConnectionTimeoutError")
+    registry.record(_device("r2"), "ConnectionTimeoutError")
+
+    registry.check(_device("r3"))
+    registry.record(_device("r3"), None)
+
+    assert registry.snapshot() == [
+        {"key": "device:r1", "state": "closed", "failures": 1, "retry_in": 0.0},
+        {"key": "device:r2", "state": "closed", "failures": 1, "retry_in": 0.0},
+    ]
+
+
+def test_site_breakers_are_off_by_default():
+    registry = CircuitBreakerRegistry(failure_threshold=5)
+    for i in range(50):
+        registry.record(_device(f"r{i}"), "ConnectionTimeoutError")
+
+    registry.check(_device("r99"))
+
+
+def test_disabled_registry_never_trips():
+    registry = CircuitBreakerRegistry.from_config({"enabled": False, "failure_threshold": 1})
+    registry.record(_device(), "ConnectionTimeoutError")
+
+    registry.check(_device())
+
+
+@pytest.mark.parametrize(
+    "config", [{"failure_threshold": 0}, {"cooldown": -1}, {"site_failure_threshold": "x"}]
+)
+def test_breaker_config_validation(config):
+    with pytest.raises(ConfigError):
+        CircuitBreakerRegistry.from_config(config)
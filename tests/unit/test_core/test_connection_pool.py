@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: MPL-2.0
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from netimate.core.connection_pool import ConnectionPool
+from netimate.core.runner import Runner
+from netimate.errors import ConfigError, ConnectionProtocolError
+from netimate.interfaces.plugin.connection_protocol import ConnectionProtocol
+from netimate.models.device import Device
+
+
+class CountingProtocol(ConnectionProtocol):
+    connects = 0
+    disconnects = 0
+
+    def __init__(self, device: Device, plugin_settings: dict | None = None):
+        self.device = device
+        self.alive = True
+
+    @staticmethod
+    def plugin_name() -> str:
+        return "counting"
+
+    async def connect(self):
+        CountingProtocol.connects += 1
+
+    async def send_command(self, command: str) -> str:
+        if command == "boom":
+            raise ConnectionProtocolError("channel closed")
+        return command
+
+    async def disconnect(self):
+        CountingProtocol.disconnects += 1
+
+    async def is_alive(self) -> bool:
+        return self.alive
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountingProtocol.connects = 0
+    CountingProtocol.disconnects = 0
+
+
+def _device(name: str = "r1") -> Device:
+    return Device(
+        name=name, host="10.0.0.1", username="u", password="p", protocol="counting", platform="ios"
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_session_for_same_device():
+    pool = ConnectionPool()
+    device = _device()
+
+    first = await pool.acquire(device, CountingProtocol(device))
+    await pool.release(device, first)
+    second = await pool.acquire(device, CountingProtocol(device))
+
+    assert second is first
+    assert CountingProtocol.connects == 1
+    assert pool.stats()["in_use"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_unhealthy_and_expired_sessions():
+    pool = ConnectionPool(idle_ttl=60)
+    device = _device()
+
+    first = await pool.acquire(device, CountingProtocol(device))
+    first.alive = False
+    await pool.release(device, first)
+    second = await pool.acquire(device, CountingProtocol(device))
+    assert second is not first
+    assert CountingProtocol.disconnects == 1
+
+    await pool.release(device, second)
+    pool.idle_ttl = 0.0
+    third = await pool.acquire(device, CountingProtocol(device))
+    assert third is not second
+    assert CountingProtocol.connects == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_caps_open_sessions_and_can_be_disabled():
+    pool = ConnectionPool(max_sessions=1)
+    r1, r2 = _device("r1"), _device("r2")
+
+    s1 = await pool.acquire(r1, CountingProtocol(r1))
+    await pool.release(r1, s1)
+    s2 = await pool.acquire(r2, CountingProtocol(r2))
+    await pool.release(r2, s2)
+    assert pool.stats()["open"] == 1
+    assert CountingProtocol.disconnects == 1
+
+    disabled = ConnectionPool(enabled=False)
+    s3 = await disabled.acquire(r1, CountingProtocol(r1))
+    await disabled.release(r1, s3)
+    assert disabled.stats()["open"] == 0
+    assert CountingProtocol.disconnects == 2
+
+    with pytest.raises(ConfigError):
+        ConnectionPool.from_config({"idle_ttl": -1})
+
+
+@pytest.mark.asyncio
+async def test_pool_reaps_idle_sessions_in_the_background():
+    pool = ConnectionPool(idle_ttl=0.05)
+    device = _device()
+
+    await pool.release(device, await pool.acquire(device, CountingProtocol(device)))
+    await asyncio.sleep(0.15)
+
+    assert pool.stats()["open"] == 0
+    assert CountingProtocol.disconnects == 1
+
+    await pool.release(device, await pool.acquire(device, CountingProtocol(device)))
+    await pool.close()
+    assert pool._reaper is None
+    assert CountingProtocol.disconnects == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_waits_for_a_session_slot_when_all_are_in_use():
+    pool = ConnectionPool(max_sessions=1)
+    r1, r2 = _device("r1"), _device("r2")
+
+    s1 = await pool.acquire(r1, CountingProtocol(r1))
+    waiting = asyncio.ensure_future(pool.acquire(r2, CountingProtocol(r2)))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+    assert pool.stats()["open"] == 1
+
+    await pool.release(r1, s1)
+    s2 = await asyncio.wait_for(waiting, 1)
+
+    assert s2.device is r2
+    assert pool.stats() == {"open": 1, "idle": 0, "in_use": 1, "max_sessions": 1}
+    assert CountingProtocol.disconnects == 1
+    await pool.discard(r2, s2)
+
+
+@pytest.mark.asyncio
+async def test_pool_disconnects_when_cancelled_while_connecting():
+    pool = ConnectionPool()
+    device = _device()
+    protocol = CountingProtocol(device)
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    protocol.connect = hang
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pool.acquire(device, protocol), 0.05)
+
+    assert CountingProtocol.disconnects == 1
+    assert pool.stats()["open"] == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_reuses_pooled_session_and_discards_failed_one():
+    runner = Runner(plugin_configs={})
+    device = _device()
+    command = MagicMock()
+    command.command_string.return_value = "show clock"
+
+    await runner.run([(device, CountingProtocol(device))], command)
+    await runner.run([(device, CountingProtocol(device))], command)
+    assert CountingProtocol.connects == 1
+
+    command.command_string.return_value = "boom"
+    results = await runner.run([(device, CountingProtocol(device))], command)
+    assert results[0]["error_type"] == "ConnectionProtocolError"
+    assert CountingProtocol.disconnects == 1
+
+    await runner.close()
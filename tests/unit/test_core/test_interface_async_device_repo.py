@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MPL-2.0
+import asyncio
+import threading
+
+import pytest
+
+from netimate.interfaces.plugin.async_device_repository import (
+    AsyncDeviceRepository,
+    ThreadedDeviceRepository,
+)
+from netimate.interfaces.plugin.device_repository import DeviceRepository
+from netimate.models.device import Device
+
+DEVICES = [
+    Device("r1", "h1", "u", "p", "ssh", "ios", "lab"),
+    Device("r2", "h2", "u", "p", "ssh", "ios", "dc"),
+]
+
+
+class DummyAsyncDeviceRepo(AsyncDeviceRepository):
+    def __init__(self, plugin_settings=None):
+        super().__init__(plugin_settings)
+
+    @staticmethod
+    def plugin_name() -> str:
+        return "dummy-async"
+
+    async def list_devices(self):
+        return list(DEVICES)
+
+
+class BlockingRepo(DeviceRepository):
+    def __init__(self, plugin_settings=None):
+        super().__init__(plugin_settings)
+        self.threads = set()
+
+    @staticmethod
+    def plugin_name() -> str:
+        return "blocking"
+
+    def list_devices(self):
+        self.threads.add(threading.get_ident())
+        return list(DEVICES)
+
+
+@pytest.mark.asyncio
+async def test_async_device_repository_defaults():
+    repo = DummyAsyncDeviceRepo()
+
+    assert [d.name for d in await repo.get_devices(["r2", "nope"])] == ["r2"]
+    assert [d.name async for d in repo.iter_devices(site="lab")] == ["r1"]
+    assert len(await repo.list_device_table()) == 2
+    assert await repo.change_token() is None
+
+
+@pytest.mark.asyncio
+async def test_threaded_adapter_runs_sync_repository_off_the_loop():
+    sync_repo = BlockingRepo()
+    repo = ThreadedDeviceRepository(sync_repo)
+
+    assert [d.name for d in await repo.get_devices(["r1"])] == ["r1"]
+    assert [d.name async for d in repo.iter_devices(site="dc")] == ["r2"]
+    assert len(await repo.list_device_table()) == 2
+    assert threading.get_ident() not in sync_repo.threads
+
+
+@pytest.mark.asyncio
+async def test_threaded_adapter_lets_other_tasks_run():
+    ticks = []
+
+    class SlowRepo(BlockingRepo):
+        def list_devices(self):
+            threading.Event().wait(0.05)
+            return super().list_devices()
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0.005)
+
+    await asyncio.gather(ThreadedDeviceRepository(SlowRepo()).list_devices(), ticker())
+    assert len(ticks) == 3
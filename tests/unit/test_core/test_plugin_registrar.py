@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
+from netimate.core.plugin_engine.manifest import PluginManifest
 from netimate.core.plugin_engine.plugin_registry import PluginKind, PluginRegistry
 from netimate.core.plugin_engine.registrar import PluginRegistrar
+from netimate.interfaces.plugin.plugin import Plugin
+from tests.fakes.plugin_one import PluginOne
 
 
 class DummyCommand:
@@ -30,3 +33,36 @@ def test_registers_command(monkeypatch):
 
     assert "dummy-command" in registry.all_device_commands()
     assert registry.get_device_command("dummy-command") is DummyCommand
+
+
+def test_manifest_registers_lazily_and_skips_rescan(monkeypatch, tmp_path):
+    monkeypatch.delenv("NETIMATE_EXTRA_PLUGIN_PACKAGES", raising=False)
+    manifest_path = tmp_path / "manifest.json"
+
+    first = PluginRegistry()
+    PluginRegistrar(first, manifest_path).register_plugins(
+        PluginKind.DEVICE_COMMAND, "tests.fakes", Plugin
+    )
+    assert manifest_path.exists()
+    assert "plugin-one" in first.all_device_commands()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("manifest should have avoided a rescan")
+
+    monkeypatch.setattr("netimate.core.plugin_engine.registrar.PluginLoader", fail)
+    second = PluginRegistry()
+    PluginRegistrar(second, manifest_path).register_plugins(
+        PluginKind.DEVICE_COMMAND, "tests.fakes", Plugin
+    )
+    assert second.get_device_command("plugin-one") is PluginOne
+
+
+def test_manifest_is_invalidated_by_file_changes(monkeypatch, tmp_path):
+    monkeypatch.delenv("NETIMATE_EXTRA_PLUGIN_PACKAGES", raising=False)
+    manifest = PluginManifest(tmp_path / "manifest.json")
+    manifest.record("tests.fakes", Plugin, [("plugin-one", "tests.fakes.plugin_one", "PluginOne")])
+    assert manifest.lookup("tests.fakes", Plugin) is not None
+
+    fingerprint = manifest._entries["tests.fakes|netimate.interfaces.plugin.plugin.Plugin"]
+    fingerprint["files"]["plugin_one.py"][0] -= 1
+    assert manifest.lookup("tests.fakes", Plugin) is None
@@ -48,3 +48,31 @@ def test_missing_plugin_raises_registry_error():
 
     with pytest.raises(RegistryError, match="No repository plugin named 'dummy'"):
         registry.get_device_repository("dummy")
+
+
+def test_lazy_registration_loads_on_first_lookup():
+    registry = PluginRegistry()
+    loads = []
+
+    def load():
+        loads.append("dummy")
+        return DummyPlugin
+
+    registry.register_lazy(PluginKind.PROTOCOL, "dummy", load)
+    assert "dummy" in registry.all_protocols()
+    assert loads == []
+
+    assert registry.get_protocol("dummy") is DummyPlugin
+    assert registry.get_protocol("dummy") is DummyPlugin
+    assert loads == ["dummy"]
+
+
+def test_lazy_registration_failure_raises_registry_error():
+    registry = PluginRegistry()
+
+    def load():
+        raise ImportError("missing dependency")
+
+    registry.register_lazy(PluginKind.REPOSITORY, "broken", load)
+    with pytest.raises(RegistryError, match="could not be loaded: missing dependency"):
+        registry.get_device_repository("broken")
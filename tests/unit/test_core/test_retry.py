@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MPL-2.0
+import random
+
+import pytest
+
+from netimate.core.retry import RetryBudget, RetryPolicy
+from netimate.errors import AuthError, ConfigError, ConnectionProtocolError, ConnectionTimeoutError
+
+
+def test_retry_policy_defaults_never_retry():
+    assert RetryPolicy.from_config(None).delay(ConnectionTimeoutError("slow"), 1) is None
+
+
+def test_retry_policy_matches_most_specific_error_class():
+    policy = RetryPolicy.from_config({"attempts": 3})
+
+    assert policy.attempts_for(ConnectionTimeoutError("slow")) == 3
+    assert policy.attempts_for(ConnectionProtocolError("reset")) == 3
+    assert policy.attempts_for(AuthError("bad creds")) == 1
+    assert policy.attempts_for(ValueError("bug")) == 1
+
+
+def test_retry_policy_exponential_backoff_is_capped():
+    policy = RetryPolicy(
+        {"ConnectionProtocolError": 10}, backoff=1, multiplier=2, max_backoff=5, jitter="none"
+    )
+    err = ConnectionProtocolError("reset")
+
+    assert [policy.delay(err, attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.delay(err, 10) is None
+
+
+@pytest.mark.parametrize("jitter,low,high", [("full", 0, 4), ("equal", 2, 4)])
+def test_retry_policy_jitter_bounds(jitter, low, high):
+    policy = RetryPolicy(
+        {"ConnectionProtocolError": 5}, backoff=1, jitter=jitter, rng=random.Random(7)
+    )
+    delays = [policy.delay(ConnectionProtocolError("reset"), 3) for _ in range(50)]
+
+    assert all(low <= delay <= high for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"attempts": 0},
+        {"backoff": -1},
+        {"multiplier": 0.5},
+        {"jitter": "random"},
+        {"on": ["AuthError"]},
+        {"on": {"AuthError": "1"}},
+        ["attempts"],
+    ],
+)
+def test_retry_policy_config_validation(config):
+    with pytest.raises(ConfigError):
+        RetryPolicy.from_config(config)
+
+
+def test_retry_budget_allows_min_plus_ratio_of_started():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    for _ in range(4):
+        budget.start()
+
+    assert [budget.spend() for _ in range(4)] == [True, True, True, False]
+
+
+def test_retry_budget_config_validation():
+    with pytest.raises(ConfigError):
+        RetryBudget.from_config({"min_retries": -1})
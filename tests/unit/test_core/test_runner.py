@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from netimate.core.plugin_engine.plugin_registry import PluginRegistry
 from netimate.core.runner import Runner
+from netimate.errors import AuthError, ConnectionProtocolError, ConnectionTimeoutError
+from netimate.models.device import Device
+from tests.fakes.fake_async import FakeAsyncProtocol
 from tests.fakes.fake_async_error import FailingAsyncProtocol
 
 
@@ -54,3 +58,322 @@ async def test_runner_handles_device_error(temp_device_and_settings_files):
     assert result["result"] == "bad creds"
     assert result["error"] == "bad creds"
     assert result["error_type"] == "AuthError"
+
+
+@pytest.mark.asyncio
+async def test_runner_run_many_batches_commands_per_device(temp_device_and_settings_files):
+    devices, *_ = temp_device_and_settings_files
+    ok_device, failing_device = devices[0], devices[-1]
+
+    commands = []
+    for name in ("show-a", "show-b"):
+        command = MagicMock()
+        command.plugin_name.return_value = name
+        command.command_string.return_value = name
+        command.parse_async = AsyncMock(side_effect=lambda raw: {"raw": raw})
+        commands.append(command)
+
+    runner = Runner(plugin_configs={})
+    results = await runner.run_many(
+        [
+            (ok_device, FakeAsyncProtocol(ok_device)),
+            (failing_device, FailingAsyncProtocol(failing_device)),
+        ],
+        commands,
+    )
+
+    assert results[0]["success"] is True
+    assert results[0]["result"] == {"show-a": {"raw": "show-a"}, "show-b": {"raw": "show-b"}}
+    assert results[1]["success"] is False
+    assert results[1]["error_type"] == "AuthError"
+    assert results[1]["result"] == {"show-a": "bad creds", "show-b": "bad creds"}
+
+
+def _command(name):
+    command = MagicMock()
+    command.plugin_name.return_value = name
+    command.command_string.return_value = name
+    command.parse_async = AsyncMock(side_effect=lambda raw: {"raw": raw})
+    return command
+
+
+@pytest.mark.asyncio
+async def test_runner_command_timeout_discards_session(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(plugin_configs={}, runner_config={"timeouts": {"command": 0.05}})
+
+    results = await runner.run([(device, FakeAsyncProtocol(device))], _command("show-a"))
+
+    assert results[0]["success"] is False
+    assert results[0]["error_type"] == "ConnectionTimeoutError"
+    assert "timed out after 0.05s" in results[0]["error"]
+    assert runner._pool.open_sessions == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_connect_and_per_command_timeouts(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(
+        plugin_configs={},
+        runner_config={
+            "timeouts": {"connect": 0.01, "commands": {"show-b": {"connect": 1}}},
+        },
+    )
+
+    slow_connect = await runner.run([(device, FakeAsyncProtocol(device))], _command("show-a"))
+    assert slow_connect[0]["error"] == f"Connecting to {device.name} timed out after 0.01s"
+
+    overridden = await runner.run([(device, FakeAsyncProtocol(device))], _command("show-b"))
+    assert overridden[0]["success"] is True
+    await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_total_deadline_cancels_run_many(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(
+        plugin_configs={},
+        runner_config={"timeouts": {"platforms": {device.platform: {"total": 0.3}}}},
+    )
+
+    results = await runner.run_many(
+        [(device, FakeAsyncProtocol(device))], [_command("show-a"), _command("show-b")]
+    )
+
+    assert results[0]["error_type"] == "ConnectionTimeoutError"
+    assert results[0]["result"] == {
+        "show-a": f"{device.name} did not finish within 0.3s",
+        "show-b": f"{device.name} did not finish within 0.3s",
+    }
+    assert runner._pool.open_sessions == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_deadline_cancels_parses_in_flight(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(plugin_configs={}, runner_config={"timeouts": {"total": 0.1}})
+    protocol = _flaky_protocol()
+
+    async def send_command(command):
+        if command == "show-b":
+            await asyncio.sleep(10)  # the deadline passes while this is in flight
+        return command
+
+    protocol.send_command.side_effect = send_command
+    parse_cancelled = asyncio.Event()
+
+    async def slow_parse(raw):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            parse_cancelled.set()
+            raise
+
+    first = _command("show-a")
+    first.parse_async = slow_parse
+
+    results = await runner.run_many([(device, protocol)], [first, _command("show-b")])
+    await asyncio.sleep(0)
+
+    assert results[0]["error_type"] == "ConnectionTimeoutError"
+    assert parse_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_runner_transport_failure_after_parse_failure_trips_breaker(
+    temp_device_and_settings_files,
+):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(plugin_configs={}, runner_config={"circuit_breaker": {"failure_threshold": 5}})
+    protocol = _flaky_protocol()
+
+    async def send_command(command):
+        if command == "show-b":
+            raise ConnectionTimeoutError("no answer")
+        return command
+
+    protocol.send_command.side_effect = send_command
+    first = _command("show-a")
+    first.parse_async = AsyncMock(side_effect=ValueError("unparseable"))
+
+    results = await runner.run_many([(device, protocol)], [first, _command("show-b")])
+
+    assert results[0]["error_type"] == "ConnectionTimeoutError"
+    assert results[0]["result"] == {"show-a": "unparseable", "show-b": "no answer"}
+    assert runner.circuit_breakers()[0]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_runner_rejects_duplicate_commands(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(plugin_configs={})
+
+    with pytest.raises(ValueError, match="show-a"):
+        await runner.run_many([(device, _flaky_protocol())], [_command("show-a")] * 2)
+
+
+@pytest.mark.asyncio
+async def test_runner_run_many_uses_the_batch_command_limits(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(
+        plugin_configs={},
+        runner_config={
+            "timeouts": {
+                "connect": 0.05,
+                "total": 0.1,
+                "commands": {"show-b": {"connect": 1, "total": 1}},
+            }
+        },
+    )
+    protocol = _flaky_protocol()
+
+    async def slow(*args):
+        await asyncio.sleep(0.15)
+        return args[0] if args else None
+
+    protocol.connect.side_effect = slow
+    protocol.send_command.side_effect = slow
+
+    results = await runner.run_many([(device, protocol)], [_command("show-a"), _command("show-b")])
+
+    assert results[0]["success"] is True
+    assert results[0]["result"] == {"show-a": {"raw": "show-a"}, "show-b": {"raw": "show-b"}}
+    await runner.close()
+
+
+def _flaky_protocol(*connect_errors):
+    protocol = MagicMock()
+    protocol.plugin_name.return_value = "flaky"
+    errors = list(connect_errors)
+
+    async def connect():
+        if errors:
+            raise errors.pop(0)
+
+    protocol.connect = AsyncMock(side_effect=connect)
+    protocol.send_command = AsyncMock(side_effect=lambda command: command)
+    protocol.disconnect = AsyncMock()
+    protocol.is_alive = AsyncMock(return_value=True)
+    return protocol
+
+
+@pytest.mark.asyncio
+async def test_runner_retries_transient_failures(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    retry = {"attempts": 3, "backoff": 0.01, "jitter": "none"}
+    runner = Runner(plugin_configs={device.protocol: {"retry": retry}})
+    protocol = _flaky_protocol(ConnectionTimeoutError("slow"), ConnectionProtocolError("reset"))
+
+    results = await runner.run([(device, protocol)], _command("show-a"))
+
+    assert results[0]["success"] is True
+    assert results[0]["result"] == {"raw": "show-a"}
+    assert protocol.connect.await_count == 3
+    await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_does_not_retry_auth_errors(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(plugin_configs={device.protocol: {"retry": {"backoff": 0.01}}})
+    protocol = _flaky_protocol(AuthError("bad creds"))
+
+    results = await runner.run([(device, protocol)], _command("show-a"))
+
+    assert results[0]["error_type"] == "AuthError"
+    assert protocol.connect.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_runner_retry_budget_caps_retries(temp_device_and_settings_files):
+    devices = temp_device_and_settings_files[0]
+    runner = Runner(
+        plugin_configs={d.protocol: {"retry": {"backoff": 0.01}} for d in devices},
+        runner_config={"retry_budget": {"ratio": 0, "min_retries": 1}},
+    )
+    protocols = [_flaky_protocol(ConnectionProtocolError("reset")) for _ in devices]
+
+    results = await runner.run(list(zip(devices, protocols)), _command("show-a"))
+
+    assert sum(r["success"] for r in results) == 1
+    assert sum(p.connect.await_count for p in protocols) == len(devices) + 1
+    await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_run_many_resumes_after_retry(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(plugin_configs={device.protocol: {"retry": {"backoff": 0.01}}})
+    protocol = _flaky_protocol()
+    protocol.send_command.side_effect = ["a", ConnectionProtocolError("reset"), "b"]
+
+    results = await runner.run_many([(device, protocol)], [_command("show-a"), _command("show-b")])
+
+    assert results[0]["success"] is True
+    assert results[0]["result"] == {"show-a": {"raw": "a"}, "show-b": {"raw": "b"}}
+    assert protocol.connect.await_count == 2
+    await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_skips_device_with_open_circuit(temp_device_and_settings_files):
+    device = temp_device_and_settings_files[0][0]
+    runner = Runner(
+        plugin_configs={},
+        runner_config={"circuit_breaker": {"failure_threshold": 1, "cooldown": 60}},
+    )
+    first = _flaky_protocol(ConnectionTimeoutError("slow"))
+    second = _flaky_protocol()
+
+    await runner.run([(device, first)], _command("show-a"))
+    results = await runner.run_many([(device, second)], [_command("show-a"), _command("show-b")])
+
+    assert results[0]["error_type"] == "CircuitOpenError"
+    assert set(results[0]["result"]) == {"show-a", "show-b"}
+    second.connect.assert_not_awaited()
+    assert runner.circuit_breakers()[0]["key"] == f"device:{device.name}"
+
+
+@pytest.mark.asyncio
+async def test_runner_unreachable_devices_do_not_skip_healthy_site_peers():
+    def fan_out():
+        for i in range(225):
+            device = Device(f"r{i}", "10.0.0.1", "u", "p", "flaky", "ios", "lab")
+            errors = [ConnectionProtocolError("unreachable")] if i < 25 else []
+            yield device, _flaky_protocol(*errors)
+
+    runner = Runner(plugin_configs={}, runner_config={"max_concurrency": 50})
+    error_types = [
+        result["error_type"] for result in await runner.run(list(fan_out()), _command("a"))
+    ]
+
+    assert error_types == ["ConnectionProtocolError"] * 25 + [None] * 200
+
+    # An opted-in site breaker only skips once the probe after its threshold
+    # failed (one device at a time, so the probe is r20).
+    runner = Runner(
+        plugin_configs={},
+        runner_config={"max_concurrency": 1, "circuit_breaker": {"site_failure_threshold": 20}},
+    )
+    error_types = [
+        result["error_type"] for result in await runner.run(list(fan_out()), _command("a"))
+    ]
+
+    assert error_types[:21] == ["ConnectionProtocolError"] * 21
+    assert set(error_types[21:]) == {"CircuitOpenError"}
+    await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_stream_many_yields_per_device(temp_device_and_settings_files):
+    devices = temp_device_and_settings_files[0][:3]
+    runner = Runner(plugin_configs={})
+    pairs = [(device, _flaky_protocol()) for device in devices]
+
+    results = [r async for r in runner.stream_many(pairs, [_command("show-a"), _command("show-b")])]
+
+    assert {r["device"] for r in results} == {d.name for d in devices}
+    assert all(
+        r["result"] == {"show-a": {"raw": "show-a"}, "show-b": {"raw": "show-b"}} for r in results
+    )
+    await runner.close()
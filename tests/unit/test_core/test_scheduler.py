@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: MPL-2.0
+import asyncio
+
+import pytest
+
+from netimate.core import scheduler as scheduler_module
+from netimate.core.scheduler import Scheduler
+from netimate.errors import ConfigError
+from netimate.models.device import Device
+
+
+def _device(i: int, site: str = "s1", platform: str = "ios") -> Device:
+    return Device(
+        name=f"r{i}",
+        host=f"10.0.0.{i}",
+        username="u",
+        password="p",
+        protocol="fake-async",
+        platform=platform,
+        site=site,
+    )
+
+
+class _Tracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def work(self, device: Device, payload: int) -> int:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return payload * 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_respects_global_limit_and_keeps_order():
+    tracker = _Tracker()
+    scheduler = Scheduler(max_concurrency=3)
+
+    results = await scheduler.run([(_device(i), i) for i in range(10)], tracker.work)
+
+    assert results == [i * 2 for i in range(10)]
+    assert tracker.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_scheduler_respects_site_and_platform_limits():
+    site_tracker = _Tracker()
+    scheduler = Scheduler(max_concurrency=10, site_limits={"default": 2, "big": 5})
+    await scheduler.run([(_device(i, site="small"), i) for i in range(6)], site_tracker.work)
+    assert site_tracker.peak == 2
+
+    platform_tracker = _Tracker()
+    scheduler = Scheduler(max_concurrency=10, platform_limits={"nxos": 1})
+    await scheduler.run([(_device(i, platform="nxos"), i) for i in range(4)], platform_tracker.work)
+    assert platform_tracker.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_saturated_site_does_not_hold_global_slots():
+    tracker = _Tracker()
+    scheduler = Scheduler(max_concurrency=10, site_limits={"default": 2})
+    # Input grouped by site, so the head of the queue is always one saturated site.
+    jobs = [(_device(s * 20 + i, site=f"site{s}"), i) for s in range(5) for i in range(20)]
+
+    results = await scheduler.run(jobs, tracker.work)
+
+    assert results == [i * 2 for _ in range(5) for i in range(20)]
+    assert tracker.peak == 10
+
+
+@pytest.mark.asyncio
+async def test_scheduler_accepts_generators():
+    scheduler = Scheduler(max_concurrency=2)
+    results = await scheduler.run(((_device(i), i) for i in range(5)), _Tracker().work)
+    assert results == [0, 2, 4, 6, 8]
+
+
+def test_scheduler_from_config_validates_limits():
+    scheduler = Scheduler.from_config({"max_concurrency": 5, "site_limits": {"dc1": 2}})
+    assert scheduler.max_concurrency == 5
+    assert scheduler.site_limits == {"dc1": 2}
+
+    with pytest.raises(ConfigError):
+        Scheduler.from_config({"max_concurrency": 0})
+    with pytest.raises(ConfigError):
+        Scheduler.from_config({"platform_limits": {"ios": "many"}})
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stream_yields_in_completion_order():
+    async def work(device: Device, delay: float) -> str:
+        await asyncio.sleep(delay)
+        return device.name
+
+    scheduler = Scheduler(max_concurrency=3)
+    jobs = [(_device(1), 0.05), (_device(2), 0.0), (_device(3), 0.02)]
+
+    assert [name async for name in scheduler.stream(jobs, work)] == ["r2", "r3", "r1"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stream_cancels_remaining_work_on_early_exit():
+    started = []
+
+    async def work(device: Device, delay: float) -> str:
+        started.append(device.name)
+        await asyncio.sleep(delay)
+        return device.name
+
+    scheduler = Scheduler(max_concurrency=1)
+    stream = scheduler.stream([(_device(i), 0.0 if i == 0 else 10) for i in range(5)], work)
+    assert await stream.__anext__() == "r0"
+    await asyncio.wait_for(stream.aclose(), timeout=1)
+
+    assert len(started) <= 2
+
+
+@pytest.mark.asyncio
+async def test_blocked_jobs_are_only_rechecked_when_their_limit_frees(monkeypatch):
+    checks = 0
+    blocker = scheduler_module._KeyedLimiter.blocker
+
+    def counting_blocker(self, device):
+        nonlocal checks
+        checks += 1
+        return blocker(self, device)
+
+    monkeypatch.setattr(scheduler_module._KeyedLimiter, "blocker", counting_blocker)
+
+    async def work(device: Device, payload: int) -> int:
+        await asyncio.sleep(0)
+        return payload
+
+    async def checks_per_job(count: int) -> float:
+        nonlocal checks
+        checks = 0
+        # One site serialised behind a full look-ahead buffer of its own jobs.
+        scheduler = Scheduler(max_concurrency=10, site_limits={"default": 1})
+        jobs = [(_device(i, site="slow"), i) for i in range(count)]
+        assert await scheduler.run(jobs, work) == list(range(count))
+        return checks / count
+
+    small, large = await checks_per_job(100), await checks_per_job(400)
+
+    assert large <= 3
+    assert large <= small * 1.1
+
+
+@pytest.mark.asyncio
+async def test_jobs_blocked_on_site_then_platform_still_run():
+    running = {}
+    peaks = {}
+
+    async def work(device: Device, payload: int) -> int:
+        for key in (device.site, device.platform):
+            running[key] = running.get(key, 0) + 1
+            peaks[key] = max(peaks.get(key, 0), running[key])
+        await asyncio.sleep(0.001)
+        for key in (device.site, device.platform):
+            running[key] -= 1
+        return payload
+
+    scheduler = Scheduler(
+        max_concurrency=4, site_limits={"default": 2}, platform_limits={"nxos": 1}
+    )
+    jobs = [
+        (_device(i, site=f"site{i % 3}", platform="nxos" if i % 2 else "ios"), i) for i in range(30)
+    ]
+
+    assert await scheduler.run(jobs, work) == list(range(30))
+    assert peaks["nxos"] == 1
+    assert all(peaks[f"site{s}"] <= 2 for s in range(3))
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MPL-2.0
+import pytest
+
+from netimate.core.timeouts import TimeoutPolicy, Timeouts
+from netimate.errors import ConfigError
+
+
+def test_timeouts_layer_global_platform_command():
+    policy = TimeoutPolicy.from_config(
+        {
+            "connect": 10,
+            "command": 30,
+            "platforms": {"ios-xr": {"command": 60, "total": 120}},
+            "commands": {"show-running-config": {"command": 90}},
+        }
+    )
+
+    assert policy.resolve("ios") == Timeouts(connect=10, command=30)
+    assert policy.resolve("ios-xr") == Timeouts(connect=10, command=60, total=120)
+    assert policy.resolve("ios-xr", "show-running-config") == Timeouts(10, 90, 120)
+    assert policy.resolve(None, "show-version") == Timeouts(connect=10, command=30)
+
+
+def test_timeouts_default_to_unlimited():
+    assert TimeoutPolicy.from_config(None).resolve("ios", "show-version") == Timeouts()
+
+
+def test_timeouts_for_a_batch_take_the_most_lenient_limits():
+    policy = TimeoutPolicy.from_config(
+        {
+            "connect": 10,
+            "total": 60,
+            "commands": {"show-tech": {"connect": 20, "total": 600}, "show-log": {"total": None}},
+        }
+    )
+
+    assert policy.resolve_many("ios", ["show-version", "show-tech"]) == Timeouts(20, None, 600)
+    assert policy.resolve_many("ios", ["show-version", "show-log"]) == Timeouts(10, None, 60)
+    assert policy.resolve_many("ios", []) == policy.resolve("ios")
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"command": 0},
+        {"connect": "10"},
+        {"total": True},
+        {"comand": 5},
+        {"platforms": {"ios": 5}},
+        {"commands": ["show-version"]},
+    ],
+)
+def test_timeouts_config_validation(config):
+    with pytest.raises(ConfigError):
+        TimeoutPolicy.from_config(config)
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: MPL-2.0
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from netimate.infrastructure.template_provider.compiled_cache import CompiledTemplateCache
+from netimate.infrastructure.template_provider.filesystem import FileSystemTemplateProvider
+
+TEXTFSM = "Value TEST (.*)\n\nStart\n  ^${TEST}$$"
+
+
+def test_cache_reuses_compiled_template_until_mtime_changes():
+    cache = CompiledTemplateCache(maxsize=4)
+
+    first = cache.get(("a.textfsm", 1), ".textfsm", TEXTFSM)
+    assert cache.get(("a.textfsm", 1), ".textfsm", TEXTFSM) is first
+    assert cache.get(("a.textfsm", 2), ".textfsm", TEXTFSM) is not first
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CompiledTemplateCache(maxsize=2)
+    a = cache.get(("a.ttp", 1), ".ttp", "{{ TEST }}")
+    cache.get(("b.ttp", 1), ".ttp", "{{ TEST }}")
+    cache.get(("a.ttp", 1), ".ttp", "{{ TEST }}")
+    cache.get(("c.ttp", 1), ".ttp", "{{ TEST }}")
+
+    assert len(cache) == 2
+    assert cache.get(("a.ttp", 1), ".ttp", "{{ TEST }}") is a
+    assert cache.misses == 3
+
+
+def test_compiled_template_is_reset_between_parses():
+    compiled = CompiledTemplateCache().get(("a.textfsm", 1), ".textfsm", TEXTFSM)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(compiled.parse, [f"line{i}" for i in range(20)]))
+
+    assert results == [[{"TEST": f"line{i}"}] for i in range(20)]
+
+
+def test_provider_recompiles_edited_template(tmp_path):
+    template = tmp_path / "dummy.ttp"
+    template.write_text("{{ TEST }}")
+    provider = FileSystemTemplateProvider([str(tmp_path)], check_interval=0)
+    assert provider.parse("dummy.ttp", "Hello") == {"TEST": "Hello"}
+
+    template.write_text("{{ OTHER }}")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert provider.parse("dummy.ttp", "Hello") == {"OTHER": "Hello"}
@@ -1,8 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
+import asyncio
 
 import pytest
 
+from netimate.errors import ConfigError
 from netimate.infrastructure.template_provider.filesystem import FileSystemTemplateProvider
+from netimate.infrastructure.template_provider.parse_executor import ParseExecutor
 
 
 @pytest.fixture
@@ -60,3 +63,42 @@ def test_list_templates(template_provider):
     templates = list(template_provider.list_templates())
     assert "dummy.textfsm" in templates
     assert "dummy.ttp" in templates
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["process", "thread", "inline"])
+async def test_parse_async_uses_executor(tmp_path, mode):
+    (tmp_path / "dummy.textfsm").write_text("Value TEST (.*)\n\nStart\n  ^${TEST}$$")
+    executor = ParseExecutor(mode=mode, workers=1)
+    provider = FileSystemTemplateProvider([str(tmp_path)], executor)
+    try:
+        parsed = await provider.parse_async("dummy.textfsm", "HelloWorld")
+    finally:
+        provider.close()
+    assert parsed == [{"TEST": "HelloWorld"}]
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_batches_small_outputs(monkeypatch):
+    executor = ParseExecutor(mode="thread", workers=1, batch_size=3, batch_delay=10)
+    submitted = []
+    real_submit = executor._submit
+
+    async def spy(jobs):
+        submitted.append(len(jobs))
+        return await real_submit(jobs)
+
+    monkeypatch.setattr(executor, "_submit", spy)
+    results = await asyncio.gather(*(executor.parse(".txt", "", f"out{i}") for i in range(3)))
+    await executor.parse(".txt", "", "x" * executor.small_output_bytes)
+    executor.shutdown()
+
+    assert results == ["out0", "out1", "out2"]
+    assert submitted == [3, 1]
+
+
+def test_parse_executor_rejects_bad_config():
+    with pytest.raises(ConfigError):
+        ParseExecutor.from_config({"executor": "gpu"})
+    with pytest.raises(ConfigError):
+        ParseExecutor.from_config({"workers": 0})
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MPL-2.0
+import random
+
+from netimate.infrastructure.snapshot_store.delta import (
+    apply_delta,
+    compose,
+    make_delta,
+    unified_diff_lines,
+)
+from netimate.infrastructure.snapshot_store.diff import unified_diff
+
+
+def _mutate(lines, rng):
+    lines = list(lines)
+    for _ in range(rng.randint(1, 5)):
+        pos = rng.randrange(len(lines) + 1)
+        action = rng.choice(["insert", "delete", "change"])
+        if action == "insert" or not lines:
+            lines.insert(pos, f"new line {rng.random():.6f}")
+        elif action == "delete":
+            del lines[min(pos, len(lines) - 1)]
+        else:
+            lines[min(pos, len(lines) - 1)] = f"changed {rng.random():.6f}"
+    return lines
+
+
+def test_delta_round_trip_and_composition():
+    rng = random.Random(42)
+    base = [f"interface Gi0/{i}\n description port {i}" for i in range(60)]
+    versions = [base]
+    for _ in range(10):
+        versions.append(_mutate(versions[-1], rng))
+
+    deltas = [make_delta(a, b) for a, b in zip(versions, versions[1:])]
+    for (a, b), ops in zip(zip(versions, versions[1:]), deltas):
+        assert apply_delta(a, ops) == b
+
+    composed = deltas[0]
+    for ops in deltas[1:]:
+        composed = compose(composed, ops)
+    assert apply_delta(base, composed) == versions[-1]
+
+
+def test_unified_diff_from_delta_matches_full_diff():
+    old = ["hostname r1", "interface Gi0/0", " ip address 1.1.1.1 255.255.255.0", "!"] * 5
+    new = list(old)
+    new[2] = " ip address 1.1.1.2 255.255.255.0"
+    del new[9]
+    new.insert(15, "ntp server 10.0.0.1")
+
+    expected = unified_diff(old, new, "a", "b")
+
+    assert unified_diff_lines(old, make_delta(old, new), "a", "b") == expected
+
+
+def test_unified_diff_of_identical_versions_is_empty():
+    lines = ["a", "b"]
+    assert unified_diff_lines(lines, make_delta(lines, lines), "a", "b") == []
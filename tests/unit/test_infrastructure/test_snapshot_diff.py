@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MPL-2.0
+import random
+from difflib import unified_diff as difflib_unified_diff
+
+from netimate.infrastructure.snapshot_store import diff
+from netimate.infrastructure.snapshot_store.diff import (
+    diff_opcodes,
+    hierarchical_diff,
+    matching_pairs,
+    unified_diff,
+)
+
+
+def _lcs_length(a, b):
+    row = [0] * (len(b) + 1)
+    for x in a:
+        prev = 0
+        for j, y in enumerate(b):
+            prev, row[j + 1] = row[j + 1], prev + 1 if x == y else max(row[j + 1], row[j])
+    return row[-1]
+
+
+def _apply(a, b, codes):
+    out = []
+    for tag, i1, i2, j1, j2 in codes:
+        out.extend(a[i1:i2] if tag == "equal" else b[j1:j2])
+    return out
+
+
+def test_opcodes_rebuild_the_target_and_pairs_are_matching_lines():
+    rng = random.Random(7)
+    for _ in range(500):
+        alphabet = rng.randint(1, 8)
+        a = [rng.randrange(alphabet) for _ in range(rng.randint(0, 30))]
+        b = [rng.randrange(alphabet) for _ in range(rng.randint(0, 30))]
+
+        pairs = matching_pairs(a, b)
+
+        assert all(a[i] == b[j] for i, j in pairs)
+        assert all(i1 < i2 and j1 < j2 for (i1, j1), (i2, j2) in zip(pairs, pairs[1:]))
+        assert _apply(a, b, diff_opcodes(a, b)) == b
+
+
+def test_myers_finds_a_minimal_diff(monkeypatch):
+    monkeypatch.setattr(diff, "_MAX_PATIENCE_DEPTH", 0)  # Myers only
+    rng = random.Random(11)
+    for _ in range(300):
+        a = [rng.randrange(4) for _ in range(rng.randint(0, 25))]
+        b = [rng.randrange(4) for _ in range(rng.randint(0, 40))]
+
+        assert len(matching_pairs(a, b)) == _lcs_length(a, b)
+
+
+def test_cost_limit_still_produces_a_valid_diff(monkeypatch):
+    monkeypatch.setattr(diff, "MAX_COST", 1)
+    rng = random.Random(3)
+    for _ in range(300):
+        a = [rng.randrange(6) for _ in range(rng.randint(0, 40))]
+        b = [rng.randrange(6) for _ in range(rng.randint(0, 40))]
+
+        assert _apply(a, b, diff_opcodes(a, b)) == b
+
+
+def test_unified_diff_matches_difflib_on_config_edits():
+    old = [f"interface Gi0/{i}" if i % 3 == 0 else f" description port {i}" for i in range(300)]
+    new = list(old)
+    new[10] = " description uplink"
+    del new[100:104]
+    new.insert(250, " shutdown")
+
+    expected = list(difflib_unified_diff(old, new, fromfile="a", tofile="b", lineterm="", n=2))
+
+    assert unified_diff(old, new, "a", "b", n=2) == expected
+    assert unified_diff(old, old, "a", "b") == []
+
+
+def test_hierarchical_diff_shows_changes_under_their_sections():
+    old = [
+        "hostname r1",
+        "interface Gi0/1",
+        " description uplink",
+        " ip address 10.0.0.1 255.255.255.0",
+        "!",
+        "router bgp 65000",
+        " address-family ipv4",
+        "  neighbor 10.0.0.2 activate",
+        " exit-address-family",
+        "!",
+        "line vty 0 4",
+        " transport input ssh",
+    ]
+    new = list(old)
+    new[3] = " ip address 10.0.0.9 255.255.255.0"
+    new[7:7] = ["  neighbor 10.0.0.3 activate"]
+    new[-2:] = []
+
+    assert hierarchical_diff(old, new, "a", "b") == [
+        "--- a",
+        "+++ b",
+        " interface Gi0/1",
+        "- ip address 10.0.0.1 255.255.255.0",
+        "+ ip address 10.0.0.9 255.255.255.0",
+        " router bgp 65000",
+        "  address-family ipv4",
+        "+  neighbor 10.0.0.3 activate",
+        "-line vty 0 4",
+        "- transport input ssh",
+    ]
+    assert hierarchical_diff(old, old + ["!"], "a", "b") == []
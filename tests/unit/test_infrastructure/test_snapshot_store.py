@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: MPL-2.0
+from datetime import datetime
+
+import pytest
+
+from netimate.infrastructure.snapshot_store.content_store import ContentAddressedSnapshotStore
+
+
+def test_identical_configs_share_one_blob(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path / "snapshots")
+
+    first = store.put("r1", "hostname r1\n", "20240101_120000")
+    second = store.put("r1", "hostname r1\n", "20240101_130000")
+    store.put("r2", "hostname r2\n", "20240101_120000")
+
+    assert first.digest == second.digest
+    assert len(list((tmp_path / "snapshots" / "objects").rglob("*.gz"))) == 2
+    assert [ref.name for ref in store.snapshots("r1")] == [
+        "r1_running_config_20240101_120000",
+        "r1_running_config_20240101_130000",
+    ]
+    assert store.read("r1", second.name) == "hostname r1\n"
+
+
+def test_index_is_shared_between_instances(tmp_path):
+    writer = ContentAddressedSnapshotStore(tmp_path)
+    reader = ContentAddressedSnapshotStore(tmp_path)
+    assert reader.snapshots() == []
+
+    writer.put("r1", "a", "20240101_120000")
+
+    assert [ref.device for ref in reader.snapshots()] == ["r1"]
+
+
+def test_legacy_text_snapshots_are_listed_then_imported(tmp_path):
+    (tmp_path / "r1_running_config_20230101_000000.txt").write_text("old")
+    (tmp_path / "notes.txt").write_text("not a snapshot")
+    store = ContentAddressedSnapshotStore(tmp_path)
+
+    assert [ref.name for ref in store.snapshots("r1")] == ["r1_running_config_20230101_000000.txt"]
+    assert not store.catalogue.exists()
+
+    store.put("r1", "new", "20240101_000000")
+
+    names = [ref.name for ref in store.snapshots()]
+    assert names == ["r1_running_config_20230101_000000", "r1_running_config_20240101_000000"]
+    assert store.read("r1", names[0]) == "old"
+    assert store.read("r1", "r1_running_config_20230101_000000.txt") == "old"
+    assert store.read("r1", names[1]) == "new"
+
+
+def test_jsonl_index_is_imported_skipping_corrupt_lines(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    ref = store.put("r1", "a", "20240101_120000")
+    store.catalogue.close()
+    store.catalogue.path.unlink()
+    store.index_path.write_text(
+        '{"device":"r1","taken_at":"20240101_120000","digest":"%s","size":1}\n{not json\n'
+        % ref.digest
+    )
+
+    fresh = ContentAddressedSnapshotStore(tmp_path)
+
+    assert fresh.snapshots() == [ref]
+    assert fresh.read("r1", ref.name) == "a"
+
+
+def test_catalogue_answers_device_time_range_and_latest_queries(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    for hour in range(10, 15):
+        store.put_many({"r1": f"r1 {hour}", "r2": f"r2 {hour}"}, f"20240101_{hour}0000")
+
+    def stamps(refs):
+        return [(ref.device, ref.taken_at[9:11]) for ref in refs]
+
+    assert stamps(store.snapshots("r1", since="20240101_120000")) == [
+        ("r1", "12"),
+        ("r1", "13"),
+        ("r1", "14"),
+    ]
+    assert stamps(store.snapshots(until=datetime(2024, 1, 1, 10, 30))) == [
+        ("r1", "10"),
+        ("r2", "10"),
+    ]
+    assert stamps(store.snapshots("r2", latest=2)) == [("r2", "13"), ("r2", "14")]
+    assert len(store.snapshots()) == 10
+
+
+def test_latest_beyond_the_snapshot_count_returns_them_all(tmp_path):
+    for hour in range(10, 13):
+        (tmp_path / f"r1_running_config_20240101_{hour}0000.txt").write_text(str(hour))
+    store = ContentAddressedSnapshotStore(tmp_path)
+
+    assert len(store.snapshots("r1", latest=5)) == 3  # legacy files
+    store.put("r1", "new", "20240101_130000")
+    assert len(store.snapshots("r1", latest=5)) == 4  # catalogue
+
+
+def test_negative_latest_is_rejected(tmp_path):
+    (tmp_path / "r1_running_config_20240101_100000.txt").write_text("old")
+    store = ContentAddressedSnapshotStore(tmp_path)
+
+    with pytest.raises(ValueError):
+        store.snapshots("r1", latest=-1)  # legacy files
+    store.put("r1", "new", "20240101_110000")
+    with pytest.raises(ValueError):
+        store.snapshots("r1", latest=-1)  # catalogue
+
+
+def test_failed_legacy_import_is_retried(tmp_path, monkeypatch):
+    (tmp_path / "r1_running_config_20230101_000000.txt").write_text("old")
+    store = ContentAddressedSnapshotStore(tmp_path)
+
+    def unreadable(*args, **kwargs):
+        raise OSError("unreadable legacy snapshot")
+
+    monkeypatch.setattr(store, "_store", unreadable)
+    with pytest.raises(OSError):
+        store.put("r1", "new", "20240101_000000")
+    assert not store.catalogue.exists()
+    monkeypatch.undo()
+
+    fresh = ContentAddressedSnapshotStore(tmp_path)
+    fresh.put("r1", "new", "20240101_000000")
+
+    assert [ref.name for ref in fresh.snapshots("r1")] == [
+        "r1_running_config_20230101_000000",
+        "r1_running_config_20240101_000000",
+    ]
+    assert fresh.read("r1", "r1_running_config_20230101_000000") == "old"
+
+
+def test_failed_batch_is_not_catalogued(tmp_path, monkeypatch):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    store.put("r1", "a", "20240101_120000")
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_write_blob", broken)
+    with pytest.raises(OSError):
+        store.put_many({"r1": "b", "r2": "c"}, "20240101_130000")
+
+    assert [ref.taken_at for ref in store.snapshots()] == ["20240101_120000"]
+
+
+def test_missing_snapshot_raises(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        store.read("r1", "r1_running_config_nope")
+
+
+def test_changed_configs_are_stored_as_deltas_with_keyframes(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path, keyframe_interval=3)
+    config = [f"interface Gi0/{i}\n description port {i}\n!" for i in range(50)]
+    texts = []
+    for version in range(5):
+        config[version] = f"interface Gi0/{version}\n description changed {version}\n!"
+        texts.append("\n".join(config))
+        store.put("r1", texts[-1], f"20240101_12000{version}")
+
+    objects = tmp_path / "objects"
+    assert len(list(objects.rglob("*.delta.gz"))) == 3
+    assert len([p for p in objects.rglob("*.gz") if not p.name.endswith(".delta.gz")]) == 2
+
+    fresh = ContentAddressedSnapshotStore(tmp_path)
+    refs = fresh.snapshots("r1")
+    assert [fresh.read("r1", ref.name) for ref in refs] == texts
+
+
+def test_diff_is_rendered_from_deltas(tmp_path, monkeypatch):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    lines = [f"line {i}" for i in range(100)]
+    old = store.put("r1", "\n".join(lines), "20240101_120000")
+    lines[50] = "line fifty"
+    store.put("r1", "\n".join(lines), "20240101_130000")
+    lines.append("line 100")
+    new = store.put("r1", "\n".join(lines), "20240101_140000")
+
+    def no_full_diff(*args, **kwargs):
+        raise AssertionError("fell back to a full comparison")
+
+    monkeypatch.setattr(
+        "netimate.infrastructure.snapshot_store.content_store.unified_diff", no_full_diff
+    )
+    diff = store.diff("r1", old.name, new.name).splitlines()
+
+    assert diff[:2] == [f"--- {old.name}", f"+++ {new.name}"]
+    assert "-line 50" in diff and "+line fifty" in diff and "+line 100" in diff
+    assert store.diff("r1", new.name, new.name) == ""
+
+
+def test_diff_across_a_chain_hides_changes_that_were_reverted(tmp_path):
+    store = ContentAddressedSnapshotStore(tmp_path)
+    lines = [f"interface Gi0/{i}\n description port {i}\n!" for i in range(40)]
+    v1 = store.put("r1", "\n".join(lines), "20240101_120000")
+    lines[5] = "interface Gi0/5\n!"
+    store.put("r1", "\n".join(lines), "20240101_130000")
+    lines[5] = "interface Gi0/5\n description port 5\n!"
+    lines[30] = "interface Gi0/30\n description uplink\n!"
+    v3 = store.put("r1", "\n".join(lines), "20240101_140000")
+
+    diff = store.diff("r1", v1.name, v3.name).splitlines()
+
+    assert [line for line in diff[2:] if line[:1] in "+-"] == [
+        "- description port 30",
+        "+ description uplink",
+    ]
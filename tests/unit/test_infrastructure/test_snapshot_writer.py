@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MPL-2.0
+import asyncio
+import threading
+
+import pytest
+
+from netimate.infrastructure.snapshot_store.content_store import ContentAddressedSnapshotStore
+from netimate.infrastructure.snapshot_store.writer import SnapshotWriter
+
+
+class _RecordingStore(ContentAddressedSnapshotStore):
+    def __init__(self, root, gate=None, fail=False):
+        super().__init__(root)
+        self.batches = []
+        self.threads = set()
+        self._gate = gate
+        self._fail = fail
+
+    def put_many(self, snapshots, taken_at):
+        self.threads.add(threading.get_ident())
+        if self._gate is not None:
+            self._gate.wait()
+        if self._fail:
+            raise OSError("disk full")
+        self.batches.append(sorted(snapshots))
+        return super().put_many(snapshots, taken_at)
+
+
+@pytest.mark.asyncio
+async def test_writes_are_batched_off_the_event_loop(tmp_path):
+    gate = threading.Event()
+    store = _RecordingStore(tmp_path, gate=gate)
+
+    async with SnapshotWriter(store, "20240101_120000", batch_size=4, max_pending=8) as writer:
+        await writer.write("r0", "config 0")
+        await asyncio.sleep(0.01)  # r0 is now being written, alone
+        for i in range(1, 9):
+            await writer.write(f"r{i}", f"config {i}")
+        gate.set()
+
+    assert threading.get_ident() not in store.threads
+    assert [len(batch) for batch in store.batches] == [1, 4, 4]
+    assert writer.saved["r7"] == "r7_running_config_20240101_120000"
+    assert store.read("r7", writer.saved["r7"]) == "config 7"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure(tmp_path):
+    gate = threading.Event()
+    store = _RecordingStore(tmp_path, gate=gate)
+
+    async with SnapshotWriter(store, "20240101_120000", batch_size=1, max_pending=2) as writer:
+        for i in range(3):
+            await writer.write(f"r{i}", "x")
+        await asyncio.sleep(0.01)
+        blocked = asyncio.create_task(writer.write("r3", "x"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        gate.set()
+        await blocked
+
+    assert len(writer.saved) == 4
+
+
+@pytest.mark.asyncio
+async def test_write_failure_is_raised(tmp_path):
+    store = _RecordingStore(tmp_path, fail=True)
+
+    with pytest.raises(OSError, match="disk full"):
+        async with SnapshotWriter(store, "20240101_120000") as writer:
+            await writer.write("r1", "x")
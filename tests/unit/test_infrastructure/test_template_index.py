@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MPL-2.0
+import os
+
+from netimate.infrastructure.template_provider.filesystem import FileSystemTemplateProvider
+from netimate.infrastructure.template_provider.template_index import TemplateIndex
+from netimate.infrastructure.utils.file_management import user_cache_dir
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_resolves_in_search_root_order(tmp_path):
+    first, second = tmp_path / "first", tmp_path / "second"
+    (first / "ios").mkdir(parents=True)
+    (second / "ios").mkdir(parents=True)
+    (first / "ios" / "a.textfsm").write_text("first")
+    (second / "ios" / "a.textfsm").write_text("second")
+    (second / "ios" / "b.ttp").write_text("second")
+
+    index = TemplateIndex([first, second])
+
+    assert index.resolve("ios/a.textfsm")[0] == first / "ios" / "a.textfsm"
+    assert index.resolve("ios/b.ttp")[0] == second / "ios" / "b.ttp"
+    assert index.resolve("ios/missing.ttp") is None
+
+
+def test_index_rescans_only_when_a_directory_changes(tmp_path):
+    (tmp_path / "a.ttp").write_text("a")
+    index = TemplateIndex([tmp_path], check_interval=0)
+    index.resolve("a.ttp")
+    assert index.scans == 1
+
+    (tmp_path / "b.ttp").write_text("b")
+    _bump_mtime(tmp_path)
+    assert index.resolve("b.ttp")[0] == tmp_path / "b.ttp"
+    assert index.scans == 2
+
+
+def test_index_is_persisted_for_cold_starts(tmp_path):
+    root = tmp_path / "templates"
+    root.mkdir()
+    (root / "a.textfsm").write_text("a")
+    index_path = tmp_path / "cache" / "index.json"
+
+    assert TemplateIndex([root], index_path).scans == 1
+    warm = TemplateIndex([root], index_path)
+
+    assert warm.scans == 0
+    assert warm.resolve("a.textfsm")[0] == root / "a.textfsm"
+
+
+def test_provider_lists_and_finds_templates_via_index(tmp_path):
+    (tmp_path / "ios").mkdir()
+    (tmp_path / "ios" / "show.textfsm").write_text("Value A (.*)\n\nStart\n  ^${A}$$")
+    (tmp_path / "notes.txt").write_text("")
+    provider = FileSystemTemplateProvider([str(tmp_path)])
+
+    assert provider.list_templates() == ["show.textfsm"]
+    assert provider.exists("ios/show.textfsm")
+    assert provider.parse("ios/show.textfsm", "x") == [{"A": "x"}]
+
+
+def test_user_cache_dir_honours_override(monkeypatch, tmp_path):
+    monkeypatch.setenv("NETIMATE_CACHE_DIR", str(tmp_path))
+    assert user_cache_dir() == tmp_path
+
+    monkeypatch.delenv("NETIMATE_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert user_cache_dir() == tmp_path / "xdg" / "netimate"
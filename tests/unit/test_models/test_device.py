@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MPL-2.0
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from netimate.models.device import Device
+from netimate.models.device_table import DeviceTable
+from netimate.models.inventory import DeviceInventory
+
+
+def test_device_is_slotted_and_freezes():
+    device = Device("r1", "10.0.0.1", "u", "p", "ssh", "ios", "lab")
+    assert not hasattr(device, "__dict__")
+
+    frozen = device.freeze()
+    assert {frozen, device.freeze()} == {frozen}
+    with pytest.raises(FrozenInstanceError):
+        frozen.site = "dc"  # type: ignore[misc]
+    assert frozen.thaw() == device
+
+
+def test_device_table_interns_low_cardinality_columns():
+    records = [
+        {
+            "name": f"r{i}",
+            "host": f"10.0.0.{i}",
+            "username": "u",
+            "password": "p",
+            "protocol": "ssh",
+            "platform": "".join(["i", "o", "s"]),
+            "site": f"site{i % 2}",
+        }
+        for i in range(4)
+    ]
+    table = DeviceTable.from_records(records)
+
+    assert len(table) == 4
+    assert table.platform[0] is table.platform[3] is sys.intern("ios")
+    assert table.site[0] is table.site[2]
+    assert table.device(1) == Device("r1", "10.0.0.1", "u", "p", "ssh", "ios", "site1")
+    assert [d.name for d in table.to_devices()] == ["r0", "r1", "r2", "r3"]
+
+
+def test_device_table_rejects_unknown_fields():
+    with pytest.raises(TypeError):
+        DeviceTable.from_records([{"name": "r1", "hostname": "x"}])
+
+
+def test_inventory_from_table_materialises_lazily():
+    table = DeviceTable.from_rows(
+        [("r1", "h1", "u", "p", "ssh", "ios", "lab"), ("r2", "h2", "u", "p", "ssh", "nxos", None)]
+    )
+    inventory = DeviceInventory(table)
+
+    assert inventory.sites() == ["lab"]
+    assert inventory.names_with_platform("nxos") == ["r2"]
+    assert inventory.get("r1") is inventory.select(["r1"])[0]
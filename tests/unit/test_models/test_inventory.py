@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: MPL-2.0
+import pytest
+
+from netimate.models.device import Device
+from netimate.models.inventory import DeviceInventory
+
+
+def _device(name, site=None, platform="ios", protocol="ssh"):
+    return Device(name, f"{name}.lab", "u", "p", protocol, platform, site)
+
+
+@pytest.fixture
+def inventory():
+    return DeviceInventory(
+        [
+            _device("r1", "lab"),
+            _device("r2", "lab", platform="nxos"),
+            _device("r3", "dc", protocol="telnet"),
+            _device("r4"),
+            _device("r1", "dc"),  # duplicate name: first definition wins
+        ]
+    )
+
+
+def test_lookups(inventory):
+    assert len(inventory) == 4
+    assert inventory.names() == ["r1", "r2", "r3", "r4"]
+    assert "r3" in inventory and "nope" not in inventory
+    assert inventory.get("r1").site == "lab"
+    assert inventory.get("nope") is None
+    assert inventory.sites() == ["dc", "lab"]
+    assert inventory.platforms() == ["ios", "nxos"]
+    assert inventory.is_site("lab") and not inventory.is_site("r1")
+    assert inventory.names_in_site("lab") == ["r1", "r2"]
+    assert inventory.names_in_site("nope") == []
+    assert inventory.names_with_protocol("telnet") == ["r3"]
+
+
+def test_select_keeps_request_order_and_dedupes(inventory):
+    selected = inventory.select(["r3", "r1", "r3"])
+    assert [d.name for d in selected] == ["r3", "r1"]
+
+
+def test_select_reports_all_missing_names(inventory):
+    with pytest.raises(KeyError) as err:
+        inventory.select(["r1", "x", "y"])
+    assert err.value.args[0] == ["x", "y"]
+
+
+def test_filter_intersects_indexes(inventory):
+    assert [d.name for d in inventory.filter(site="lab", platform="ios")] == ["r1"]
+    assert [d.name for d in inventory.filter(platform="ios")] == ["r1", "r3", "r4"]
+    assert inventory.filter(site="lab", protocol="telnet") == []
+    assert len(inventory.filter()) == 4
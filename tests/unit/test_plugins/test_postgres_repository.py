@@ -1,8 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
 from unittest.mock import MagicMock, patch
 
+import psycopg2
+import pytest
+
 from netimate.models.device import Device
-from netimate.plugins.device_repositories.postgres import PostgresDeviceRepository
+from netimate.plugins.device_repositories.postgres import (
+    DEFAULT_QUERY,
+    PostgresDeviceRepository,
+    close_pools,
+)
 
 
 class FakeSettings:
@@ -15,27 +22,86 @@ class FakeSettings:
                 "password": "pass",
                 "host": "localhost",
                 "port": "5432",
+                "fetch_size": 2,
             }
         }
 
 
-def test_list_devices_returns_devices():
-    fake_rows = [
-        ("r1", "10.0.0.1", "admin", "adminpass", "ssh", "ios", "lab1"),
-        ("r2", "10.0.0.2", "admin", "adminpass", "ssh", "ios", "lab1"),
-    ]
+FAKE_ROWS = [
+    ("r1", "10.0.0.1", "admin", "adminpass", "ssh", "ios", "lab1"),
+    ("r2", "10.0.0.2", "admin", "adminpass", "ssh", "ios", "lab1"),
+    ("r3", "10.0.0.3", "admin", "adminpass", "ssh", "ios", "lab2"),
+]
+
+
+@pytest.fixture
+def mock_connect():
+    close_pools()
+    with patch("netimate.plugins.device_repositories.postgres.psycopg2.connect") as connect:
+        conn = MagicMock(closed=0)
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [FAKE_ROWS[:2], FAKE_ROWS[2:], []]
+        cursor.__enter__.return_value = cursor
+        conn.cursor.return_value = cursor
+        connect.return_value = conn
+        yield connect
+    close_pools()
+
+
+def test_list_devices_returns_devices(mock_connect):
+    repo = PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres"))
+    devices = repo.list_devices()
+
+    assert isinstance(devices, list)
+    assert all(isinstance(d, Device) for d in devices)
+    assert devices[0].name == "r1"
+    assert devices[1].host == "10.0.0.2"
+    assert len(devices) == 3
+
+    conn = mock_connect.return_value
+    conn.cursor.assert_called_with(name="netimate_devices")
+    conn.cursor.return_value.fetchmany.assert_called_with(2)
+    conn.cursor.return_value.close.assert_called_once()
+
+
+def test_connections_are_pooled(mock_connect):
+    repo = PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres"))
+    cursor = mock_connect.return_value.cursor.return_value
+    cursor.fetchone.return_value = ("2025-01-01", 3)
+
+    repo.list_devices()
+    assert repo.change_token() == ("2025-01-01", "3")
+    PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres")).change_token()
+
+    assert mock_connect.call_count == 1
+    assert cursor.__exit__.call_count == 2  # change-token cursors are closed
+
+
+def test_find_devices_pushes_filters_into_sql(mock_connect):
+    repo = PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres"))
+    cursor = mock_connect.return_value.cursor.return_value
+    cursor.fetchmany.side_effect = [FAKE_ROWS[:1], []]
+
+    devices = repo.find_devices(names=["r1"], site="lab1")
+
+    assert [d.name for d in devices] == ["r1"]
+    query, params = cursor.execute.call_args.args
+    assert "WHERE name = ANY(%s) AND site = %s" in query
+    assert params == [["r1"], "lab1"]
+
+
+def test_unfiltered_load_passes_no_parameters(mock_connect):
+    repo = PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres"))
+    cursor = mock_connect.return_value.cursor.return_value
+    cursor.fetchmany.side_effect = [FAKE_ROWS, []]
+
+    repo.list_devices()
+
+    assert cursor.execute.call_args.args == (DEFAULT_QUERY, None)
 
-    with patch("netimate.plugins.device_repositories.postgres.psycopg2.connect") as mock_connect:
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = fake_rows
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
 
-        repo = PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres"))
-        devices = repo.list_devices()
+def test_change_token_tolerates_database_errors(mock_connect):
+    mock_connect.side_effect = psycopg2.OperationalError("down")
+    repo = PostgresDeviceRepository(FakeSettings().plugin_configs.get("postgres"))
 
-        assert isinstance(devices, list)
-        assert all(isinstance(d, Device) for d in devices)
-        assert devices[0].name == "r1"
-        assert devices[1].host == "10.0.0.2"
+    assert repo.change_token() is None
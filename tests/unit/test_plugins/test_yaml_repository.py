@@ -1,7 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
+import os
+import stat
+from pathlib import Path
+
 import yaml
 
 from netimate.infrastructure.settings import SettingsImpl
+from netimate.plugins.device_repositories import yaml as yaml_repository
 from netimate.plugins.device_repositories.yaml import YamlDeviceRepository
 
 
@@ -20,3 +25,68 @@ def test_yaml_repository_list_devices(temp_device_and_settings_files):
     assert len(devices) == 5
     assert devices[0].name == "r1"
     assert devices[1].protocol == "fake-async"
+
+
+def test_yaml_repository_change_token(tmp_path):
+    device_file = tmp_path / "devices.yaml"
+    device_file.write_text("devices: []\n")
+    repo = YamlDeviceRepository({"device_file": str(device_file)})
+
+    token = repo.change_token()
+    assert token == repo.change_token()
+
+    device_file.write_text("devices: []\n# edited\n")
+    assert repo.change_token() != token
+
+
+def test_yaml_repository_uses_binary_cache(tmp_path, monkeypatch):
+    device_file = tmp_path / "devices.yaml"
+    device_file.write_text(
+        "devices:\n"
+        "  - {name: r1, host: h1, username: u, password: p, protocol: ssh, platform: ios}\n"
+    )
+    repo = YamlDeviceRepository({"device_file": str(device_file)})
+    assert [d.name for d in repo.list_devices()] == ["r1"]
+
+    # A second load must not parse YAML at all.
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a valid cache")
+
+    monkeypatch.setattr(yaml_repository.yaml, "load", fail)
+    devices = YamlDeviceRepository({"device_file": str(device_file)}).list_devices()
+    assert devices[0].platform == "ios" and devices[0].site is None
+
+    # Editing the file invalidates the cache.
+    monkeypatch.undo()
+    device_file.write_text(
+        "devices:\n"
+        "  - {name: r2, host: h2, username: u, password: p, protocol: ssh, platform: ios, site: x}\n"
+    )
+    assert [d.name for d in repo.list_devices()] == ["r2"]
+
+
+def test_yaml_repository_cache_can_be_disabled(tmp_path):
+    device_file = tmp_path / "devices.yaml"
+    device_file.write_text("devices: []\n")
+    repo = YamlDeviceRepository({"device_file": str(device_file), "cache": False})
+
+    assert repo.list_devices() == []
+    assert not (Path(os.environ["NETIMATE_CACHE_DIR"]) / "inventory").exists()
+
+
+def test_yaml_repository_cache_is_owner_only(tmp_path):
+    device_file = tmp_path / "devices.yaml"
+    device_file.write_text(
+        "devices:\n"
+        "  - {name: r1, host: h1, username: u, password: p, protocol: ssh, platform: ios}\n"
+    )
+    repo = YamlDeviceRepository({"device_file": str(device_file)})
+    repo.list_devices()
+    (cache,) = (Path(os.environ["NETIMATE_CACHE_DIR"]) / "inventory").glob("*.marshal")
+
+    assert stat.S_IMODE(cache.stat().st_mode) == 0o600
+
+    # A cache others can read (e.g. from an older version) is not trusted but replaced.
+    cache.chmod(0o644)
+    assert [d.name for d in repo.list_devices()] == ["r1"]
+    assert stat.S_IMODE(cache.stat().st_mode) == 0o600